@@ -0,0 +1,114 @@
+"""
+Compiled Configuration Module
+
+This module caches parsed JSON configuration files as binary snapshots, so
+that short-lived processes can skip JSON parsing at startup. A snapshot is
+written next to its source file as '<filename>.snapshot'. It holds the
+configuration serialized with marshal, behind a header with the hash of the
+source it was compiled from, so a snapshot is only used while the source
+content is unchanged.
+
+Global functions
+----------------
+snapshot_path(filename):
+    Return the path of the snapshot of a source file.
+load_compiled(filename):
+    Load a JSON file through its snapshot, compiling it when needed.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+
+# The marshal format may change between Python versions, so it is part of
+# the header: a snapshot written by another version is simply recompiled.
+_MAGIC = b'CFGSNAP' + bytes([marshal.version])
+_DIGEST_SIZE = 32
+_HEADER_SIZE = len(_MAGIC) + _DIGEST_SIZE
+
+def snapshot_path(filename):
+    """
+    Return the path of the snapshot of a source file.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the JSON configuration file.
+
+    Returns
+    -------
+    str
+        The path to its snapshot.
+    """
+    return filename + '.snapshot'
+
+def _read_snapshot(path, digest):
+    """Return the data of a snapshot matching digest, or None."""
+    try:
+        with open(path, 'rb') as snapshot_file:
+            content = snapshot_file.read()
+    except OSError:
+        return None
+    if content[:_HEADER_SIZE] != _MAGIC + digest:
+        return None
+    try:
+        return marshal.loads(memoryview(content)[_HEADER_SIZE:])
+    except (EOFError, ValueError, TypeError):  # Truncated or corrupt
+        return None
+
+def _write_snapshot(path, digest, data):
+    """Write a snapshot atomically, ignoring unwritable directories."""
+    directory = os.path.dirname(path) or '.'
+    try:
+        descriptor, temporary = tempfile.mkstemp(dir=directory,
+                                                 suffix='.tmp')
+    except OSError:
+        return False
+    try:
+        with os.fdopen(descriptor, 'wb') as snapshot_file:
+            snapshot_file.write(_MAGIC + digest)
+            marshal.dump(data, snapshot_file)
+        os.replace(temporary, path)  # Concurrent readers never see a partial file
+    except OSError:
+        os.unlink(temporary)
+        return False
+    return True
+
+def load_compiled(filename):
+    """
+    Load a JSON file through its snapshot, compiling it when needed.
+
+    The source file is always read and hashed, which is much cheaper than
+    parsing it. If the snapshot was compiled from the same content it is
+    loaded with marshal; otherwise the source is parsed with json and the
+    snapshot is rewritten. A snapshot that cannot be written, for example in
+    a read-only directory, is skipped silently.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the JSON configuration file.
+
+    Returns
+    -------
+    object
+        The parsed configuration, equal to what json.load returns.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the source file does not exist.
+    ValueError
+        If the source file does not hold valid JSON.
+    """
+    with open(filename, 'rb') as config_file:
+        source = config_file.read()
+    digest = hashlib.blake2b(source, digest_size=_DIGEST_SIZE).digest()
+    path = snapshot_path(filename)
+    data = _read_snapshot(path, digest)
+    if data is None:
+        data = json.loads(source)
+        _write_snapshot(path, digest, data)
+    return data
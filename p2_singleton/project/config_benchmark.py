@@ -0,0 +1,327 @@
+"""
+ConfigManager Benchmark Module
+
+This module benchmarks the ConfigManager singleton under contention. Many
+threads are released at the same moment and call ConfigManager() in a
+tight loop, while the creation lock of ConfigMeta is replaced by one that
+counts its acquisitions. Whatever the number of threads and calls, the lock
+is only taken while the first instance is being created, which shows that
+the fast path is lock-free.
+
+It also measures the startup cost of loading a configuration file with
+json.load against loading it through its compiled binary snapshot, and the
+memory used by worker processes parsing their own copy of a configuration
+against attaching to a shared one.
+
+Classes
+-------
+CountingLock:
+    A lock that counts how often it is acquired.
+
+Global functions
+----------------
+contention_benchmark(threads=16, calls=50_000):
+    Calls ConfigManager() from many threads at once and reports the
+    throughput, the number of instances and the lock acquisitions.
+startup_benchmark(sections=2_000, repeat=20):
+    Times loading a generated configuration file with json.load and
+    through its compiled snapshot.
+shared_memory_benchmark(workers=4, sections=20_000, reads=1_000):
+    Compares the proportional set size each worker process adds when it
+    parses the configuration itself and when it attaches to a shared one.
+
+Usage
+-----
+python config_benchmark.py [THREADS] [CALLS]
+    Runs the contention benchmark.
+python config_benchmark.py startup [SECTIONS]
+    Runs the startup benchmark.
+python config_benchmark.py shared [WORKERS]
+    Runs the shared memory benchmark.
+"""
+
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+from compiled_config import load_compiled, snapshot_path
+from configuration_manager import ConfigManager, ConfigMeta
+from shared_config import publish
+
+class CountingLock:
+    """
+    A lock that counts how often it is acquired.
+
+    Attributes
+    ----------
+    acquisitions : int
+        The number of times the lock was acquired.
+    """
+    def __init__(self):
+        """Initialize the wrapped lock and the counter."""
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+
+    def __enter__(self):
+        """Acquire the lock and count the acquisition."""
+        self._lock.acquire()
+        self.acquisitions += 1  # Safe, the lock is held
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the lock."""
+        self._lock.release()
+
+def contention_benchmark(threads=16, calls=50_000):
+    """
+    Call ConfigManager() from many threads at once.
+
+    The existing ConfigManager instance is set aside for the duration of
+    the benchmark, so the threads race to create a fresh one, and restored
+    afterwards.
+
+    Parameters
+    ----------
+    threads : int, optional
+        The number of threads calling ConfigManager().
+    calls : int, optional
+        The number of calls per thread.
+
+    Returns
+    -------
+    dict
+        'calls' (total), 'seconds', 'calls_per_second', 'instances' (the
+        number of distinct instances returned) and 'lock_acquisitions'.
+    """
+    barrier = threading.Barrier(threads + 1)
+    seen = [set() for _ in range(threads)]
+
+    def worker(found):
+        barrier.wait()
+        for _ in range(calls):
+            found.add(id(ConfigManager()))
+
+    saved_instance = ConfigMeta._instances.pop(ConfigManager, None)
+    saved_lock = ConfigMeta._creation_lock
+    ConfigMeta._creation_lock = counting_lock = CountingLock()
+    try:
+        workers = [threading.Thread(target=worker, args=(found,))
+                   for found in seen]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        seconds = time.perf_counter() - start
+    finally:
+        ConfigMeta._creation_lock = saved_lock
+        if saved_instance is not None:
+            ConfigMeta._instances[ConfigManager] = saved_instance
+        else:
+            ConfigMeta._instances.pop(ConfigManager, None)
+
+    return {
+        'calls': threads * calls,
+        'seconds': seconds,
+        'calls_per_second': threads * calls / seconds,
+        'instances': len(set().union(*seen)),
+        'lock_acquisitions': counting_lock.acquisitions,
+    }
+
+def _generate_config(sections):
+    """Return a configuration with 'sections' sections of mixed settings."""
+    return {f'service_{index}': {
+        'host': f'host-{index}.example.com', 'port': 8000 + index,
+        'enabled': index % 2 == 0, 'weight': index / 7,
+        'tags': ['alpha', 'beta', str(index)],
+        'limits': {'rps': index, 'burst': None},
+    } for index in range(sections)}
+
+def startup_benchmark(sections=2_000, repeat=20):
+    """
+    Time loading a configuration file with json.load and through its snapshot.
+
+    A file with 'sections' sections of mixed settings is generated in a
+    temporary directory. Its snapshot is compiled once, like a first start
+    would, and both loaders are then timed on the unchanged file. The best
+    of 'repeat' runs is kept for each.
+
+    Parameters
+    ----------
+    sections : int, optional
+        The number of sections of the generated file.
+    repeat : int, optional
+        The number of timed loads per loader.
+
+    Returns
+    -------
+    dict
+        'file_bytes', 'snapshot_bytes', 'json_seconds', 'compiled_seconds'
+        and 'speedup'.
+    """
+    document = _generate_config(sections)
+
+    def best_of(load):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def load_json():
+        with open(filename, 'r') as config_file:
+            return json.load(config_file)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'config.json')
+        with open(filename, 'w') as config_file:
+            json.dump(document, config_file)
+        load_compiled(filename)  # The first start compiles the snapshot
+        json_seconds = best_of(load_json)
+        compiled_seconds = best_of(lambda: load_compiled(filename))
+        file_bytes = os.path.getsize(filename)
+        snapshot_bytes = os.path.getsize(snapshot_path(filename))
+
+    return {
+        'file_bytes': file_bytes,
+        'snapshot_bytes': snapshot_bytes,
+        'json_seconds': json_seconds,
+        'compiled_seconds': compiled_seconds,
+        'speedup': json_seconds / compiled_seconds,
+    }
+
+def _proportional_memory():
+    """
+    Return the memory of this process, counting shared pages proportionally.
+
+    This is the proportional set size (PSS) of /proc/self/smaps_rollup: every
+    resident page counts in full when the process alone maps it, and divided
+    by the number of processes mapping it otherwise, so the PSS of all
+    processes adds up to the memory they really use. Where it is not
+    available, the peak resident set size is returned instead.
+
+    Returns
+    -------
+    int
+        The memory in bytes.
+    """
+    try:
+        with open('/proc/self/smaps_rollup') as rollup:
+            for line in rollup:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _worker_memory(filename, shared, paths, barrier, results):
+    """Load a configuration in a worker, report the memory it added."""
+    before = _proportional_memory()
+    manager = ConfigManager()
+    if shared:
+        manager.attach_shared_config(filename)
+    else:
+        manager.load_config(filename)
+    for path in paths:
+        manager.get_setting(path)
+    # Measure once every worker maps the configuration, and keep it mapped
+    # until all of them did, so shared pages are split between all workers.
+    barrier.wait()
+    results.put(_proportional_memory() - before)
+    barrier.wait()
+
+def shared_memory_benchmark(workers=4, sections=20_000, reads=1_000):
+    """
+    Compare the memory worker processes use for their configuration.
+
+    The configuration is written as JSON and published once. Each worker
+    process then either parses its own copy with load_config or attaches to
+    the published one with attach_shared_config, and reads 'reads' settings
+    spread over the configuration. Once all workers hold the configuration,
+    each reports how much its proportional set size grew, which counts the
+    pages of the mapping it touched divided by the number of workers
+    sharing them, see _proportional_memory.
+
+    Parameters
+    ----------
+    workers : int, optional
+        The number of worker processes.
+    sections : int, optional
+        The number of sections of the generated configuration.
+    reads : int, optional
+        The number of settings each worker reads.
+
+    Returns
+    -------
+    dict
+        'file_bytes' and 'shared_file_bytes', the sizes of the JSON and
+        published files, and 'parsed_bytes' and 'shared_bytes', the total
+        memory used by all workers in each mode.
+    """
+    document = _generate_config(sections)
+    step = max(sections // reads, 1)
+    paths = [[f'service_{index}', 'port']
+             for index in range(0, sections, step)]
+    context = multiprocessing.get_context('spawn')
+    totals = {}
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = {False: os.path.join(directory, 'config.json'),
+                     True: os.path.join(directory, 'config.shared')}
+        with open(filenames[False], 'w') as config_file:
+            json.dump(document, config_file)
+        publish(document, filenames[True])
+        del document
+        for shared, filename in filenames.items():
+            barrier = context.Barrier(workers)
+            results = context.Queue()
+            processes = [context.Process(target=_worker_memory,
+                                         args=(filename, shared, paths,
+                                               barrier, results))
+                         for _ in range(workers)]
+            for process in processes:
+                process.start()
+            totals[shared] = sum(results.get(timeout=300)
+                                 for _ in processes)
+            for process in processes:
+                process.join()
+        file_bytes = os.path.getsize(filenames[False])
+        shared_file_bytes = os.path.getsize(filenames[True])
+    return {
+        'file_bytes': file_bytes,
+        'shared_file_bytes': shared_file_bytes,
+        'parsed_bytes': totals[False],
+        'shared_bytes': totals[True],
+    }
+
+if __name__ == '__main__' and sys.argv[1:2] == ['shared']:
+    worker_count = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    result = shared_memory_benchmark(worker_count)
+    print(f"{worker_count} workers, {result['file_bytes']} byte configuration, "
+          f"{result['shared_file_bytes']} bytes published")
+    for mode in ('parsed', 'shared'):
+        allocated = result[f'{mode}_bytes']
+        print(f"{mode.capitalize():<7} {allocated:>12} bytes in total, "
+              f"{allocated / worker_count:>10.0f} per worker")
+elif __name__ == '__main__' and sys.argv[1:2] == ['startup']:
+    section_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    result = startup_benchmark(section_count)
+    print(f"{result['file_bytes']} byte file, "
+          f"{result['snapshot_bytes']} byte snapshot")
+    print(f"json.load:     {result['json_seconds'] * 1e3:.2f} ms")
+    print(f"load_compiled: {result['compiled_seconds'] * 1e3:.2f} ms "
+          f"({result['speedup']:.1f}x faster)")
+elif __name__ == '__main__':
+    thread_count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    call_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    result = contention_benchmark(thread_count, call_count)
+    print(f"{result['calls']} calls from {thread_count} threads in "
+          f"{result['seconds']:.3f} s ({result['calls_per_second']:.0f} calls/s)")
+    print(f"Distinct instances: {result['instances']}")
+    print(f"Creation lock acquisitions: {result['lock_acquisitions']}")
@@ -0,0 +1,171 @@
+"""
+Configuration Diff Module
+
+This module computes the structural difference between two configuration
+trees, so that a reload can tell what changed. Subtrees that are the same
+object in both trees, as deep_merge and the layers of ConfigManager leave
+them, are skipped without being walked.
+
+Classes
+-------
+ConfigChange:
+    One key path whose value was added, removed or changed.
+
+Global functions
+----------------
+diff(old, new):
+    Return the changes between two configuration trees.
+touches(changes, prefix):
+    Check whether changes affect a key path or anything below it.
+carry_cache(cache, changes):
+    Return the entries of a setting cache that changes did not affect.
+"""
+
+class _Missing:
+    """The value of a key path on the side where it does not exist."""
+    __slots__ = ()
+
+    def __repr__(self):
+        """Return a readable marker."""
+        return '<missing>'
+
+MISSING = _Missing()
+
+class ConfigChange:
+    """
+    One key path whose value was added, removed or changed.
+
+    Attributes
+    ----------
+    path : tuple
+        The key path.
+    old : object
+        The previous value, or MISSING if the path was added.
+    new : object
+        The new value, or MISSING if the path was removed.
+    """
+    __slots__ = ('path', 'old', 'new')
+
+    def __init__(self, path, old, new):
+        """Initialize the change of one key path."""
+        self.path = path
+        self.old = old
+        self.new = new
+
+    @property
+    def kind(self):
+        """Return 'added', 'removed' or 'changed'."""
+        if self.old is MISSING:
+            return 'added'
+        if self.new is MISSING:
+            return 'removed'
+        return 'changed'
+
+    def __eq__(self, other):
+        """Compare changes by path and values."""
+        if not isinstance(other, ConfigChange):
+            return NotImplemented
+        return (self.path, self.old, self.new) == (other.path, other.old,
+                                                   other.new)
+
+    def __repr__(self):
+        """Return the kind and path of the change."""
+        return f'ConfigChange({self.kind} {".".join(map(str, self.path))})'
+
+def diff(old, new):
+    """
+    Return the changes between two configuration trees.
+
+    Dictionaries are compared key by key, so a change deep in the tree is
+    reported at its own path. Any other values, lists included, are
+    compared as a whole, and must have the same type to be equal, so that
+    1, 1.0 and True differ.
+
+    Parameters
+    ----------
+    old : object
+        The previous tree.
+    new : object
+        The new tree.
+
+    Returns
+    -------
+    list of ConfigChange
+        The changes. Keys added to or removed from a dictionary come before
+        the changes nested below it.
+    """
+    changes = []
+    pending = [((), old, new)]
+    while pending:
+        path, old_value, new_value = pending.pop()
+        if old_value is new_value:
+            continue
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            nested = []
+            for key, value in old_value.items():
+                if key in new_value:
+                    nested.append((path + (key,), value, new_value[key]))
+                else:
+                    changes.append(ConfigChange(path + (key,), value, MISSING))
+            for key, value in new_value.items():
+                if key not in old_value:
+                    changes.append(ConfigChange(path + (key,), MISSING, value))
+            pending.extend(reversed(nested))
+        elif type(old_value) is not type(new_value) or old_value != new_value:
+            changes.append(ConfigChange(path, old_value, new_value))
+    return changes
+
+def touches(changes, prefix):
+    """
+    Check whether changes affect a key path or anything below it.
+
+    Parameters
+    ----------
+    changes : list of ConfigChange or None
+        The changes, or None when they are unknown.
+    prefix : tuple
+        The key path.
+
+    Returns
+    -------
+    bool
+        True if a change is at, above or below the path, or if the changes
+        are unknown.
+    """
+    if changes is None:
+        return True
+    return any(change.path[:len(prefix)] == prefix
+               or prefix[:len(change.path)] == change.path
+               for change in changes)
+
+def carry_cache(cache, changes):
+    """
+    Return the entries of a setting cache that changes did not affect.
+
+    A cached key path is dropped if a change is at or above it, since its
+    value changed, or below it, since its cached value is the old subtree.
+
+    Parameters
+    ----------
+    cache : dict
+        Values keyed by tuple of keys.
+    changes : list of ConfigChange or None
+        The changes, or None when they are unknown.
+
+    Returns
+    -------
+    dict
+        The surviving entries; empty if the changes are unknown.
+    """
+    if changes is None:
+        return {}
+    changed = {change.path for change in changes}
+    if () in changed:
+        return {}
+    # Includes the root path (), which holds every change
+    above_changes = {change.path[:length] for change in changes
+                     for length in range(len(change.path) + 1)}
+    return {path: value for path, value in cache.items()
+            if path not in above_changes
+            and not any(path[:length] in changed
+                        for length in range(1, len(path)))}
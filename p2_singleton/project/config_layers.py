@@ -0,0 +1,324 @@
+"""
+Configuration Layers Module
+
+This module provides the building blocks of layered configuration for
+ConfigManager: layers read from JSON files, plain dictionaries or
+environment variables, a deep merge that lets higher layers override lower
+ones, a flattening of the merged tree into one dictionary keyed by key
+path, and a read-only overlay that merges two trees without copying either.
+
+Classes
+-------
+ConfigLayer:
+    One named source of configuration data and its merged result.
+ConfigOverlay(Mapping):
+    A read-only view of overrides over a base tree.
+
+Global functions
+----------------
+file_signature(filename):
+    Return what identifies a version of a file.
+environment_variables(prefix, separator='__'):
+    Return a layer source reading settings from environment variables.
+deep_merge(base, override):
+    Merge two configuration trees, the override winning.
+flatten(data):
+    Map every key path of a configuration tree to its value.
+"""
+
+import json
+import os
+from collections.abc import Mapping
+
+def file_signature(filename):
+    """
+    Return what identifies a version of a file: inode, size and mtime.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file.
+
+    Returns
+    -------
+    tuple
+        A value that changes whenever the file is replaced or modified.
+    """
+    stat = os.stat(filename)
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+def environment_variables(prefix, separator='__'):
+    """
+    Return a layer source reading settings from environment variables.
+
+    A variable named '<prefix>DATABASE__HOST' sets ['database', 'host']. Keys
+    are lowercased, and values are parsed as JSON when possible, so ports
+    become ints, and kept as strings otherwise.
+
+    Parameters
+    ----------
+    prefix : str
+        The prefix of the variables to read, for example 'APP_'.
+    separator : str, optional
+        The separator between the keys of a path.
+
+    Returns
+    -------
+    callable
+        A function returning the settings as a nested dictionary.
+    """
+    def read_environment():
+        data = {}
+        for name, raw_value in os.environ.items():
+            if not name.startswith(prefix) or name == prefix:
+                continue
+            keys = name[len(prefix):].lower().split(separator)
+            try:
+                value = json.loads(raw_value)
+            except ValueError:
+                value = raw_value
+            node = data
+            for key in keys[:-1]:
+                child = node.get(key)
+                if not isinstance(child, dict):
+                    node[key] = child = {}
+                node = child
+            node[keys[-1]] = value
+        return data
+    return read_environment
+
+def deep_merge(base, override):
+    """
+    Merge two configuration trees, the override winning.
+
+    Dictionaries present in both trees are merged recursively; any other
+    value of the override replaces the base value. Neither tree is modified,
+    and subtrees only present in one of them are shared, not copied.
+
+    Parameters
+    ----------
+    base : dict
+        The lower-precedence tree.
+    override : dict
+        The higher-precedence tree.
+
+    Returns
+    -------
+    dict
+        The merged tree.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = deep_merge(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+def flatten(data, prefix=()):
+    """
+    Map every key path of a configuration tree to its value.
+
+    Paths of inner dictionaries are included too, so any path get_setting
+    can resolve is a key of the result.
+
+    Parameters
+    ----------
+    data : dict
+        The configuration tree.
+    prefix : tuple, optional
+        The path of 'data' itself within a larger tree.
+
+    Returns
+    -------
+    dict
+        Values keyed by tuple of keys.
+    """
+    flat = {}
+    for key, value in data.items():
+        path = prefix + (key,)
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+    return flat
+
+class ConfigLayer:
+    """
+    One named source of configuration data and its merged result.
+
+    Attributes
+    ----------
+    name : str
+        The name of the layer, for example 'defaults' or 'host'.
+    source : str, dict or callable
+        A JSON file path, a dictionary, or a function returning a dictionary.
+    data : dict or None
+        The data last read from the source.
+    merged : dict or None
+        This layer merged over all layers below it.
+
+    Methods
+    -------
+    read(self):
+        Read the source if it may have changed, without keeping the result.
+    apply(self, update):
+        Keep the result of read.
+    refresh(self):
+        Re-read the source if it may have changed.
+    """
+    __slots__ = ('name', 'source', 'data', 'merged', '_signature')
+
+    def __init__(self, name, source):
+        """Initialize the layer; its source is read on the first refresh."""
+        self.name = name
+        self.source = source
+        self.data = None
+        self.merged = None
+        self._signature = None
+
+    def read(self):
+        """
+        Read the source if it may have changed, without keeping the result.
+
+        Files are re-parsed only when their inode, size or modification time
+        changed. Functions are called every time and count as changed when
+        they return different data. Dictionaries are read once. The layer is
+        left as it is until the result is given to apply, so several layers
+        can be read first and only kept if all of them succeed.
+
+        Returns
+        -------
+        tuple or None
+            The update to give to apply, or None if the data is unchanged.
+
+        Raises
+        ------
+        FileNotFoundError
+            If a file source does not exist.
+        ValueError
+            If a file source does not hold valid JSON.
+        """
+        if isinstance(self.source, dict):
+            return (self.source, None) if self.data is None else None
+        if callable(self.source):
+            data = self.source()
+            return (data, None) if data != self.data else None
+        signature = file_signature(self.source)
+        if signature == self._signature:
+            return None
+        with open(self.source, 'r') as config_file:
+            return json.load(config_file), signature
+
+    def apply(self, update):
+        """
+        Keep the result of read.
+
+        Parameters
+        ----------
+        update : tuple
+            A result of read other than None.
+
+        Returns
+        -------
+        None
+        """
+        self.data, self._signature = update
+
+    def refresh(self):
+        """
+        Re-read the source if it may have changed, see read.
+
+        Returns
+        -------
+        bool
+            True if the data of the layer changed.
+
+        Raises
+        ------
+        FileNotFoundError
+            If a file source does not exist.
+        ValueError
+            If a file source does not hold valid JSON.
+        """
+        update = self.read()
+        if update is None:
+            return False
+        self.apply(update)
+        return True
+
+class ConfigOverlay(Mapping):
+    """
+    A read-only view of overrides over a base tree.
+
+    Unlike deep_merge, nothing is copied: a key found in the overrides wins,
+    any other key falls through to the base, and when both hold a mapping
+    for a key the result is an overlay of the two. Creating an overlay is
+    O(1) whatever the size of the base, which may be any mapping, including
+    lazy and shared ones.
+
+    Attributes
+    ----------
+    base : Mapping
+        The lower-precedence tree.
+    overrides : Mapping
+        The higher-precedence tree.
+
+    Methods
+    -------
+    to_dict(self):
+        Return the overlay merged into a dict.
+    """
+    __slots__ = ('base', 'overrides')
+
+    def __init__(self, base, overrides):
+        """Initialize the view of 'overrides' over 'base'."""
+        self.base = base
+        self.overrides = overrides
+
+    def __getitem__(self, key):
+        """Return the value of a key, from the overrides if present."""
+        try:
+            value = self.overrides[key]
+        except KeyError:
+            return self.base[key]
+        if isinstance(value, Mapping):
+            base_value = self.base.get(key)
+            if isinstance(base_value, Mapping):
+                return ConfigOverlay(base_value, value)
+        return value
+
+    def __iter__(self):
+        """Iterate over the keys of the overrides, then the other base keys."""
+        yield from self.overrides
+        for key in self.base:
+            if key not in self.overrides:
+                yield key
+
+    def __len__(self):
+        """Return the number of distinct keys."""
+        return len(self.overrides) + sum(1 for key in self.base
+                                         if key not in self.overrides)
+
+    def __contains__(self, key):
+        """Check for a key without reading its value."""
+        return key in self.overrides or key in self.base
+
+    def __repr__(self):
+        """Return a summary that does not read any value."""
+        return f'ConfigOverlay({len(self.overrides)} overridden keys)'
+
+    def to_dict(self):
+        """
+        Return the overlay merged into a dict.
+
+        Like deep_merge, only the overridden path is copied: values of the
+        base that are not overridden are shared with it, not copied.
+
+        Returns
+        -------
+        dict
+            The merged tree, nested overlays merged as well.
+        """
+        return {key: value.to_dict() if isinstance(value, ConfigOverlay)
+                else value for key, value in self.items()}
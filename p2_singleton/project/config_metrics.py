@@ -0,0 +1,226 @@
+"""
+Configuration Metrics Module
+
+This module records how the configuration is used: how often each key
+path is read, how long lookups take, and how long loading and parsing
+files takes. ConfigManager.enable_metrics installs the recording; while
+metrics are disabled nothing of this module runs.
+
+Recorded metrics can be exported as JSON or in the Prometheus text
+exposition format.
+
+Classes
+-------
+ConfigMetrics:
+    Read counts per key path, lookup latency histograms and load durations.
+
+Global functions
+----------------
+None
+"""
+
+import bisect
+import json
+import threading
+from collections import Counter
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 1e-4,
+                   1e-3, float('inf'))
+
+def _escape(value):
+    """Escape a Prometheus label value."""
+    return (str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+def _bound(bound):
+    """Format a bucket bound like Prometheus clients do."""
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+class ConfigMetrics:
+    """
+    Read counts per key path, lookup latency histograms and load durations.
+
+    All recording methods are thread-safe.
+
+    Attributes
+    ----------
+    reads : collections.Counter
+        The number of reads of each key path, keyed by tuple of keys.
+
+    Methods
+    -------
+    record_read(self, operation, paths, seconds):
+        Record one lookup of one or more key paths.
+    record_load(self, filename, seconds, size):
+        Record one load of a configuration file.
+    hot_keys(self, count=10):
+        Return the most read key paths.
+    snapshot(self):
+        Return all metrics as a JSON-compatible dict.
+    to_json(self):
+        Return all metrics as JSON.
+    to_prometheus(self):
+        Return all metrics in the Prometheus text exposition format.
+    """
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self.reads = Counter()
+        self._latency = {}  # Operation -> [bucket counts, count, sum]
+        self._loads = {}  # Filename -> [count, total seconds, last size]
+
+    def record_read(self, operation, paths, seconds):
+        """
+        Record one lookup of one or more key paths.
+
+        Parameters
+        ----------
+        operation : str
+            The lookup method, for example 'get_setting'.
+        paths : iterable of tuple
+            The key paths read.
+        seconds : float
+            The duration of the lookup.
+
+        Returns
+        -------
+        None
+        """
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            self.reads.update(paths)
+            latency = self._latency.get(operation)
+            if latency is None:
+                self._latency[operation] = latency = [
+                    [0] * len(LATENCY_BUCKETS), 0, 0.0]
+            latency[0][bucket] += 1
+            latency[1] += 1
+            latency[2] += seconds
+
+    def record_load(self, filename, seconds, size):
+        """
+        Record one load of a configuration file.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file.
+        seconds : float
+            The time taken to read and parse the file.
+        size : int or None
+            The size of the file in bytes, if known.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            load = self._loads.setdefault(filename, [0, 0.0, None])
+            load[0] += 1
+            load[1] += seconds
+            load[2] = size
+
+    def hot_keys(self, count=10):
+        """
+        Return the most read key paths.
+
+        Parameters
+        ----------
+        count : int, optional
+            The number of key paths to return.
+
+        Returns
+        -------
+        list of tuple
+            (key path, reads), the most read first.
+        """
+        with self._lock:
+            return self.reads.most_common(count)
+
+    def snapshot(self):
+        """
+        Return all metrics as a JSON-compatible dict.
+
+        Returns
+        -------
+        dict
+            'reads' (reads per dotted key path), 'latency' (per operation:
+            bucket bounds and counts, count and sum in seconds) and 'loads'
+            (per file: count, total seconds and last size in bytes).
+        """
+        with self._lock:
+            return {
+                'reads': {'.'.join(map(str, path)): reads
+                          for path, reads in self.reads.most_common()},
+                'latency': {operation: {
+                    'buckets': [[_bound(bound), bucket_count] for bound,
+                                bucket_count in zip(LATENCY_BUCKETS, buckets)],
+                    'count': lookups, 'sum': total,
+                } for operation, (buckets, lookups, total)
+                    in self._latency.items()},
+                'loads': {filename: {'count': loads, 'seconds': total,
+                                     'bytes': size}
+                          for filename, (loads, total, size)
+                          in self._loads.items()},
+            }
+
+    def to_json(self):
+        """
+        Return all metrics as JSON.
+
+        Returns
+        -------
+        str
+            The JSON form of snapshot().
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """
+        Return all metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            The metrics config_reads_total, config_lookup_seconds (a
+            histogram), config_loads_total, config_load_seconds_total and
+            config_file_bytes.
+        """
+        snapshot = self.snapshot()
+        lines = ['# HELP config_reads_total Reads of a configuration key path.',
+                 '# TYPE config_reads_total counter']
+        lines += [f'config_reads_total{{path="{_escape(path)}"}} {reads}'
+                  for path, reads in snapshot['reads'].items()]
+
+        lines += ['# HELP config_lookup_seconds Duration of setting lookups.',
+                  '# TYPE config_lookup_seconds histogram']
+        for operation, latency in snapshot['latency'].items():
+            label = f'operation="{_escape(operation)}"'
+            cumulative = 0
+            for bound, bucket_count in latency['buckets']:
+                cumulative += bucket_count
+                lines.append(f'config_lookup_seconds_bucket{{{label},'
+                             f'le="{bound}"}} {cumulative}')
+            lines.append(f'config_lookup_seconds_sum{{{label}}} '
+                         f'{latency["sum"]!r}')
+            lines.append(f'config_lookup_seconds_count{{{label}}} '
+                         f'{latency["count"]}')
+
+        loads = snapshot['loads'].items()
+        lines += ['# HELP config_loads_total Loads of a configuration file.',
+                  '# TYPE config_loads_total counter']
+        lines += [f'config_loads_total{{file="{_escape(filename)}"}} '
+                  f'{load["count"]}' for filename, load in loads]
+        lines += ['# HELP config_load_seconds_total Time spent loading a '
+                  'configuration file.',
+                  '# TYPE config_load_seconds_total counter']
+        lines += [f'config_load_seconds_total{{file="{_escape(filename)}"}} '
+                  f'{load["seconds"]!r}' for filename, load in loads]
+        lines += ['# HELP config_file_bytes Size of a configuration file at '
+                  'its last load.',
+                  '# TYPE config_file_bytes gauge']
+        lines += [f'config_file_bytes{{file="{_escape(filename)}"}} '
+                  f'{load["bytes"]}' for filename, load in loads
+                  if load['bytes'] is not None]
+        return '\n'.join(lines) + '\n'
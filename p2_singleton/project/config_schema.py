@@ -0,0 +1,259 @@
+"""
+Configuration Schema Module
+
+This module validates configuration data against a schema once, and
+compiles it into frozen objects with __slots__. After validation, reading
+'settings.database.port' is a plain slot read: no key walking, and no type
+checks, since the types were checked when the data was loaded.
+
+A schema is a dictionary mapping each key to one of:
+
+- a type, such as int, float, str, bool, list or dict;
+- a list holding one type, such as [str], for a list of that type;
+- a nested dictionary, for a section;
+- a Setting, to give a type and a default value for an optional key.
+
+For example {'database': {'host': str, 'port': int}, 'debug': Setting(bool,
+False)}. Keys of the data that are not in the schema are ignored.
+
+Classes
+-------
+Setting:
+    The type and default value of an optional setting.
+ConfigSection:
+    The base class of the frozen objects compiled from a schema.
+ConfigSchema:
+    A schema, compiled into ConfigSection classes, that validates data.
+
+Global functions
+----------------
+None
+"""
+
+import keyword
+from collections.abc import Mapping
+from types import MappingProxyType
+
+_REQUIRED = object()
+
+class Setting:
+    """
+    The type and default value of an optional setting.
+
+    Attributes
+    ----------
+    kind : type, list or dict
+        The type of the setting, as described in the module documentation.
+    default : object
+        The value used when the key is missing.
+    """
+    __slots__ = ('kind', 'default')
+
+    def __init__(self, kind, default=_REQUIRED):
+        """Initialize the setting; without a default it is required."""
+        self.kind = kind
+        self.default = default
+
+class ConfigSection:
+    """
+    The base class of the frozen objects compiled from a schema.
+
+    Subclasses have one slot per key of their section. Their attributes are
+    set once by ConfigSchema.validate and cannot be changed afterwards.
+
+    Methods
+    -------
+    to_dict(self):
+        Return the section as plain dicts.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        """Refuse to change a validated setting."""
+        raise AttributeError(f'{type(self).__name__} is frozen.')
+
+    def __delattr__(self, name):
+        """Refuse to delete a validated setting."""
+        raise AttributeError(f'{type(self).__name__} is frozen.')
+
+    def __eq__(self, other):
+        """Compare sections of the same class by value."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+    def __hash__(self):
+        """Hash the values, which are immutable once validated."""
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self):
+        """Return the class name and the settings."""
+        settings = ', '.join(f'{name}={getattr(self, name)!r}'
+                             for name in self.__slots__)
+        return f'{type(self).__name__}({settings})'
+
+    def to_dict(self):
+        """
+        Return the section as plain dicts.
+
+        Returns
+        -------
+        dict
+            The settings keyed by name, nested sections included.
+        """
+        return {name: value.to_dict() if isinstance(value, ConfigSection)
+                else value for name, value in
+                ((name, getattr(self, name)) for name in self.__slots__)}
+
+class ConfigSchema:
+    """
+    A schema, compiled into ConfigSection classes, that validates data.
+
+    The schema is compiled once, when the ConfigSchema is created: every
+    section gets its own ConfigSection subclass, and every key a validator
+    function. Validating data then only runs these functions.
+
+    Attributes
+    ----------
+    section_class : type
+        The ConfigSection subclass of the top-level section.
+
+    Methods
+    -------
+    validate(self, data):
+        Check data against the schema and return it as frozen objects.
+    """
+    def __init__(self, schema, name='Settings'):
+        """
+        Compile a schema.
+
+        Parameters
+        ----------
+        schema : dict
+            The schema, as described in the module documentation.
+        name : str, optional
+            The class name of the top-level section.
+
+        Raises
+        ------
+        ValueError
+            If a key is not a valid attribute name or a kind is not supported.
+        """
+        self._validate = self._compile(schema, name, ())
+        self.section_class = self._validate.section_class
+
+    def validate(self, data):
+        """
+        Check data against the schema and return it as frozen objects.
+
+        Lists are returned as tuples and dict settings as read-only copies,
+        so the result cannot be changed.
+
+        Parameters
+        ----------
+        data : Mapping
+            The configuration data.
+
+        Returns
+        -------
+        ConfigSection
+            The top-level section.
+
+        Raises
+        ------
+        ValueError
+            If a required setting is missing or a setting has the wrong type.
+        """
+        return self._validate(data)
+
+    def _compile(self, kind, name, path):
+        """Return the validator function of a kind of setting."""
+        if isinstance(kind, dict):
+            return self._compile_section(kind, name, path)
+        if isinstance(kind, list):
+            if len(kind) != 1:
+                raise ValueError(f'The list kind at : "{_dotted(path)}" must '
+                                 f'hold exactly one kind.')
+            validate_item = self._compile(kind[0], name, path)
+
+            def validate_list(value, path=path):
+                _check_type(value, list, path)
+                return tuple(validate_item(item, path) for item in value)
+            return validate_list
+        if not isinstance(kind, type):
+            raise ValueError(f'The kind at : "{_dotted(path)}" is invalid.')
+
+        def validate_value(value, path=path):
+            if kind is float and type(value) is int:
+                return float(value)
+            if kind is dict:  # Lazy and shared data hold other mappings
+                _check_type(value, Mapping, path)
+                return _freeze(value)
+            _check_type(value, kind, path)
+            if kind is list:
+                return tuple(value)
+            return value
+        return validate_value
+
+    def _compile_section(self, schema, name, path):
+        """Return the validator function of a section."""
+        fields = []
+        for key, kind in schema.items():
+            if not key.isidentifier() or keyword.iskeyword(key):
+                raise ValueError(f'The key : "{_dotted(path + (key,))}" is not '
+                                 f'a valid attribute name.')
+            default = _REQUIRED
+            if isinstance(kind, Setting):
+                kind, default = kind.kind, kind.default
+            validate = self._compile(kind, _class_name(key), path + (key,))
+            fields.append((key, validate, default))
+
+        section_class = type(name, (ConfigSection,),
+                             {'__slots__': tuple(schema)})
+        # Slot descriptors set values without going through __setattr__
+        setters = [(key, getattr(section_class, key).__set__, validate, default)
+                   for key, validate, default in fields]
+
+        def validate_section(data, path=path):
+            _check_type(data, Mapping, path)
+            section = object.__new__(section_class)
+            for key, set_slot, validate, default in setters:
+                try:
+                    value = data[key]
+                except KeyError:
+                    if default is _REQUIRED:
+                        raise ValueError(f'The setting : '
+                                         f'"{_dotted(path + (key,))}" is '
+                                         f'missing.') from None
+                    set_slot(section, default)
+                else:
+                    set_slot(section, validate(value, path + (key,)))
+            return section
+        validate_section.section_class = section_class
+        return validate_section
+
+def _dotted(path):
+    """Return a key path as dotted text."""
+    return '.'.join(map(str, path)) or '<root>'
+
+def _class_name(key):
+    """Return the class name of the section at a key."""
+    return ''.join(part.capitalize() for part in key.split('_')) or 'Section'
+
+def _check_type(value, kind, path):
+    """Raise ValueError if value is not of kind; bools are not ints."""
+    if not isinstance(value, kind) or (type(value) is bool
+                                       and kind in (int, float)):
+        expected = 'dict' if kind is Mapping else kind.__name__
+        raise ValueError(f'The setting : "{_dotted(path)}" must be '
+                         f'{expected}, not {type(value).__name__}.')
+
+def _freeze(value):
+    """Return a read-only copy of a JSON value."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item)
+                                 for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
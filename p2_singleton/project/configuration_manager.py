@@ -9,7 +9,13 @@ Classes
 -------
 ConfigMeta:
     A metaclass that enforces the Singleton pattern by ensuring that only one
-    instance of a class can exist at a time.
+    instance of a class can exist at a time, also across threads.
+ConfigSnapshot:
+    One published version of the configuration data with its setting cache.
+ConfigScope:
+    Overrides of the configuration for one context, such as a request.
+ConfigSubscription:
+    The latest snapshot published to one async subscriber.
 ConfigManager(ConfigMeta):
     The main configuration manager class that loads and manages configuration
     settings from a JSON file.
@@ -19,19 +25,38 @@ Global functions
 None
 """
 
+import asyncio
+import contextlib
+import contextvars
 import json
+import os
+import threading
+import time
+
+from compiled_config import load_compiled
+from config_diff import carry_cache, diff, touches
+from config_layers import (ConfigLayer, ConfigOverlay, deep_merge,
+                           file_signature, flatten)
+from config_metrics import ConfigMetrics
+from lazy_json import load_lazy
+from shared_config import attach, publish
 
 class ConfigMeta(type):
     """
     Metaclass for enforcing the Singleton pattern.
 
     This metaclass ensures that only one instance of any class inheriting from it
-    can exist. It inherits from type.
+    can exist. It inherits from type. Creation uses double-checked locking, so
+    threads racing to create the first instance get the same one, while calls
+    after the instance exists take no lock.
 
     Attributes
     ----------
     _instances : dict
         A dictionary to store instance of inheriting classes - only one can exist.
+    _creation_lock : threading.RLock
+        Serializes the creation of instances. It is reentrant, so the
+        __init__ of a singleton may create another singleton.
 
     Methods
     -------
@@ -39,6 +64,7 @@ class ConfigMeta(type):
         Override of the default __call__ method to enforce the Singleton pattern.
     """
     _instances = {}
+    _creation_lock = threading.RLock()
 
     def __call__(cls):
         """
@@ -54,11 +80,161 @@ class ConfigMeta(type):
         object
             The single instance of the class.
         """
-        if cls not in cls._instances:
-            # Create a new instance if none exists for the inheriting class
-            instance = super().__call__()
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        # Fast path: a single dict read, no lock once the instance exists
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with cls._creation_lock:
+                # Check again, another thread may have created it meanwhile
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    # Create a new instance if none exists for the inheriting class
+                    instance = super().__call__()
+                    cls._instances[cls] = instance
+        return instance
+
+class ConfigSnapshot:
+    """
+    One published version of the configuration data with its setting cache.
+
+    ConfigManager never changes a snapshot after publishing it, apart from
+    filling its cache. Publishing new data swaps in a whole new snapshot with
+    one reference assignment, so readers that took a snapshot see either the
+    old or the new data, never a mix, and need no lock.
+
+    Attributes
+    ----------
+    data : dict
+        The configuration data.
+    cache : dict
+        Values resolved from data, keyed by tuple of keys.
+    settings : ConfigSection or None
+        The data validated against a schema, if one was given.
+    changes : list of ConfigChange or None
+        What changed since the previous snapshot, or None when unknown, for
+        example after config_data was assigned directly.
+    schema : ConfigSchema or None
+        The schema settings were validated against.
+    """
+    __slots__ = ('data', 'cache', 'settings', 'changes', 'schema')
+
+    def __init__(self, data, cache=None, settings=None, changes=None,
+                 schema=None):
+        """Initialize the snapshot, by default with an empty setting cache."""
+        self.data = data
+        self.cache = {} if cache is None else cache
+        self.settings = settings
+        self.changes = changes
+        self.schema = schema
+
+class ConfigScope:
+    """
+    Overrides of the configuration for one context, such as a request.
+
+    The scope keeps a ConfigOverlay of its overrides over the current global
+    snapshot, with its own setting cache. When a reload publishes a new
+    global snapshot, the overlay is rebuilt over it on the next read, so
+    scoped reads always fall through to the current shared data.
+
+    Attributes
+    ----------
+    overrides : dict
+        The settings that differ from the global configuration.
+    """
+    __slots__ = ('overrides', '_view')
+
+    def __init__(self, overrides):
+        """Initialize the scope; its overlay is built on the first read."""
+        self.overrides = overrides
+        self._view = (None, None)  # (Global snapshot, scoped snapshot)
+
+    def snapshot(self, base):
+        """
+        Return the scoped snapshot over a global snapshot.
+
+        Parameters
+        ----------
+        base : ConfigSnapshot
+            The current global snapshot.
+
+        Returns
+        -------
+        ConfigSnapshot
+            The overlay of the overrides over base, with its own cache.
+        """
+        view_base, view = self._view
+        if view_base is not base:
+            view = ConfigSnapshot(ConfigOverlay(base.data, self.overrides))
+            self._view = (base, view)  # One assignment, readers see a pair
+        return view
+
+class ConfigSubscription:
+    """
+    The latest snapshot published to one async subscriber.
+
+    Publishing may happen on any thread, so the event of the subscriber is
+    set through its event loop. Only the latest snapshot is kept: a
+    subscriber that falls behind skips straight to the newest version that
+    concerns it.
+
+    Attributes
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop of the subscriber.
+    prefix : tuple
+        Only snapshots with changes at, above or below this key path are
+        handed over. The empty path selects all snapshots.
+    event : asyncio.Event
+        Set when a snapshot was published since the subscriber last woke.
+    latest : ConfigSnapshot or None
+        The latest published snapshot.
+    """
+    __slots__ = ('loop', 'prefix', 'event', 'latest')
+
+    def __init__(self, loop, prefix=()):
+        """Initialize the subscription of a subscriber running on loop."""
+        self.loop = loop
+        self.prefix = prefix
+        self.event = asyncio.Event()
+        self.latest = None
+
+    def notify(self, snapshot):
+        """
+        Hand a new snapshot to the subscriber, from any thread.
+
+        Returns
+        -------
+        bool
+            False if the event loop of the subscriber is closed.
+        """
+        if not touches(snapshot.changes, self.prefix):
+            return True
+        self.latest = snapshot
+        try:
+            self.loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:  # The loop is closed
+            return False
+        return True
+
+def _file_size(filename):
+    """Return the size of a file, or None if it cannot be read."""
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return None
+
+def _section(value):
+    """Return a section read in a scope as a merged dict, else the value."""
+    return value.to_dict() if isinstance(value, ConfigOverlay) else value
+
+def _trie_indices(children, indices):
+    """Return the indices of all paths ending at or below a trie node."""
+    found = list(indices)
+    pending = [children]
+    while pending:
+        for grandchildren, more in pending.pop().values():
+            found.extend(more)
+            pending.append(grandchildren)
+    return found
 
 class ConfigManager(metaclass=ConfigMeta):
     """
@@ -69,14 +245,61 @@ class ConfigManager(metaclass=ConfigMeta):
     Attributes
     ----------
     config_data : dict
-        A dictionary that holds the loaded configuration data.
+        A dictionary that holds the loaded configuration data. Assigning it
+        publishes a new snapshot, which also clears the setting cache.
+    last_reload_error : Exception or None
+        The error of the last failed background reload, if any.
+    last_listener_error : Exception or None
+        The last error raised by a change listener, if any.
+    cache_hits : int
+        The number of get_setting calls served from the setting cache.
+    cache_misses : int
+        The number of get_setting calls that walked config_data.
 
     Methods
     -------
-    load_config(self, filename):
-        Load configuration settings from a JSON file.
+    load_config(self, filename, lazy=False, lazy_depth=1, compiled=False,
+                schema=None):
+        Load configuration settings from a JSON file, optionally lazily,
+        through a binary snapshot, or validated against a schema.
     get_setting(self, keys):
         Get a specific setting from the loaded configuration data.
+    get_settings(self, paths, default=None):
+        Get many settings at once, reporting all missing key paths.
+    clear_setting_cache(self):
+        Forget all cached key paths.
+    cache_info(self):
+        Get the hit and miss counters of the setting cache.
+    start_watching(self, filename, interval=1.0, schema=None):
+        Load a JSON file and reload it in the background whenever it changes.
+    reload_if_changed(self):
+        Reload the watched file if it changed since it was last loaded.
+    stop_watching(self):
+        Stop the background reloading.
+    add_layer(self, name, source):
+        Add a configuration layer above all existing layers.
+    reload_layers(self):
+        Re-read the layers that changed and publish the merged view.
+    share_config(self, path):
+        Publish the configuration for other processes to attach to.
+    attach_shared_config(self, path):
+        Use a configuration published by another process.
+    scope(self, overrides):
+        Override settings for the current context only.
+    load_config_async(self, filename, **options):
+        Load a JSON file off the event loop, coalescing concurrent loads.
+    reload_async(self):
+        Reload the watched file off the event loop, coalescing requests.
+    subscribe(self, prefix=()):
+        Iterate asynchronously over newly published snapshots.
+    add_change_listener(self, prefix, callback):
+        Call a function whenever settings under a key path change.
+    remove_change_listener(self, prefix, callback):
+        Stop calling a change listener.
+    enable_metrics(self):
+        Start recording reads, lookup latencies and loads.
+    disable_metrics(self):
+        Stop recording metrics.
 
     """
     def __init__(self):
@@ -86,9 +309,92 @@ class ConfigManager(metaclass=ConfigMeta):
         The ConfigManager class stores configuration data and ensures only one
         instance exists.
         """
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.last_reload_error = None
+        self.last_listener_error = None
+        # Serializes writers only; reentrant so change listeners may reload
+        self._reload_lock = threading.RLock()
+        self._watched_file = None
+        self._watched_signature = None
+        self._watch_stop = None
+        self._layers = []  # Lowest precedence first
+        self._scope = contextvars.ContextVar('config_scope', default=None)
+        self._schema = None
+        self._subscribers = set()
+        self._listeners = []  # (Key path prefix, callback)
+        self._subscribers_lock = threading.Lock()
+        self._pending = {}  # Running async loads, keyed by loop and request
+        self.metrics = None
         self.config_data = {}  # Will hold loaded data
 
-    def load_config(self, filename):
+    @property
+    def config_data(self):
+        """The loaded configuration data, with the overrides of any scope."""
+        return self._current_snapshot().data
+
+    @config_data.setter
+    def config_data(self, data):
+        """Publish new global configuration data as a new snapshot."""
+        self._set_snapshot(ConfigSnapshot(data))
+
+    def _set_snapshot(self, snapshot):
+        """Publish a snapshot and notify the subscribers it concerns."""
+        self._snapshot = snapshot  # One atomic reference swap
+        with self._subscribers_lock:
+            closed = {subscription for subscription in self._subscribers
+                      if not subscription.notify(snapshot)}
+            self._subscribers -= closed
+            listeners = list(self._listeners)
+        changes = snapshot.changes
+        for prefix, callback in listeners:
+            if not touches(changes, prefix):
+                continue
+            try:
+                callback(None if changes is None else
+                         [change for change in changes
+                          if touches([change], prefix)])
+            except Exception as the_error:  # Must not stop the publisher
+                self.last_listener_error = the_error
+
+    def _diff_snapshot(self, data, settings=None, schema=None):
+        """Return a snapshot of data with its changes and surviving cache."""
+        old = self._snapshot
+        if not (isinstance(old.data, dict) and isinstance(data, dict)):
+            # Changes unknown
+            return ConfigSnapshot(data, settings=settings, schema=schema)
+        changes = diff(old.data, data)
+        # Copy first: readers may be filling the old cache concurrently
+        cache = carry_cache(old.cache.copy(), changes)
+        return ConfigSnapshot(data, cache, settings, changes, schema)
+
+    @property
+    def settings(self):
+        """
+        The configuration validated against the schema, as frozen objects.
+
+        Reading 'settings.database.port' is a slot read, with no key walking
+        and no type checks. None unless the configuration was loaded with a
+        schema; assigning config_data directly resets it to None. Layer
+        reloads are validated against the schema of the current settings.
+        Scopes do not apply to it.
+        """
+        return self._snapshot.settings
+
+    def _publish(self, data, schema):
+        """Validate data against a schema, then publish it as a snapshot."""
+        settings = None if schema is None else schema.validate(data)
+        self._set_snapshot(self._diff_snapshot(data, settings, schema))
+
+    def _current_snapshot(self):
+        """Return the snapshot seen by the current context."""
+        scope = self._scope.get()
+        if scope is None:
+            return self._snapshot
+        return scope.snapshot(self._snapshot)
+
+    def load_config(self, filename, lazy=False, lazy_depth=1, compiled=False,
+                    schema=None):
         """
         Load configuration settings from a JSON file.
 
@@ -96,6 +402,24 @@ class ConfigManager(metaclass=ConfigMeta):
         ----------
         filename : str
             The path to the JSON configuration file.
+        lazy : bool, optional
+            Memory-map the file and only index the offsets of its top-level
+            keys instead of parsing it. A section is parsed the first time
+            get_setting reaches it, so unused sections of very large files
+            are never materialized. config_data is then a read-only
+            LazyJSONObject mapping.
+        lazy_depth : int, optional
+            The number of object levels that are lazy when 'lazy' is set.
+        compiled : bool, optional
+            Load the file through a binary snapshot written next to it, see
+            compiled_config.load_compiled. The snapshot is keyed by the hash
+            of the file content, so later starts skip JSON parsing until the
+            file changes.
+        schema : ConfigSchema, optional
+            Validate the configuration once against this schema and compile
+            it into the frozen objects of the 'settings' attribute. Layer
+            reloads are validated against it too; a watched file is only
+            validated against the schema given to start_watching.
 
         Returns
         -------
@@ -105,14 +429,24 @@ class ConfigManager(metaclass=ConfigMeta):
         ------
         FileNotFoundError
             If the specified configuration file does not exist.
+        ValueError
+            If the configuration does not match the schema. The current
+            configuration is then kept.
 
         """
         try:
-            # Attempt loading JSON and assign it to config_data
-            with open(filename, 'r') as config_file:
-                self.config_data = json.load(config_file)
+            if lazy:
+                data = load_lazy(filename, lazy_depth)
+            elif compiled:
+                data = load_compiled(filename)
+            else:
+                # Attempt loading JSON and assign it to config_data
+                with open(filename, 'r') as config_file:
+                    data = json.load(config_file)
         except FileNotFoundError as the_error:
             raise the_error
+        with self._reload_lock:
+            self._publish(data, schema)
 
     def get_setting(self, keys):
         """
@@ -136,14 +470,670 @@ class ConfigManager(metaclass=ConfigMeta):
         TypeError
             If the configuration data is not a list.
 
+        Notes
+        -----
+        Resolved key paths are cached until config_data is replaced, so repeat
+        lookups cost one dictionary read. After changing config_data in place,
+        call clear_setting_cache.
+
+        Inside a scope, a section holding overridden keys is returned as a
+        dict merged from the overrides and the global configuration, as it
+        is outside one, and cached in the scope.
+
         """
+        # Read the snapshot once, so a concurrent reload cannot mix versions
+        snapshot = self._current_snapshot()
+        cache = snapshot.cache
+        result = snapshot.data
+        path = tuple(keys)
         try:
-            result = self.config_data
-            for key in keys:
+            value = cache[path]
+        except (KeyError, TypeError):  # Not cached yet, or unhashable keys
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+            return value
+        try:
+            for key in path:
                 result = result[key]
-            return result
         except (KeyError, TypeError) as errors:
             raise errors
+        result = _section(result)
+        try:
+            cache[path] = result
+        except TypeError:
+            pass  # Unhashable keys are resolved on every call
+        return result
+
+    def get_settings(self, paths, default=None):
+        """
+        Get many settings at once, reporting all missing key paths.
+
+        Cached paths are answered from the setting cache. The others are
+        merged into a trie, so a common prefix such as ['database'] is
+        walked once for all the paths below it, and the resolved values are
+        cached like get_setting does.
+
+        Parameters
+        ----------
+        paths : iterable of list
+            The key paths of the desired settings.
+        default : object, optional
+            The value returned for key paths that are not found.
+
+        Returns
+        -------
+        tuple
+            (values, missing): the values in the order of 'paths', with
+            'default' for missing ones, and the list of missing key paths
+            as tuples, in the same order.
+
+        """
+        snapshot = self._current_snapshot()
+        cache = snapshot.cache
+        paths = [tuple(path) for path in paths]
+        values = [default] * len(paths)
+        missing = []
+        trie = {}  # Key -> (child trie, indices of the paths ending there)
+        for index, path in enumerate(paths):
+            try:
+                values[index] = cache[path]
+            except (KeyError, TypeError):
+                pass
+            else:
+                self.cache_hits += 1
+                continue
+            self.cache_misses += 1
+            if not path:
+                values[index] = cache[path] = _section(snapshot.data)
+                continue
+            node = trie
+            try:
+                for key in path:
+                    entry = node.get(key)
+                    if entry is None:
+                        node[key] = entry = ({}, [])
+                    node = entry[0]
+            except TypeError:  # An unhashable key is never found
+                missing.append(index)
+            else:
+                entry[1].append(index)
+
+        pending = [(trie, snapshot.data, ())]
+        while pending:
+            node, data, prefix = pending.pop()
+            for key, (children, indices) in node.items():
+                try:
+                    value = data[key]
+                except (KeyError, TypeError, IndexError):
+                    missing.extend(_trie_indices(children, indices))
+                    continue
+                path = prefix + (key,)
+                if indices:
+                    cache[path] = section = _section(value)
+                    for index in indices:
+                        values[index] = section
+                if children:
+                    pending.append((children, value, path))
+
+        missing.sort()
+        return values, [paths[index] for index in missing]
+
+    def clear_setting_cache(self):
+        """
+        Forget all cached key paths.
+
+        The data stays the same, so no listener or subscriber is notified.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._reload_lock:
+            old = self._snapshot
+            # Same data: listeners and subscribers have nothing to hear
+            self._snapshot = ConfigSnapshot(old.data, settings=old.settings,
+                                            changes=[], schema=old.schema)
+
+    def cache_info(self):
+        """
+        Get the hit and miss counters of the setting cache.
+
+        Returns
+        -------
+        dict
+            'hits', 'misses' and 'size', the number of cached key paths.
+
+        """
+        return {'hits': self.cache_hits, 'misses': self.cache_misses,
+                'size': len(self._snapshot.cache)}
+
+    def start_watching(self, filename, interval=1.0, schema=None):
+        """
+        Load a JSON file and reload it in the background whenever it changes.
+
+        A daemon thread checks the inode, size and modification time of the
+        file every 'interval' seconds and only re-parses it when they change.
+        The new data is parsed completely before it is published, so readers
+        never see a half-loaded configuration. A reload that fails, for
+        example on a file caught mid-write, keeps the current configuration
+        and is stored in last_reload_error.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the JSON configuration file.
+        interval : float, optional
+            The number of seconds between two checks of the file.
+        schema : ConfigSchema, optional
+            Validate every version of the file against this schema, see
+            load_config. A version that does not match is not published.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        FileNotFoundError
+            If the specified configuration file does not exist.
+        ValueError
+            If the file does not match the schema.
+
+        """
+        self.stop_watching()
+        self._schema = schema
+        self._watched_file = filename
+        self._watched_signature = None
+        self.reload_if_changed()  # The initial load raises, the thread won't
+
+        self._watch_stop = stop = threading.Event()
+        threading.Thread(target=self._watch, args=(stop, interval),
+                         name='ConfigManager-watcher', daemon=True).start()
+
+    def _watch(self, stop, interval):
+        """Check the watched file every interval until stop is set."""
+        while not stop.wait(interval):
+            try:
+                self.reload_if_changed()
+            except (OSError, ValueError) as the_error:
+                self.last_reload_error = the_error
+
+    def reload_if_changed(self):
+        """
+        Reload the watched file if it changed since it was last loaded.
+
+        Returns
+        -------
+        bool
+            True if the file was reloaded, False if it is unchanged or no
+            file is being watched.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        ValueError
+            If the file does not hold valid JSON or does not match the
+            schema.
+
+        """
+        with self._reload_lock:
+            filename = self._watched_file
+            if filename is None:
+                return False
+            signature = file_signature(filename)
+            if signature == self._watched_signature:
+                return False
+            with open(filename, 'r') as config_file:
+                data = json.load(config_file)
+            self._publish(data, self._schema)
+            self._watched_signature = signature
+            self.last_reload_error = None
+            return True
+
+    def stop_watching(self):
+        """
+        Stop the background reloading.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
+
+    def add_layer(self, name, source):
+        """
+        Add a configuration layer above all existing layers.
+
+        Layers are merged in the order they are added, each one overriding
+        the layers added before it. A typical order is defaults, then a
+        per-environment file, then per-host overrides, then environment
+        variables (see config_layers.environment_variables). Adding a layer
+        replaces config_data with the merged view of all layers.
+
+        Parameters
+        ----------
+        name : str
+            The name of the layer.
+        source : str, dict or callable
+            A JSON file path, a dictionary, or a function returning a
+            dictionary.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If a layer with this name already exists, or its file does not
+            hold valid JSON.
+        FileNotFoundError
+            If the file of the layer does not exist.
+
+        """
+        with self._reload_lock:
+            if any(layer.name == name for layer in self._layers):
+                raise ValueError(f'The layer : "{name}" already exists.')
+            layer = ConfigLayer(name, source)
+            self._layers.append(layer)
+            try:
+                self.reload_layers()
+            except BaseException:
+                self._layers.remove(layer)  # Keep the layers that can load
+                raise
+
+    def reload_layers(self):
+        """
+        Re-read the layers that changed and publish the merged view.
+
+        Only layers whose source changed are re-read, and merging restarts
+        from the lowest changed layer, reusing the merged result of every
+        layer below it. The merged tree is then flattened once, so that
+        get_setting answers any key path with a single dictionary lookup,
+        however many layers there are.
+
+        All layers are read, and the merged view validated against the
+        schema of the current settings, before any layer is updated: if one
+        step fails, no layer keeps its new data, so the next call reads them
+        again.
+
+        Returns
+        -------
+        list of str
+            The names of the layers that changed. When empty, nothing was
+            published.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file of a layer does not exist.
+        ValueError
+            If the file of a layer does not hold valid JSON, or the merged
+            view does not match the schema of the current settings.
+
+        """
+        with self._reload_lock:
+            updates = [layer.read() for layer in self._layers]
+            changed = [update is not None for update in updates]
+            if not any(changed):
+                return []
+            lowest = changed.index(True)
+            merged = self._layers[lowest - 1].merged if lowest else {}
+            merges = []
+            for layer, update in zip(self._layers[lowest:], updates[lowest:]):
+                data = layer.data if update is None else update[0]
+                merged = deep_merge(merged, data)
+                merges.append(merged)
+            schema = self._snapshot.schema
+            settings = None if schema is None else schema.validate(merged)
+            for layer, update in zip(self._layers, updates):
+                if update is not None:
+                    layer.apply(update)
+            for layer, layer_merged in zip(self._layers[lowest:], merges):
+                layer.merged = layer_merged
+            snapshot = self._diff_snapshot(merged, settings, schema)
+            snapshot.cache = flatten(merged)
+            self._set_snapshot(snapshot)
+            return [layer.name for layer, was_changed
+                    in zip(self._layers, changed) if was_changed]
+
+    def share_config(self, path):
+        """
+        Publish the configuration for other processes to attach to.
+
+        Parameters
+        ----------
+        path : str
+            Where to publish it, for example shared_config.shared_path(name).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        TypeError
+            If the configuration data is not a mapping with str keys
+            holding JSON values.
+
+        """
+        publish(self.config_data, path)
+
+    def attach_shared_config(self, path):
+        """
+        Use a configuration published by another process.
+
+        The published file is memory-mapped read-only, so all attached
+        processes share its pages, and keys are looked up in the mapping
+        without any per-process index. config_data is then a read-only
+        SharedJSONObject and get_setting works as usual. Call again to pick
+        up a newer publication.
+
+        Parameters
+        ----------
+        path : str
+            The path given to share_config.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        FileNotFoundError
+            If nothing was published at 'path'.
+        ValueError
+            If the file at 'path' is not a published configuration.
+
+        """
+        self.config_data = attach(path)
+
+    @contextlib.contextmanager
+    def scope(self, overrides):
+        """
+        Override settings for the current context only.
+
+        Inside the 'with' block, get_setting and config_data see the
+        overrides merged over the global configuration, while other threads
+        and asyncio tasks keep seeing the global one. The scope is stored in
+        a context variable, so asyncio tasks created inside the block inherit
+        it; new threads start without a scope. Nothing of the global
+        configuration is copied: reads of keys that are not overridden fall
+        through to the shared data, and sections holding overridden keys are
+        merged into a dict when get_setting or get_settings first reads them.
+        Scopes can be nested, inner overrides winning. Assigning config_data
+        or loading a file inside a scope still changes the global
+        configuration.
+
+        Parameters
+        ----------
+        overrides : dict
+            The settings to override, for example {'database': {'host': 'x'}}.
+
+        Yields
+        ------
+        ConfigManager
+            This instance.
+
+        """
+        outer = self._scope.get()
+        if outer is not None:
+            overrides = deep_merge(outer.overrides, overrides)
+        token = self._scope.set(ConfigScope(overrides))
+        try:
+            yield self
+        finally:
+            self._scope.reset(token)
+
+    async def _coalesce(self, request, function):
+        """Run function in the default executor, once per concurrent request."""
+        loop = asyncio.get_running_loop()
+        key = (loop, request)
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.run_in_executor(None, function)
+            self._pending[key] = future
+            future.add_done_callback(lambda _: self._pending.pop(key, None))
+        # One caller giving up must not cancel the load for the others
+        return await asyncio.shield(future)
+
+    async def load_config_async(self, filename, **options):
+        """
+        Load a JSON file off the event loop, coalescing concurrent loads.
+
+        The file is read and parsed by load_config in the default executor
+        of the running loop, so the loop keeps serving other tasks.
+        Concurrent calls with the same arguments share a single load.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the JSON configuration file.
+        **options
+            lazy, lazy_depth, compiled and schema, see load_config.
+
+        Returns
+        -------
+        ConfigSnapshot
+            The published snapshot, with 'data' and 'settings'.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the specified configuration file does not exist.
+        ValueError
+            If the file does not hold valid JSON or does not match the
+            schema.
+
+        """
+        def load():
+            self.load_config(filename, **options)
+            return self._snapshot
+        request = ('load', filename, tuple(sorted(options.items())))
+        return await self._coalesce(request, load)
+
+    async def reload_async(self):
+        """
+        Reload the watched file off the event loop, coalescing requests.
+
+        Runs reload_if_changed in the default executor. Concurrent calls
+        share one check and at most one parse.
+
+        Returns
+        -------
+        ConfigSnapshot
+            The current snapshot, new if the file changed.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        ValueError
+            If the file does not hold valid JSON or does not match the
+            schema.
+
+        """
+        def reload():
+            self.reload_if_changed()
+            return self._snapshot
+        return await self._coalesce(('reload',), reload)
+
+    async def subscribe(self, prefix=()):
+        """
+        Iterate asynchronously over newly published snapshots.
+
+        Every way of publishing a configuration is covered: load_config and
+        its async counterpart, reloads of a watched file from the watcher
+        thread, reload_layers, and assigning config_data. A subscriber that
+        falls behind receives only the latest snapshot. Stop iterating, or
+        close the iterator, to unsubscribe.
+
+        Parameters
+        ----------
+        prefix : list, optional
+            Only yield snapshots that change settings at, above or below
+            this key path, according to their 'changes'. Snapshots whose
+            changes are unknown are always yielded, and reloads that change
+            nothing are never.
+
+        Yields
+        ------
+        ConfigSnapshot
+            Each newly published snapshot, with 'data' and 'settings'.
+
+        """
+        subscription = ConfigSubscription(asyncio.get_running_loop(),
+                                          tuple(prefix))
+        with self._subscribers_lock:
+            self._subscribers.add(subscription)
+        try:
+            while True:
+                await subscription.event.wait()
+                subscription.event.clear()
+                yield subscription.latest
+        finally:
+            with self._subscribers_lock:
+                self._subscribers.discard(subscription)
+
+    def add_change_listener(self, prefix, callback):
+        """
+        Call a function whenever settings under a key path change.
+
+        Reloads compare the old and new configuration trees, see
+        config_diff.diff. The callback is only called when a change is at,
+        above or below 'prefix', with just those changes. It runs on the
+        thread that published the configuration, for example the watcher
+        thread, right after the new configuration became visible. An
+        exception raised by the callback is stored in last_listener_error,
+        and the other listeners and the reload carry on.
+
+        Parameters
+        ----------
+        prefix : list
+            The key path to watch, for example ['database']. The empty path
+            watches everything.
+        callback : callable
+            Called with the list of ConfigChange, or with None when the
+            changes are unknown, for example after config_data was assigned
+            directly.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._subscribers_lock:
+            self._listeners.append((tuple(prefix), callback))
+
+    def remove_change_listener(self, prefix, callback):
+        """
+        Stop calling a change listener.
+
+        Parameters
+        ----------
+        prefix : list
+            The key path given to add_change_listener.
+        callback : callable
+            The callback given to add_change_listener.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the listener is not registered.
+
+        """
+        with self._subscribers_lock:
+            self._listeners.remove((tuple(prefix), callback))
+
+    def enable_metrics(self):
+        """
+        Start recording reads, lookup latencies and loads.
+
+        The instrumented methods are installed as attributes of this
+        instance, shadowing get_setting, get_settings, load_config and
+        reload_if_changed of the class. While metrics are disabled those
+        attributes do not exist, so the methods run without any check and
+        instrumentation costs nothing.
+
+        Returns
+        -------
+        ConfigMetrics
+            The metrics being recorded, also in the 'metrics' attribute.
+            Enabling twice keeps the existing metrics.
+
+        """
+        if self.metrics is not None:
+            return self.metrics
+        metrics = ConfigMetrics()
+        clock = time.perf_counter
+        cls = type(self)
+
+        def get_setting(keys):
+            start = clock()
+            try:
+                return cls.get_setting(self, keys)
+            finally:
+                try:
+                    path = (tuple(keys),)
+                except TypeError:
+                    path = ()
+                metrics.record_read('get_setting', path, clock() - start)
+
+        def get_settings(paths, default=None):
+            paths = [tuple(path) for path in paths]
+            start = clock()
+            try:
+                return cls.get_settings(self, paths, default)
+            finally:
+                metrics.record_read('get_settings', paths, clock() - start)
+
+        def load_config(filename, *args, **kwargs):
+            start = clock()
+            cls.load_config(self, filename, *args, **kwargs)
+            metrics.record_load(filename, clock() - start, _file_size(filename))
+
+        def reload_if_changed():
+            filename = self._watched_file
+            start = clock()
+            reloaded = cls.reload_if_changed(self)
+            if reloaded:
+                metrics.record_load(filename, clock() - start,
+                                    _file_size(filename))
+            return reloaded
+
+        self.get_setting = get_setting
+        self.get_settings = get_settings
+        self.load_config = load_config
+        self.reload_if_changed = reload_if_changed
+        self.metrics = metrics
+        return metrics
+
+    def disable_metrics(self):
+        """
+        Stop recording metrics.
+
+        The class methods are used again directly, and 'metrics' is reset to
+        None.
+
+        Returns
+        -------
+        None
+
+        """
+        for name in ('get_setting', 'get_settings', 'load_config',
+                     'reload_if_changed'):
+            self.__dict__.pop(name, None)
+        self.metrics = None
 
 if __name__ == '__main__':
     # Create ConfigManager as a demo.
@@ -0,0 +1,233 @@
+"""
+Lazy JSON Module
+
+This module reads JSON objects lazily from a buffer such as an mmap of a
+file. Instead of parsing the whole document, it indexes the byte offsets of
+the keys of an object and parses the value of a key only when it is first
+accessed. Sections that are never read are never materialized in memory.
+
+Classes
+-------
+LazyJSONObject(Mapping):
+    A read-only mapping over a JSON object in a buffer that parses its
+    values on first access.
+
+Global functions
+----------------
+load_lazy(filename, depth=1):
+    Memory-map a JSON file and return its top-level object as a
+    LazyJSONObject.
+"""
+
+import json
+import mmap
+import re
+from collections.abc import Mapping
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_STRING_REST = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)  # After the "
+_SCALAR = re.compile(rb'[^,}\] \t\n\r]*')
+_STRUCTURE = re.compile(rb'[\[\]{}"]')
+
+def _error(message, position):
+    """Return a ValueError for malformed JSON at a byte offset."""
+    return ValueError(f'{message} at byte {position}')
+
+def _skip_whitespace(buffer, position):
+    """Return the offset of the next non-whitespace byte."""
+    return _WHITESPACE.match(buffer, position).end()
+
+def _string_end(buffer, position):
+    """Return the offset just after the string starting at position."""
+    match = _STRING_REST.match(buffer, position + 1)
+    if match is None:
+        raise _error('Unterminated string', position)
+    return match.end()
+
+def _value_end(buffer, position):
+    """Return the offset just after the JSON value starting at position."""
+    first = buffer[position:position + 1]
+    if first == b'"':
+        return _string_end(buffer, position)
+    if first not in (b'{', b'['):
+        end = _SCALAR.match(buffer, position).end()
+        if end == position:
+            raise _error('Expected a value', position)
+        return end
+
+    # Skip a nested object or array, only stopping at structural bytes
+    depth = 0
+    while True:
+        match = _STRUCTURE.search(buffer, position)
+        if match is None:
+            raise _error('Unterminated object or array', position)
+        position = match.start()
+        byte = buffer[position:position + 1]
+        if byte == b'"':
+            position = _string_end(buffer, position)
+            continue
+        depth += 1 if byte in (b'{', b'[') else -1
+        position += 1
+        if not depth:
+            return position
+
+def _index_object(buffer, position):
+    """Map the keys of the object starting at position to value offsets."""
+    entries = {}
+    position = _skip_whitespace(buffer, position + 1)
+    if buffer[position:position + 1] == b'}':
+        return entries
+    while True:
+        if buffer[position:position + 1] != b'"':
+            raise _error('Expected a key', position)
+        key_end = _string_end(buffer, position)
+        key = json.loads(bytes(buffer[position:key_end]))
+        position = _skip_whitespace(buffer, key_end)
+        if buffer[position:position + 1] != b':':
+            raise _error("Expected ':'", position)
+        start = _skip_whitespace(buffer, position + 1)
+        end = _value_end(buffer, start)
+        entries[key] = (start, end)  # A repeated key keeps its last value
+        position = _skip_whitespace(buffer, end)
+        separator = buffer[position:position + 1]
+        if separator == b'}':
+            return entries
+        if separator != b',':
+            raise _error("Expected ',' or '}'", position)
+        position = _skip_whitespace(buffer, position + 1)
+
+class LazyJSONObject(Mapping):
+    """
+    A read-only mapping over a JSON object in a buffer.
+
+    The keys of the object are indexed on first use. The value of a key is
+    parsed with json.loads on first access and kept. Values that are
+    themselves objects are returned as LazyJSONObject while 'depth' allows,
+    so deep sections are materialized one level at a time.
+
+    Attributes
+    ----------
+    depth : int
+        The number of object levels, this one included, that are lazy.
+
+    Methods
+    -------
+    to_dict(self):
+        Parse all values and return the object as plain dicts and lists.
+    """
+    __slots__ = ('_buffer', '_start', 'depth', '_index', '_values')
+
+    def __init__(self, buffer, start=None, depth=1):
+        """
+        Initialize the mapping over the object starting at 'start'.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            The buffer holding the JSON, for example an mmap. It is kept
+            alive as long as this mapping or its lazy children.
+        start : int, optional
+            The offset of the opening '{'. Defaults to the first non
+            whitespace byte of the buffer.
+        depth : int, optional
+            The number of object levels, this one included, that are lazy.
+
+        Raises
+        ------
+        ValueError
+            If there is no JSON object at the start offset.
+        """
+        if start is None:
+            start = _skip_whitespace(buffer, 0)
+        if buffer[start:start + 1] != b'{':
+            raise _error('Expected an object', start)
+        self._buffer = buffer
+        self._start = start
+        self.depth = depth
+        self._index = None
+        self._values = {}
+
+    def _entries(self):
+        """Return the key index, building it on first use."""
+        if self._index is None:
+            self._index = _index_object(self._buffer, self._start)
+        return self._index
+
+    def __getitem__(self, key):
+        """Return the value of a key, parsing it on first access."""
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        start, end = self._entries()[key]  # Raises KeyError when missing
+        if self.depth > 1 and self._buffer[start:start + 1] == b'{':
+            value = LazyJSONObject(self._buffer, start, self.depth - 1)
+        else:
+            value = json.loads(bytes(self._buffer[start:end]))
+        self._values[key] = value
+        return value
+
+    def __iter__(self):
+        """Iterate over the keys without parsing any value."""
+        return iter(self._entries())
+
+    def __len__(self):
+        """Return the number of keys."""
+        return len(self._entries())
+
+    def __contains__(self, key):
+        """Check for a key without parsing its value."""
+        return key in self._entries()
+
+    def __repr__(self):
+        """Return a summary that does not parse any value."""
+        return (f'LazyJSONObject({len(self)} keys, '
+                f'{len(self._values)} loaded, depth={self.depth})')
+
+    def to_dict(self):
+        """
+        Parse all values and return the object as plain dicts and lists.
+
+        Returns
+        -------
+        dict
+            The fully materialized object.
+        """
+        return {key: value.to_dict() if isinstance(value, LazyJSONObject)
+                else value for key, value in self.items()}
+
+def load_lazy(filename, depth=1):
+    """
+    Memory-map a JSON file and return its top-level object lazily.
+
+    Only the key offsets of the top-level object are indexed here. Indexing
+    skips over nested values with regular expressions working directly on
+    the read-only mapping, so sections that are never accessed are never
+    parsed or copied into Python objects.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the JSON file.
+    depth : int, optional
+        The number of object levels that are lazy, see LazyJSONObject.
+
+    Returns
+    -------
+    LazyJSONObject
+        The top-level object.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file is empty or its top level is not a valid JSON object.
+    """
+    with open(filename, 'rb') as config_file:
+        if not config_file.seek(0, 2):
+            raise ValueError(f'"{filename}" is empty.')
+        buffer = mmap.mmap(config_file.fileno(), 0, access=mmap.ACCESS_READ)
+    lazy = LazyJSONObject(buffer, depth=depth)
+    lazy._entries()  # Index the top level now, so malformed files fail here
+    return lazy
@@ -0,0 +1,261 @@
+"""
+Shared Configuration Module
+
+This module shares one copy of the configuration between processes. ConfigMeta
+keeps one ConfigManager per interpreter, so every worker process would
+otherwise parse and hold its own copy. Instead, one process publishes the
+configuration to a file, by default in shared memory (/dev/shm) where it
+never touches a disk, and other processes attach to it with a read-only
+memory mapping. The pages of the file are shared by all of them.
+
+The file holds the configuration as compact JSON followed by one sorted
+key table per JSON object, so attached processes look keys up with a
+binary search directly in the mapping. Nothing is indexed or copied per
+process; only the values a process reads are parsed, and the memory held by
+each worker stays flat however large the configuration is.
+
+A memory-mapped file is used rather than multiprocessing.shared_memory
+because its lifetime does not depend on the processes attached to it: the
+resource tracker of an attaching process would unlink a shared memory
+segment when that process exits.
+
+Classes
+-------
+SharedJSONObject(Mapping):
+    A read-only mapping over a JSON object of a published configuration.
+
+Global functions
+----------------
+shared_path(name):
+    Return the default path of a published configuration.
+publish(data, path):
+    Publish configuration data for other processes to attach to.
+attach(path):
+    Attach read-only to a published configuration.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Mapping
+
+_SHARED_DIRECTORY = '/dev/shm'
+_MAGIC = b'CFGSHM1\n'
+_HEADER = struct.Struct('<8sQ')  # Magic, offset of the root key table
+_COUNT = struct.Struct('<Q')
+# Key start and end, value start and end, offset of the key table of the
+# value when it is an object (else 0)
+_ENTRY = struct.Struct('<5Q')
+
+def shared_path(name):
+    """
+    Return the default path of a published configuration.
+
+    Parameters
+    ----------
+    name : str
+        The name of the configuration, for example 'my-service'.
+
+    Returns
+    -------
+    str
+        A path in /dev/shm when it exists, else in the temporary directory.
+    """
+    directory = (_SHARED_DIRECTORY if os.path.isdir(_SHARED_DIRECTORY)
+                 else tempfile.gettempdir())
+    return os.path.join(directory, f'{name}.config')
+
+def _serialize(data):
+    """Return the published form of a configuration mapping."""
+    content = bytearray(_HEADER.size)
+    tables = []  # Entries per object, referring to child tables by index
+
+    def emit(value):
+        if not isinstance(value, Mapping):
+            content.extend(json.dumps(value, separators=(',', ':')).encode())
+            return 0
+        for key in value:
+            if not isinstance(key, str):
+                raise TypeError(f'Keys must be str, not {type(key).__name__}')
+        # Keys are compared in their encoded form, so readers never decode
+        items = sorted((json.dumps(key).encode(), key) for key in value)
+        table_index = len(tables)
+        entries = []
+        tables.append(entries)
+        content.extend(b'{')
+        for position, (encoded, key) in enumerate(items):
+            if position:
+                content.extend(b',')
+            key_start = len(content)
+            content.extend(encoded + b':')
+            value_start = len(content)
+            child = emit(value[key])
+            entries.append((key_start, value_start - 1, value_start,
+                            len(content), child))
+        content.extend(b'}')
+        return table_index + 1
+
+    if not isinstance(data, Mapping):
+        raise TypeError('The configuration must be a mapping.')
+    emit(data)
+
+    content.extend(bytes(-len(content) % 8))  # Align the tables
+    offsets = [0]
+    for entries in tables:
+        offsets.append(len(content))
+        content.extend(bytes(_COUNT.size + _ENTRY.size * len(entries)))
+    for table_offset, entries in zip(offsets[1:], tables):
+        _COUNT.pack_into(content, table_offset, len(entries))
+        for position, (*spans, child) in enumerate(entries):
+            _ENTRY.pack_into(content,
+                             table_offset + _COUNT.size + position * _ENTRY.size,
+                             *spans, offsets[child])
+    _HEADER.pack_into(content, 0, _MAGIC, offsets[1])
+    return content
+
+class SharedJSONObject(Mapping):
+    """
+    A read-only mapping over a JSON object of a published configuration.
+
+    Keys are found with a binary search in the key table of the object,
+    inside the shared mapping. Values are parsed on every access and not
+    kept, and values that are objects are returned as SharedJSONObject, so
+    the mapping itself holds no per-process copy of the configuration.
+    ConfigManager.get_setting still caches the settings it resolves.
+
+    Methods
+    -------
+    to_dict(self):
+        Parse all values and return the object as plain dicts and lists.
+    """
+    __slots__ = ('_buffer', '_table', '_count')
+
+    def __init__(self, buffer, table):
+        """Initialize the mapping over the key table at offset 'table'."""
+        self._buffer = buffer
+        self._table = table
+        self._count = _COUNT.unpack_from(buffer, table)[0]
+
+    def _entry(self, position):
+        """Return the entry at a position of the key table."""
+        return _ENTRY.unpack_from(
+            self._buffer, self._table + _COUNT.size + position * _ENTRY.size)
+
+    def _value(self, entry):
+        """Return the value of an entry."""
+        _, _, value_start, value_end, child = entry
+        if child:
+            return SharedJSONObject(self._buffer, child)
+        return json.loads(self._buffer[value_start:value_end])
+
+    def __getitem__(self, key):
+        """Return the value of a key, found by binary search."""
+        if not isinstance(key, str):
+            raise KeyError(key)
+        encoded = json.dumps(key).encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            found = self._buffer[entry[0]:entry[1]]
+            if found == encoded:
+                return self._value(entry)
+            if found < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        raise KeyError(key)
+
+    def __iter__(self):
+        """Iterate over the keys, in the order of their encoded form."""
+        for position in range(self._count):
+            key_start, key_end = self._entry(position)[:2]
+            yield json.loads(self._buffer[key_start:key_end])
+
+    def __len__(self):
+        """Return the number of keys."""
+        return self._count
+
+    def __repr__(self):
+        """Return a summary that does not parse any value."""
+        return f'SharedJSONObject({self._count} keys)'
+
+    def to_dict(self):
+        """
+        Parse all values and return the object as plain dicts and lists.
+
+        Returns
+        -------
+        dict
+            The fully materialized object.
+        """
+        return {key: value.to_dict() if isinstance(value, SharedJSONObject)
+                else value for key, value in self.items()}
+
+def publish(data, path):
+    """
+    Publish configuration data for other processes to attach to.
+
+    The data is written to a temporary file that then replaces 'path', so
+    processes attaching at the same time see either the previous or the new
+    configuration, never a partial one. Processes that are already attached
+    keep their mapping of the previous version.
+
+    Parameters
+    ----------
+    data : Mapping
+        The configuration data.
+    path : str
+        Where to publish it, see shared_path.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    TypeError
+        If the data is not a mapping with str keys holding JSON values.
+    """
+    content = _serialize(data)
+    descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                             suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as shared_file:
+            shared_file.write(content)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+def attach(path):
+    """
+    Attach read-only to a published configuration.
+
+    Parameters
+    ----------
+    path : str
+        The path given to publish.
+
+    Returns
+    -------
+    SharedJSONObject
+        The top-level object of the configuration.
+
+    Raises
+    ------
+    FileNotFoundError
+        If nothing was published at 'path'.
+    ValueError
+        If the file at 'path' is not a published configuration.
+    """
+    with open(path, 'rb') as shared_file:
+        if shared_file.seek(0, 2) < _HEADER.size:
+            raise ValueError(f'"{path}" is not a published configuration.')
+        buffer = mmap.mmap(shared_file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, root = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC:
+        raise ValueError(f'"{path}" is not a published configuration.')
+    return SharedJSONObject(buffer, root)
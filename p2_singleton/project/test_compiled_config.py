@@ -0,0 +1,170 @@
+"""
+Test for Compiled Configuration Module
+
+This script tests the compiled_config module, which caches parsed JSON
+configuration files as binary snapshots.
+
+Classes
+-------
+TestLoadCompiled
+    Inherits from unittest.TestCase and contains test methods.
+
+Global functions
+----------------
+None
+
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import compiled_config
+from compiled_config import load_compiled, snapshot_path
+
+DOCUMENT = {'database': {'host': 'localhost', 'port': 5432},
+            'tags': ['a', 'b'], 'ratio': 0.5, 'debug': False, 'proxy': None}
+
+class TestLoadCompiled(unittest.TestCase):
+    """
+    Test class for load_compiled.
+
+    Methods
+    -------
+    setUp
+        Writes a configuration file to a temporary directory.
+    tearDown
+        Removes the temporary directory.
+    write_config
+        Writes configuration data to the source file.
+    test_first_load_writes_snapshot
+        Tests that the first load parses the JSON and writes the snapshot.
+    test_later_loads_skip_json
+        Tests that unchanged files are loaded without parsing JSON.
+    test_changed_source_recompiles
+        Tests that a changed source replaces the snapshot.
+    test_corrupt_snapshot_recompiles
+        Tests that an unreadable snapshot falls back to the source.
+    test_invalid_json
+        Tests that invalid JSON raises ValueError.
+
+    """
+
+    def setUp(self):
+        """
+        Writes a configuration file to a temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'config.json')
+        self.write_config(DOCUMENT)
+
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.directory.cleanup()
+
+    def write_config(self, data):
+        """
+        Writes configuration data to the source file.
+
+        Parameters
+        ----------
+        data : object
+            The data to write as JSON, or a str to write as is.
+
+        Returns
+        -------
+        None
+
+        """
+        with open(self.filename, 'w') as config_file:
+            config_file.write(data if isinstance(data, str) else json.dumps(data))
+
+    def test_first_load_writes_snapshot(self):
+        """
+        Tests that the first load parses the JSON and writes the snapshot.
+
+        Returns
+        -------
+        None
+
+        """
+        self.assertFalse(os.path.exists(snapshot_path(self.filename)))
+        self.assertEqual(load_compiled(self.filename), DOCUMENT)
+        self.assertTrue(os.path.exists(snapshot_path(self.filename)))
+
+    def test_later_loads_skip_json(self):
+        """
+        Tests that unchanged files are loaded without parsing JSON.
+
+        Returns
+        -------
+        None
+
+        """
+        load_compiled(self.filename)
+        with patch.object(compiled_config.json, 'loads') as loads:
+            self.assertEqual(load_compiled(self.filename), DOCUMENT)
+        loads.assert_not_called()
+
+    def test_changed_source_recompiles(self):
+        """
+        Tests that a changed source replaces the snapshot.
+
+        Returns
+        -------
+        None
+
+        """
+        load_compiled(self.filename)
+        self.write_config({'database': {'port': 6432}})
+        self.assertEqual(load_compiled(self.filename),
+                         {'database': {'port': 6432}})
+        with patch.object(compiled_config.json, 'loads') as loads:
+            load_compiled(self.filename)
+        loads.assert_not_called()
+
+    def test_corrupt_snapshot_recompiles(self):
+        """
+        Tests that an unreadable snapshot falls back to the source.
+
+        Returns
+        -------
+        None
+
+        """
+        load_compiled(self.filename)
+        with open(snapshot_path(self.filename), 'r+b') as snapshot_file:
+            snapshot_file.truncate(45)
+        self.assertEqual(load_compiled(self.filename), DOCUMENT)
+        self.assertEqual(load_compiled(self.filename), DOCUMENT)
+
+    def test_invalid_json(self):
+        """
+        Tests that invalid JSON raises ValueError.
+
+        Returns
+        -------
+        None
+
+        """
+        self.write_config('{"database": ')
+        with self.assertRaises(ValueError):
+            load_compiled(self.filename)
+        self.assertFalse(os.path.exists(snapshot_path(self.filename)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Test for ConfigManager Benchmark Module
+
+This script tests the contention, startup and shared memory benchmarks of
+the config_benchmark module.
+
+Classes
+-------
+TestContentionBenchmark
+    Inherits from unittest.TestCase and contains test methods.
+TestStartupBenchmark
+    Inherits from unittest.TestCase and tests the startup benchmark.
+TestSharedMemoryBenchmark
+    Inherits from unittest.TestCase and tests the shared memory benchmark.
+
+Global functions
+----------------
+None
+
+"""
+
+import unittest
+
+from config_benchmark import (contention_benchmark, shared_memory_benchmark,
+                              startup_benchmark)
+from configuration_manager import ConfigManager
+
+class TestContentionBenchmark(unittest.TestCase):
+    """
+    Test class for the contention benchmark.
+
+    Methods
+    -------
+    test_single_instance_and_lock_free_fast_path
+        Tests that one instance is created and the lock is rarely taken.
+    test_restores_existing_instance
+        Tests that the benchmark leaves the existing singleton in place.
+
+    """
+
+    def test_single_instance_and_lock_free_fast_path(self):
+        """
+        Tests that one instance is created and the lock is rarely taken.
+
+        Only threads that arrive before the instance exists may take the
+        lock, so the acquisitions are bounded by the thread count.
+
+        Returns
+        -------
+        None
+
+        """
+        result = contention_benchmark(threads=4, calls=1000)
+        self.assertEqual(result['calls'], 4000)
+        self.assertEqual(result['instances'], 1)
+        self.assertLessEqual(result['lock_acquisitions'], 4)
+
+    def test_restores_existing_instance(self):
+        """
+        Tests that the benchmark leaves the existing singleton in place.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = ConfigManager()
+        contention_benchmark(threads=2, calls=10)
+        self.assertIs(ConfigManager(), manager)
+
+class TestStartupBenchmark(unittest.TestCase):
+    """
+    Test class for the startup benchmark.
+
+    Methods
+    -------
+    test_reports_both_loaders
+        Tests that both loaders are timed on a compiled file.
+
+    """
+
+    def test_reports_both_loaders(self):
+        """
+        Tests that both loaders are timed on a compiled file.
+
+        Returns
+        -------
+        None
+
+        """
+        result = startup_benchmark(sections=50, repeat=2)
+        self.assertGreater(result['file_bytes'], 0)
+        self.assertGreater(result['snapshot_bytes'], 0)
+        self.assertGreater(result['json_seconds'], 0)
+        self.assertGreater(result['compiled_seconds'], 0)
+
+class TestSharedMemoryBenchmark(unittest.TestCase):
+    """
+    Test class for the shared memory benchmark.
+
+    Methods
+    -------
+    test_shared_workers_hold_less
+        Tests that attached workers hold less memory than parsing ones.
+
+    """
+
+    def test_shared_workers_hold_less(self):
+        """
+        Tests that attached workers hold less memory than parsing ones.
+
+        Returns
+        -------
+        None
+
+        """
+        result = shared_memory_benchmark(workers=2, sections=2_000)
+        self.assertLess(result['shared_bytes'], result['parsed_bytes'] / 2)
+
+if __name__ == '__main__':
+    unittest.main()
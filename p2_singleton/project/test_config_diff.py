@@ -0,0 +1,125 @@
+"""
+Test for Configuration Diff Module
+
+This script tests the config_diff module, which computes what changed
+between two configuration trees.
+
+Classes
+-------
+TestConfigDiff
+    Inherits from unittest.TestCase and contains test methods.
+
+Global functions
+----------------
+None
+
+"""
+
+import unittest
+
+from config_diff import MISSING, ConfigChange, carry_cache, diff, touches
+
+OLD = {'database': {'host': 'localhost', 'port': 5432, 'pool': {'size': 5}},
+       'cache': {'ttl': 60}, 'debug': False, 'tags': ['a']}
+NEW = {'database': {'host': 'db1', 'port': 5432, 'pool': {'size': 5}},
+       'cache': {'ttl': 60}, 'debug': 0, 'tags': ['a'], 'proxy': None}
+
+class TestConfigDiff(unittest.TestCase):
+    """
+    Test class for the config_diff module.
+
+    Methods
+    -------
+    test_diff
+        Tests that changes are reported at their own key path.
+    test_shared_subtrees_are_skipped
+        Tests that subtrees shared by both trees are not walked.
+    test_touches
+        Tests which key paths a change concerns.
+    test_carry_cache
+        Tests that only the cache entries of unchanged paths survive.
+
+    """
+
+    def test_diff(self):
+        """
+        Tests that changes are reported at their own key path.
+
+        Returns
+        -------
+        None
+
+        """
+        changes = diff(OLD, NEW)
+        self.assertEqual(changes, [
+            ConfigChange(('proxy',), MISSING, None),
+            ConfigChange(('database', 'host'), 'localhost', 'db1'),
+            ConfigChange(('debug',), False, 0),
+        ])
+        self.assertEqual([change.kind for change in changes],
+                         ['added', 'changed', 'changed'])
+        self.assertEqual(diff(NEW, OLD)[0].kind, 'removed')
+        self.assertEqual(diff(OLD, OLD), [])
+        self.assertEqual(diff(OLD, [1]), [ConfigChange((), OLD, [1])])
+
+    def test_shared_subtrees_are_skipped(self):
+        """
+        Tests that subtrees shared by both trees are not walked.
+
+        Returns
+        -------
+        None
+
+        """
+        class Unwalkable(dict):
+            def items(self):
+                raise AssertionError('A shared subtree was walked.')
+
+        shared = Unwalkable(a=1)
+        self.assertEqual(diff({'x': shared, 'y': 1}, {'x': shared, 'y': 2}),
+                         [ConfigChange(('y',), 1, 2)])
+
+    def test_touches(self):
+        """
+        Tests which key paths a change concerns.
+
+        Returns
+        -------
+        None
+
+        """
+        changes = [ConfigChange(('database', 'host'), 'a', 'b')]
+        self.assertTrue(touches(changes, ('database',)))
+        self.assertTrue(touches(changes, ('database', 'host')))
+        self.assertTrue(touches(changes, ('database', 'host', 'name')))
+        self.assertTrue(touches(changes, ()))
+        self.assertFalse(touches(changes, ('database', 'port')))
+        self.assertFalse(touches([], ()))
+        self.assertTrue(touches(None, ('anything',)))
+
+    def test_carry_cache(self):
+        """
+        Tests that only the cache entries of unchanged paths survive.
+
+        Returns
+        -------
+        None
+
+        """
+        cache = {(): OLD, ('database',): OLD['database'],
+                 ('database', 'host'): 'localhost',
+                 ('database', 'port'): 5432,
+                 ('database', 'pool', 'size'): 5,
+                 ('cache', 'ttl'): 60}
+        self.assertEqual(carry_cache(cache, diff(OLD, NEW)),
+                         {('database', 'port'): 5432,
+                          ('database', 'pool', 'size'): 5,
+                          ('cache', 'ttl'): 60})
+        removed = [ConfigChange(('database',), OLD['database'], MISSING)]
+        self.assertEqual(carry_cache(cache, removed), {('cache', 'ttl'): 60})
+        self.assertEqual(carry_cache(cache, None), {})
+        self.assertEqual(carry_cache(cache, []), cache)
+        self.assertEqual(carry_cache(cache, [ConfigChange((), 1, 2)]), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Test for Configuration Layers Module
+
+This script tests the config_layers module, which reads, merges and
+flattens the layers of a layered configuration.
+
+Classes
+-------
+TestConfigLayers
+    Inherits from unittest.TestCase and contains test methods.
+
+Global functions
+----------------
+None
+
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from config_layers import (ConfigLayer, ConfigOverlay, deep_merge,
+                           environment_variables, flatten)
+
+class TestConfigLayers(unittest.TestCase):
+    """
+    Test class for the config_layers module.
+
+    Methods
+    -------
+    test_deep_merge
+        Tests that the override wins and neither tree is modified.
+    test_flatten
+        Tests that inner and leaf paths are all mapped.
+    test_environment_variables
+        Tests that variables become nested, parsed settings.
+    test_file_layer_refresh
+        Tests that a file is only re-read after it changed.
+    test_callable_layer_refresh
+        Tests that a function counts as changed when its data differs.
+    test_overlay
+        Tests that an overlay reads like the deep merge without copying.
+
+    """
+
+    def test_deep_merge(self):
+        """
+        Tests that the override wins and neither tree is modified.
+
+        Returns
+        -------
+        None
+
+        """
+        base = {'db': {'host': 'a', 'port': 1}, 'tags': ['x']}
+        override = {'db': {'host': 'b'}, 'tags': ['y'], 'new': {'k': 1}}
+        merged = deep_merge(base, override)
+
+        self.assertEqual(merged, {'db': {'host': 'b', 'port': 1},
+                                  'tags': ['y'], 'new': {'k': 1}})
+        self.assertEqual(base, {'db': {'host': 'a', 'port': 1}, 'tags': ['x']})
+        self.assertIs(merged['new'], override['new'])
+
+    def test_flatten(self):
+        """
+        Tests that inner and leaf paths are all mapped.
+
+        Returns
+        -------
+        None
+
+        """
+        self.assertEqual(flatten({'db': {'host': 'a'}, 'debug': True}),
+                         {('db',): {'host': 'a'}, ('db', 'host'): 'a',
+                          ('debug',): True})
+
+    def test_environment_variables(self):
+        """
+        Tests that variables become nested, parsed settings.
+
+        Returns
+        -------
+        None
+
+        """
+        variables = {'APP_DB__PORT': '5432', 'APP_DB__HOST': 'db1',
+                     'APP_DEBUG': 'true', 'OTHER_DEBUG': 'false'}
+        with patch.dict(os.environ, variables):
+            data = environment_variables('APP_')()
+
+        self.assertEqual(data, {'db': {'port': 5432, 'host': 'db1'},
+                                'debug': True})
+
+    def test_file_layer_refresh(self):
+        """
+        Tests that a file is only re-read after it changed.
+
+        Returns
+        -------
+        None
+
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'layer.json')
+            layer = ConfigLayer('file', filename)
+            for data in ({'a': 1}, {'a': 2}):
+                with open(filename + '.tmp', 'w') as layer_file:
+                    json.dump(data, layer_file)
+                os.replace(filename + '.tmp', filename)
+
+                update = layer.read()
+                self.assertEqual(update[0], data)
+                self.assertNotEqual(layer.data, data)  # Kept once applied
+                self.assertTrue(layer.refresh())
+                self.assertEqual(layer.data, data)
+                self.assertFalse(layer.refresh())
+
+    def test_callable_layer_refresh(self):
+        """
+        Tests that a function counts as changed when its data differs.
+
+        Returns
+        -------
+        None
+
+        """
+        values = {'a': 1}
+        layer = ConfigLayer('values', lambda: dict(values))
+
+        self.assertTrue(layer.refresh())
+        self.assertFalse(layer.refresh())
+        values['a'] = 2
+        self.assertTrue(layer.refresh())
+        self.assertEqual(layer.data, {'a': 2})
+
+    def test_overlay(self):
+        """
+        Tests that an overlay reads like the deep merge without copying.
+
+        Returns
+        -------
+        None
+
+        """
+        base = {'db': {'host': 'a', 'port': 1}, 'tags': ['x'], 'debug': False}
+        override = {'db': {'host': 'b'}, 'tags': ['y'], 'new': {'k': 1}}
+        overlay = ConfigOverlay(base, override)
+
+        self.assertEqual(overlay, deep_merge(base, override))
+        self.assertEqual(len(overlay), 4)
+        self.assertIn('debug', overlay)
+        self.assertNotIn('missing', overlay)
+        self.assertIs(overlay['tags'], override['tags'])
+        self.assertIsInstance(overlay['db'], ConfigOverlay)
+        with self.assertRaises(KeyError):
+            overlay['missing']
+        merged = overlay.to_dict()
+        self.assertIs(type(merged['db']), dict)
+        self.assertEqual(merged, deep_merge(base, override))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Test for Configuration Metrics Module
+
+This script tests the config_metrics module, which records and exports how
+the configuration is used.
+
+Classes
+-------
+TestConfigMetrics
+    Inherits from unittest.TestCase and contains test methods.
+
+Global functions
+----------------
+None
+
+"""
+
+import json
+import unittest
+
+from config_metrics import LATENCY_BUCKETS, ConfigMetrics
+
+class TestConfigMetrics(unittest.TestCase):
+    """
+    Test class for ConfigMetrics.
+
+    Methods
+    -------
+    setUp
+        Records a few reads and loads.
+    test_hot_keys
+        Tests that the most read key paths come first.
+    test_json_export
+        Tests the JSON export of the metrics.
+    test_prometheus_export
+        Tests the Prometheus export of the metrics.
+
+    """
+
+    def setUp(self):
+        """
+        Records a few reads and loads.
+
+        Returns
+        -------
+        None
+
+        """
+        self.metrics = ConfigMetrics()
+        for _ in range(3):
+            self.metrics.record_read('get_setting', [('database', 'port')],
+                                     4e-7)
+        self.metrics.record_read('get_settings',
+                                 [('database', 'host'), ('database', 'port')],
+                                 2e-6)
+        self.metrics.record_read('get_setting', [('cache', 'ttl')], 1.0)
+        self.metrics.record_load('config "a".json', 0.25, 1024)
+        self.metrics.record_load('config "a".json', 0.5, 2048)
+
+    def test_hot_keys(self):
+        """
+        Tests that the most read key paths come first.
+
+        Returns
+        -------
+        None
+
+        """
+        self.assertEqual(self.metrics.hot_keys(2),
+                         [(('database', 'port'), 4), (('database', 'host'), 1)])
+
+    def test_json_export(self):
+        """
+        Tests the JSON export of the metrics.
+
+        Returns
+        -------
+        None
+
+        """
+        exported = json.loads(self.metrics.to_json())
+        self.assertEqual(exported['reads']['database.port'], 4)
+        latency = exported['latency']['get_setting']
+        self.assertEqual(latency['count'], 4)
+        self.assertEqual([count for _, count in latency['buckets']],
+                         [0, 3] + [0] * (len(LATENCY_BUCKETS) - 3) + [1])
+        self.assertEqual(exported['loads']['config "a".json'],
+                         {'count': 2, 'seconds': 0.75, 'bytes': 2048})
+
+    def test_prometheus_export(self):
+        """
+        Tests the Prometheus export of the metrics.
+
+        Returns
+        -------
+        None
+
+        """
+        lines = self.metrics.to_prometheus().splitlines()
+        self.assertIn('config_reads_total{path="database.port"} 4', lines)
+        self.assertIn('config_lookup_seconds_bucket{operation="get_setting",'
+                      'le="5e-07"} 3', lines)
+        self.assertIn('config_lookup_seconds_bucket{operation="get_setting",'
+                      'le="+Inf"} 4', lines)
+        self.assertIn('config_lookup_seconds_count{operation="get_settings"} 1',
+                      lines)
+        self.assertIn('config_loads_total{file="config \\"a\\".json"} 2', lines)
+        self.assertIn('config_file_bytes{file="config \\"a\\".json"} 2048',
+                      lines)
+        self.assertIn('# TYPE config_lookup_seconds histogram', lines)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Test for Configuration Schema Module
+
+This script tests the config_schema module, which validates configuration
+data once and compiles it into frozen objects with __slots__.
+
+Classes
+-------
+TestConfigSchema
+    Inherits from unittest.TestCase and contains test methods.
+
+Global functions
+----------------
+None
+
+"""
+
+import unittest
+
+from config_schema import ConfigSchema, ConfigSection, Setting
+
+SCHEMA = {
+    'database': {'host': str, 'port': int},
+    'debug': Setting(bool, False),
+    'ratio': float,
+    'tags': [str],
+    'servers': [{'name': str}],
+    'extra': Setting(dict, None),
+}
+
+DATA = {
+    'database': {'host': 'localhost', 'port': 5432},
+    'ratio': 1,
+    'tags': ['a', 'b'],
+    'servers': [{'name': 'web', 'unknown': 0}],
+    'extra': {'nested': [1, {'k': 'v'}]},
+}
+
+class TestConfigSchema(unittest.TestCase):
+    """
+    Test class for ConfigSchema.
+
+    Methods
+    -------
+    setUp
+        Compiles the test schema.
+    test_attribute_access
+        Tests that validated settings are read as attributes.
+    test_slots
+        Tests that the compiled sections are slotted and frozen.
+    test_defaults
+        Tests that optional settings get their default.
+    test_missing_setting
+        Tests that a missing required setting is reported by path.
+    test_wrong_type
+        Tests that a setting of the wrong type is reported by path.
+    test_invalid_schema
+        Tests that unsupported schemas are refused when compiled.
+
+    """
+
+    def setUp(self):
+        """
+        Compiles the test schema.
+
+        Returns
+        -------
+        None
+
+        """
+        self.schema = ConfigSchema(SCHEMA)
+
+    def test_attribute_access(self):
+        """
+        Tests that validated settings are read as attributes.
+
+        Returns
+        -------
+        None
+
+        """
+        settings = self.schema.validate(DATA)
+        self.assertEqual(settings.database.host, 'localhost')
+        self.assertEqual(settings.database.port, 5432)
+        self.assertEqual(settings.ratio, 1.0)
+        self.assertIsInstance(settings.ratio, float)
+        self.assertEqual(settings.tags, ('a', 'b'))
+        self.assertEqual(settings.servers[0].name, 'web')
+        self.assertEqual(settings.extra['nested'][1]['k'], 'v')
+        self.assertEqual(settings.to_dict()['database'],
+                         {'host': 'localhost', 'port': 5432})
+
+    def test_slots(self):
+        """
+        Tests that the compiled sections are slotted and frozen.
+
+        Returns
+        -------
+        None
+
+        """
+        settings = self.schema.validate(DATA)
+        self.assertIsInstance(settings, ConfigSection)
+        self.assertIsInstance(settings, self.schema.section_class)
+        self.assertFalse(hasattr(settings, '__dict__'))
+        with self.assertRaises(AttributeError):
+            settings.database.port = 1
+        with self.assertRaises(AttributeError):
+            del settings.debug
+        with self.assertRaises(TypeError):
+            settings.extra['nested'] = None
+        self.assertEqual(settings, self.schema.validate(DATA))
+
+    def test_defaults(self):
+        """
+        Tests that optional settings get their default.
+
+        Returns
+        -------
+        None
+
+        """
+        data = dict(DATA)
+        del data['extra']
+        settings = self.schema.validate(data)
+        self.assertIs(settings.debug, False)
+        self.assertIsNone(settings.extra)
+
+    def test_missing_setting(self):
+        """
+        Tests that a missing required setting is reported by path.
+
+        Returns
+        -------
+        None
+
+        """
+        data = dict(DATA, database={'host': 'localhost'})
+        with self.assertRaisesRegex(ValueError, 'database.port'):
+            self.schema.validate(data)
+
+    def test_wrong_type(self):
+        """
+        Tests that a setting of the wrong type is reported by path.
+
+        Returns
+        -------
+        None
+
+        """
+        for key, value, path in (('database', {'host': 'h', 'port': '5432'},
+                                  'database.port'),
+                                 ('database', {'host': 'h', 'port': True},
+                                  'database.port'),
+                                 ('tags', ['a', 1], 'tags'),
+                                 ('servers', [{'name': 1}], 'servers.name'),
+                                 ('database', [], 'database')):
+            with self.assertRaisesRegex(ValueError, f'"{path}"'):
+                self.schema.validate(dict(DATA, **{key: value}))
+
+    def test_invalid_schema(self):
+        """
+        Tests that unsupported schemas are refused when compiled.
+
+        Returns
+        -------
+        None
+
+        """
+        for schema in ({'not valid': int}, {'class': int}, {'a': 'int'},
+                       {'a': [int, str]}):
+            with self.assertRaises(ValueError):
+                ConfigSchema(schema)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,16 @@ Classes
 -------
 TestConfigManager
     Inherits from unittest.TestCase and contains test methods.
+TestConfigMeta
+    Inherits from unittest.TestCase and tests the metaclass under threads.
+TestConfigReload
+    Inherits from unittest.TestCase and tests reloading watched files.
+TestConfigLayers
+    Inherits from unittest.TestCase and tests layered configuration.
+TestConfigScope
+    Inherits from unittest.TestCase and tests context-scoped overrides.
+TestConfigAsync
+    Inherits from unittest.TestCase and tests async loading and reloading.
 
 Global functions
 ----------------
@@ -18,11 +28,19 @@ None
 """
 
 import unittest
+import asyncio
 import json
+import os
+import tempfile
+import threading
+import time
 from unittest.mock import patch, mock_open
 
 # Import the ConfigManager class from your module
-from configuration_manager import ConfigManager
+from config_layers import environment_variables
+from config_schema import ConfigSchema
+import configuration_manager
+from configuration_manager import ConfigManager, ConfigMeta
 
 class TestConfigManager(unittest.TestCase):
     """
@@ -49,6 +67,14 @@ class TestConfigManager(unittest.TestCase):
         Tests the get_setting method with an existing setting.
     test_get_non_existing_setting
         Tests the get_setting method with a non-existing setting and checks for errors.
+    test_setting_cache_hits_and_misses
+        Tests that repeated key paths are served from the setting cache.
+    test_setting_cache_invalidated_on_load
+        Tests that loading new configuration data invalidates the cache.
+    test_get_settings
+        Tests that bulk lookups return all values and all missing paths.
+    test_get_settings_shares_prefixes
+        Tests that bulk lookups walk a common prefix once.
 
     """
 
@@ -76,6 +102,8 @@ class TestConfigManager(unittest.TestCase):
         None
         
         """
+        # The singleton outlives each test, so reset the data it holds
+        self.config_manager.config_data = {}
         return super().tearDown()
 
     def test_load_valid_config_file(self):
@@ -203,5 +231,1159 @@ class TestConfigManager(unittest.TestCase):
         with self.assertRaises((KeyError, TypeError)):
             self.config_manager.get_setting(['database', 'user'])
 
+    def test_setting_cache_hits_and_misses(self):
+        """
+        Tests that repeated key paths are served from the setting cache.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.config_data = {'database': {'host': 'localhost'}}
+        before = self.config_manager.cache_info()
+
+        for _ in range(3):
+            self.assertEqual(
+                self.config_manager.get_setting(['database', 'host']), 'localhost')
+        with self.assertRaises(KeyError):
+            self.config_manager.get_setting(['database', 'user'])
+
+        after = self.config_manager.cache_info()
+        self.assertEqual(after['hits'] - before['hits'], 2)
+        self.assertEqual(after['misses'] - before['misses'], 2)
+        self.assertEqual(after['size'], 1)  # Missing paths are not cached
+
+    def test_setting_cache_invalidated_on_load(self):
+        """
+        Tests that loading new configuration data invalidates the cache.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.config_data = {'api': {'port': 8080}}
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8080)
+
+        with patch('builtins.open', new_callable=mock_open) as mock_file_open:
+            mock_file_open.return_value.read.return_value = '{"api": {"port": 9090}}'
+            self.config_manager.load_config('new_config.json')
+
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 9090)
+
+        # In-place changes need an explicit clear
+        self.config_manager.config_data['api']['port'] = 7070
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 9090)
+        self.config_manager.clear_setting_cache()
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 7070)
+
+    def test_get_settings(self):
+        """
+        Tests that bulk lookups return all values and all missing paths.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.config_data = {
+            'database': {'host': 'localhost', 'port': 5432},
+            'servers': ['web', 'worker'],
+        }
+        self.assertEqual(self.config_manager.get_setting(['database', 'port']),
+                         5432)
+        values, missing = self.config_manager.get_settings(
+            [['database', 'host'], ['database', 'user'], ['database', 'port'],
+             ['servers', 1], ['servers', 5], ['cache', 'ttl'],
+             ['database', 'host']], default='unset')
+
+        self.assertEqual(values, ['localhost', 'unset', 5432, 'worker',
+                                  'unset', 'unset', 'localhost'])
+        self.assertEqual(missing, [('database', 'user'), ('servers', 5),
+                                   ('cache', 'ttl')])
+        self.assertEqual(self.config_manager.cache_info()['hits'], 1)
+        self.assertEqual(self.config_manager.get_setting(['servers', 1]),
+                         'worker')
+        self.assertEqual(self.config_manager.cache_info()['hits'], 2)
+
+    def test_get_settings_shares_prefixes(self):
+        """
+        Tests that bulk lookups walk a common prefix once.
+
+        Returns
+        -------
+        None
+
+        """
+        reads = []
+
+        class CountingDict(dict):
+            def __getitem__(self, key):
+                reads.append(key)
+                return super().__getitem__(key)
+
+        self.config_manager.config_data = CountingDict(
+            database=CountingDict(host='localhost', port=5432,
+                                  pool=CountingDict(size=5)))
+        values, missing = self.config_manager.get_settings(
+            [['database', 'host'], ['database', 'port'],
+             ['database', 'pool', 'size'], ['database', 'pool', 'wait']])
+
+        self.assertEqual(values, ['localhost', 5432, 5, None])
+        self.assertEqual(missing, [('database', 'pool', 'wait')])
+        self.assertEqual(reads.count('database'), 1)
+        self.assertEqual(reads.count('pool'), 1)
+
+class TestConfigReload(unittest.TestCase):
+    """
+    Test class for reloading watched configuration files.
+
+    Methods
+    -------
+    setUp
+        Writes a configuration file to a temporary directory.
+    tearDown
+        Stops watching and removes the temporary directory.
+    write_config
+        Writes configuration data to the watched file.
+    wait_for
+        Waits until a condition holds or a timeout expires.
+    test_reload_only_when_changed
+        Tests that the file is only re-parsed after it changed.
+    test_background_reload
+        Tests that the watcher thread publishes changes of the file.
+    test_invalid_file_keeps_configuration
+        Tests that a failed reload keeps the current configuration.
+    test_lazy_load
+        Tests that a lazily loaded file only parses the sections read.
+    test_compiled_load
+        Tests that a compiled load writes and then uses a snapshot.
+    test_shared_config
+        Tests that a shared configuration is read through get_setting.
+    test_schema_load
+        Tests that a schema compiles the configuration into settings.
+    test_schema_rejects_reload
+        Tests that a reload that does not match the schema is not published.
+    test_load_keeps_watched_schema
+        Tests that loading another file keeps the schema of the watched one.
+    test_metrics
+        Tests that enabled metrics record reads and loads, and only then.
+    test_diff_reload
+        Tests that reloads notify listeners of changed prefixes only and
+        keep the cache of unchanged paths.
+    test_clear_cache_is_silent
+        Tests that clearing the setting cache notifies no listener.
+    test_failing_listener
+        Tests that a listener raising does not stop the other listeners or
+        the watcher thread.
+    test_subscribe_prefix
+        Tests that async subscribers of a prefix skip unrelated reloads.
+
+    """
+
+    def setUp(self):
+        """
+        Writes a configuration file to a temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager = ConfigManager()
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'config.json')
+        self.write_config({'api': {'port': 8000}})
+
+    def tearDown(self):
+        """
+        Stops watching and removes the temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.stop_watching()
+        self.config_manager._watched_file = None
+        self.config_manager.config_data = {}
+        self.directory.cleanup()
+
+    def write_config(self, data):
+        """
+        Writes configuration data to the watched file.
+
+        The file is replaced through a rename, like editors and deploy tools
+        do, which gives it a new inode.
+
+        Parameters
+        ----------
+        data : object
+            The data to write as JSON, or a str to write as is.
+
+        Returns
+        -------
+        None
+
+        """
+        temporary = self.filename + '.tmp'
+        with open(temporary, 'w') as config_file:
+            config_file.write(data if isinstance(data, str) else json.dumps(data))
+        os.replace(temporary, self.filename)
+
+    def wait_for(self, condition, timeout=2.0):
+        """
+        Waits until a condition holds or a timeout expires.
+
+        Returns
+        -------
+        bool
+            Whether the condition held in time.
+
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_reload_only_when_changed(self):
+        """
+        Tests that the file is only re-parsed after it changed.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.start_watching(self.filename, interval=60)
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8000)
+        self.assertFalse(self.config_manager.reload_if_changed())
+
+        self.write_config({'api': {'port': 9000}})
+        self.assertTrue(self.config_manager.reload_if_changed())
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 9000)
+
+    def test_background_reload(self):
+        """
+        Tests that the watcher thread publishes changes of the file.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.start_watching(self.filename, interval=0.01)
+        self.write_config({'api': {'port': 9001}})
+        self.assertTrue(self.wait_for(
+            lambda: self.config_manager.get_setting(['api', 'port']) == 9001))
+
+    def test_invalid_file_keeps_configuration(self):
+        """
+        Tests that a failed reload keeps the current configuration.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.start_watching(self.filename, interval=0.01)
+        self.write_config('{"api": {"po')
+        self.assertTrue(self.wait_for(
+            lambda: self.config_manager.last_reload_error is not None))
+        self.assertIsInstance(self.config_manager.last_reload_error, ValueError)
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8000)
+
+    def test_lazy_load(self):
+        """
+        Tests that a lazily loaded file only parses the sections read.
+
+        Returns
+        -------
+        None
+
+        """
+        self.write_config({'api': {'port': 8000}, 'routes': {'a': 1, 'b': 2}})
+        self.config_manager.load_config(self.filename, lazy=True)
+        config_data = self.config_manager.config_data
+
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8000)
+        self.assertEqual(list(config_data._values), ['api'])
+        with self.assertRaises(KeyError):
+            self.config_manager.get_setting(['api', 'host'])
+        self.assertEqual(config_data, {'api': {'port': 8000},
+                                       'routes': {'a': 1, 'b': 2}})
+
+    def test_compiled_load(self):
+        """
+        Tests that a compiled load writes and then uses a snapshot.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.load_config(self.filename, compiled=True)
+        self.assertTrue(os.path.exists(self.filename + '.snapshot'))
+        self.config_manager.load_config(self.filename, compiled=True)
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8000)
+
+    def test_shared_config(self):
+        """
+        Tests that a shared configuration is read through get_setting.
+
+        Returns
+        -------
+        None
+
+        """
+        shared = os.path.join(self.directory.name, 'config.shared')
+        self.config_manager.load_config(self.filename)
+        self.config_manager.share_config(shared)
+        self.config_manager.config_data = {}
+
+        self.config_manager.attach_shared_config(shared)
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8000)
+        with self.assertRaises(KeyError):
+            self.config_manager.get_setting(['api', 'host'])
+
+    def test_schema_load(self):
+        """
+        Tests that a schema compiles the configuration into settings.
+
+        Returns
+        -------
+        None
+
+        """
+        schema = ConfigSchema({'api': {'port': int}})
+        self.config_manager.load_config(self.filename, schema=schema)
+        self.assertEqual(self.config_manager.settings.api.port, 8000)
+
+        self.write_config({'api': {'port': 'http'}})
+        with self.assertRaises(ValueError):
+            self.config_manager.load_config(self.filename, schema=schema)
+        self.assertEqual(self.config_manager.settings.api.port, 8000)
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8000)
+
+    def test_schema_rejects_reload(self):
+        """
+        Tests that a reload that does not match the schema is not published.
+
+        Returns
+        -------
+        None
+
+        """
+        schema = ConfigSchema({'api': {'port': int}})
+        self.config_manager.start_watching(self.filename, interval=0.01,
+                                           schema=schema)
+        self.write_config({'api': {'host': 'localhost'}})
+        self.assertTrue(self.wait_for(
+            lambda: self.config_manager.last_reload_error is not None))
+        self.assertEqual(self.config_manager.settings.api.port, 8000)
+
+        self.write_config({'api': {'port': 9000}})
+        self.assertTrue(self.wait_for(
+            lambda: self.config_manager.settings.api.port == 9000))
+
+    def test_load_keeps_watched_schema(self):
+        """
+        Tests that loading another file keeps the schema of the watched one.
+
+        Returns
+        -------
+        None
+
+        """
+        other = os.path.join(self.directory.name, 'other.json')
+        with open(other, 'w') as config_file:
+            json.dump({'api': {'port': 'http'}}, config_file)
+        schema = ConfigSchema({'api': {'port': int}})
+        self.config_manager.start_watching(self.filename, interval=3600,
+                                           schema=schema)
+        self.config_manager.load_config(other)
+        self.assertIsNone(self.config_manager.settings)
+
+        self.write_config({'api': {'port': 'https'}})
+        with self.assertRaises(ValueError):
+            self.config_manager.reload_if_changed()
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']),
+                         'http')
+
+    def test_metrics(self):
+        """
+        Tests that enabled metrics record reads and loads, and only then.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        self.assertIsNone(manager.metrics)
+        self.assertNotIn('get_setting', vars(manager))
+        try:
+            metrics = manager.enable_metrics()
+            self.assertIs(manager.enable_metrics(), metrics)
+            manager.load_config(self.filename)
+            for _ in range(3):
+                manager.get_setting(['api', 'port'])
+            with self.assertRaises(KeyError):
+                manager.get_setting(['api', 'host'])
+            manager.get_settings([['api', 'port']])
+
+            self.assertEqual(metrics.hot_keys(1), [(('api', 'port'), 4)])
+            snapshot = metrics.snapshot()
+            self.assertEqual(snapshot['latency']['get_setting']['count'], 4)
+            self.assertEqual(snapshot['loads'][self.filename]['count'], 1)
+            self.assertEqual(snapshot['loads'][self.filename]['bytes'],
+                             os.path.getsize(self.filename))
+        finally:
+            manager.disable_metrics()
+        self.assertIsNone(manager.metrics)
+        self.assertNotIn('get_setting', vars(manager))
+        manager.get_setting(['api', 'port'])
+        self.assertEqual(metrics.reads[('api', 'port')], 4)
+
+    def test_diff_reload(self):
+        """
+        Tests that reloads notify listeners of changed prefixes only and
+        keep the cache of unchanged paths.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        self.write_config({'api': {'port': 8000}, 'cache': {'ttl': 60}})
+        manager.start_watching(self.filename, interval=60)
+        api_changes, cache_changes = [], []
+        manager.add_change_listener(['api'], api_changes.append)
+        manager.add_change_listener(['cache'], cache_changes.append)
+        try:
+            manager.get_setting(['api', 'port'])
+            manager.get_setting(['cache', 'ttl'])
+            manager.get_setting([])
+            self.write_config({'api': {'port': 9000}, 'cache': {'ttl': 60}})
+            self.assertTrue(manager.reload_if_changed())
+        finally:
+            manager.remove_change_listener(['api'], api_changes.append)
+            manager.remove_change_listener(['cache'], cache_changes.append)
+
+        self.assertEqual([[(change.path, change.old, change.new)
+                           for change in changes] for changes in api_changes],
+                         [[(('api', 'port'), 8000, 9000)]])
+        self.assertEqual(cache_changes, [])
+        misses = manager.cache_misses
+        self.assertEqual(manager.get_setting(['cache', 'ttl']), 60)
+        self.assertEqual(manager.cache_misses, misses)
+        self.assertEqual(manager.get_setting(['api', 'port']), 9000)
+        self.assertEqual(manager.cache_misses, misses + 1)
+        self.assertEqual(manager.get_setting([])['api'], {'port': 9000})
+
+    def test_clear_cache_is_silent(self):
+        """
+        Tests that clearing the setting cache notifies no listener.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        manager.load_config(self.filename)
+        changes = []
+        manager.add_change_listener([], changes.append)
+        try:
+            manager.get_setting(['api', 'port'])
+            manager.clear_setting_cache()
+        finally:
+            manager.remove_change_listener([], changes.append)
+        self.assertEqual(changes, [])
+        self.assertEqual(manager.cache_info()['size'], 0)
+        self.assertEqual(manager.get_setting(['api', 'port']), 8000)
+
+    def test_failing_listener(self):
+        """
+        Tests that a listener raising does not stop the other listeners or
+        the watcher thread.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        manager.last_listener_error = None
+        self.write_config({'api': {'port': 8000}})
+        manager.start_watching(self.filename, interval=0.01)
+        ports = []
+
+        def failing(changes):
+            raise RuntimeError('listener failed')
+
+        def record(changes):
+            ports.append(changes[0].new)
+
+        manager.add_change_listener(['api'], failing)
+        manager.add_change_listener(['api'], record)
+        try:
+            for port in (9000, 10000):
+                self.write_config({'api': {'port': port}})
+                deadline = time.monotonic() + 2
+                while (manager.get_setting(['api', 'port']) != port
+                       and time.monotonic() < deadline):
+                    time.sleep(0.01)
+        finally:
+            manager.stop_watching()
+            manager.remove_change_listener(['api'], failing)
+            manager.remove_change_listener(['api'], record)
+
+        self.assertEqual(ports, [9000, 10000])
+        self.assertIsInstance(manager.last_listener_error, RuntimeError)
+        self.assertIsNone(manager.last_reload_error)
+
+    def test_subscribe_prefix(self):
+        """
+        Tests that async subscribers of a prefix skip unrelated reloads.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        manager.load_config(self.filename)
+
+        async def main():
+            updates = manager.subscribe(['api'])
+            first = asyncio.ensure_future(updates.__anext__())
+            await asyncio.sleep(0)  # Let the subscriber register
+            manager.config_data = dict(manager.config_data, other=1)
+            manager.load_config(self.filename)  # Only removes 'other'
+            self.write_config({'api': {'port': 9000}})
+            manager.load_config(self.filename)
+            snapshot = await asyncio.wait_for(first, timeout=2)
+            await updates.aclose()
+            return snapshot
+
+        snapshot = asyncio.run(main())
+        self.assertEqual(snapshot.data['api']['port'], 9000)
+        self.assertEqual([change.path for change in snapshot.changes],
+                         [('api', 'port')])
+
+class TestConfigLayers(unittest.TestCase):
+    """
+    Test class for layered configuration.
+
+    Methods
+    -------
+    setUp
+        Writes the files of the defaults and host layers.
+    tearDown
+        Removes the layers and the temporary directory.
+    write_layer
+        Writes the data of a file layer.
+    test_layer_precedence
+        Tests that later layers override earlier ones key by key.
+    test_only_changed_layers_are_reread
+        Tests that reloading re-reads changed layers only.
+    test_merged_view_is_precomputed
+        Tests that every key path is answered from the precomputed cache.
+    test_duplicate_layer_name
+        Tests that a layer name can only be used once.
+    test_failed_reload_keeps_changes
+        Tests that a layer failing to load does not lose the changes read
+        from the other layers.
+    test_layers_keep_schema
+        Tests that layer reloads and clearing the cache keep the settings
+        validated against the current schema.
+
+    """
+
+    def setUp(self):
+        """
+        Writes the files of the defaults and host layers.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager = ConfigManager()
+        self.directory = tempfile.TemporaryDirectory()
+        self.defaults = os.path.join(self.directory.name, 'defaults.json')
+        self.host = os.path.join(self.directory.name, 'host.json')
+        self.write_layer(self.defaults, {'database': {'host': 'localhost',
+                                                      'port': 5432},
+                                         'debug': False})
+        self.write_layer(self.host, {'database': {'host': 'db1'}})
+
+    def tearDown(self):
+        """
+        Removes the layers and the temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager._layers = []
+        self.config_manager.config_data = {}
+        self.directory.cleanup()
+
+    def write_layer(self, filename, data):
+        """
+        Writes the data of a file layer through a rename.
+
+        Returns
+        -------
+        None
+
+        """
+        with open(filename + '.tmp', 'w') as layer_file:
+            json.dump(data, layer_file)
+        os.replace(filename + '.tmp', filename)
+
+    def test_layer_precedence(self):
+        """
+        Tests that later layers override earlier ones key by key.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.add_layer('defaults', self.defaults)
+        self.config_manager.add_layer('environment', {'debug': True})
+        self.config_manager.add_layer('host', self.host)
+        with patch.dict(os.environ, {'APP_DATABASE__PORT': '6432'}):
+            self.config_manager.add_layer('variables',
+                                          environment_variables('APP_'))
+
+        self.assertEqual(self.config_manager.config_data,
+                         {'database': {'host': 'db1', 'port': 6432},
+                          'debug': True})
+
+    def test_only_changed_layers_are_reread(self):
+        """
+        Tests that reloading re-reads changed layers only.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.add_layer('defaults', self.defaults)
+        self.config_manager.add_layer('host', self.host)
+        defaults = self.config_manager._layers[0].data
+        self.assertEqual(self.config_manager.reload_layers(), [])
+
+        self.write_layer(self.host, {'database': {'port': 7000}})
+        self.assertEqual(self.config_manager.reload_layers(), ['host'])
+        self.assertIs(self.config_manager._layers[0].data, defaults)
+        self.assertEqual(self.config_manager.get_setting(['database']),
+                         {'host': 'localhost', 'port': 7000})
+
+    def test_failed_reload_keeps_changes(self):
+        """
+        Tests that a layer failing to load does not lose the changes read
+        from the other layers.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        manager.add_layer('defaults', self.defaults)
+        manager.add_layer('host', self.host)
+        self.write_layer(self.defaults, {'debug': True})
+        os.rename(self.host, self.host + '.away')
+        with self.assertRaises(FileNotFoundError):
+            manager.reload_layers()
+        self.assertEqual(manager.get_setting(['debug']), False)
+
+        os.rename(self.host + '.away', self.host)
+        self.assertEqual(manager.reload_layers(), ['defaults'])
+        self.assertEqual(manager.get_setting(['debug']), True)
+
+        with self.assertRaises(FileNotFoundError):
+            manager.add_layer('missing', self.host + '.missing')
+        self.assertEqual([layer.name for layer in manager._layers],
+                         ['defaults', 'host'])
+
+    def test_layers_keep_schema(self):
+        """
+        Tests that layer reloads and clearing the cache keep the settings
+        validated against the current schema.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        manager.load_config(self.defaults,
+                            schema=ConfigSchema({'database': {'port': int}}))
+        manager.add_layer('defaults', self.defaults)
+        manager.add_layer('host', {'database': {'port': 6432}})
+        self.assertEqual(manager.settings.database.port, 6432)
+        manager.clear_setting_cache()
+        self.assertEqual(manager.settings.database.port, 6432)
+
+        with self.assertRaises(ValueError):
+            manager.add_layer('broken', {'database': {'port': 'x'}})
+        self.write_layer(self.defaults, {'database': {'port': 'x'}})
+        manager.add_layer('override', {'database': {'port': 7000}})
+        self.assertEqual(manager.settings.database.port, 7000)
+        self.assertEqual(manager.get_setting(['database', 'port']), 7000)
+
+    def test_merged_view_is_precomputed(self):
+        """
+        Tests that every key path is answered from the precomputed cache.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.add_layer('defaults', self.defaults)
+        self.config_manager.add_layer('host', self.host)
+        misses = self.config_manager.cache_misses
+
+        self.assertEqual(
+            self.config_manager.get_setting(['database', 'host']), 'db1')
+        self.assertEqual(self.config_manager.get_setting(['debug']), False)
+        self.assertEqual(self.config_manager.cache_misses, misses)
+
+    def test_duplicate_layer_name(self):
+        """
+        Tests that a layer name can only be used once.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.add_layer('defaults', self.defaults)
+        with self.assertRaises(ValueError):
+            self.config_manager.add_layer('defaults', {})
+
+class TestConfigScope(unittest.TestCase):
+    """
+    Test class for context-scoped overrides.
+
+    Methods
+    -------
+    setUp
+        Sets the global configuration.
+    tearDown
+        Clears the global configuration.
+    test_scope_overrides
+        Tests that overrides apply inside the scope only.
+    test_reads_fall_through
+        Tests that keys that are not overridden come from the shared data.
+    test_nested_scopes
+        Tests that inner scopes win over outer ones.
+    test_tasks_are_isolated
+        Tests that concurrent asyncio tasks each see their own scope.
+    test_threads_are_isolated
+        Tests that other threads keep seeing the global configuration.
+    test_scope_sees_reload
+        Tests that a scope reads the configuration published after it opened.
+    test_scoped_sections_are_dicts
+        Tests that overridden sections are read as merged dicts.
+
+    """
+
+    def setUp(self):
+        """
+        Sets the global configuration.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager = ConfigManager()
+        self.config_manager.config_data = {
+            'database': {'host': 'localhost', 'port': 5432},
+            'features': {'beta': False, 'limits': {'rps': 100}},
+        }
+
+    def tearDown(self):
+        """
+        Clears the global configuration.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.config_data = {}
+
+    def test_scope_overrides(self):
+        """
+        Tests that overrides apply inside the scope only.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        with manager.scope({'database': {'host': 'tenant-db'}}):
+            self.assertEqual(manager.get_setting(['database', 'host']),
+                             'tenant-db')
+            self.assertEqual(manager.get_setting(['database']),
+                             {'host': 'tenant-db', 'port': 5432})
+        self.assertEqual(manager.get_setting(['database', 'host']), 'localhost')
+
+    def test_reads_fall_through(self):
+        """
+        Tests that keys that are not overridden come from the shared data.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        features = manager.config_data['features']
+        with manager.scope({'database': {'port': 6432}}):
+            self.assertIs(manager.get_setting(['features']), features)
+            self.assertIs(manager.config_data['features'], features)
+
+    def test_nested_scopes(self):
+        """
+        Tests that inner scopes win over outer ones.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        with manager.scope({'features': {'beta': True}}):
+            with manager.scope({'features': {'limits': {'rps': 5}}}):
+                self.assertEqual(manager.get_setting(['features']),
+                                 {'beta': True, 'limits': {'rps': 5}})
+            self.assertEqual(
+                manager.get_setting(['features', 'limits', 'rps']), 100)
+
+    def test_tasks_are_isolated(self):
+        """
+        Tests that concurrent asyncio tasks each see their own scope.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+
+        async def tenant(host):
+            with manager.scope({'database': {'host': host}}):
+                await asyncio.sleep(0.01)  # Let the other tasks run
+                return manager.get_setting(['database', 'host'])
+
+        async def main():
+            return await asyncio.gather(*(tenant(f'db-{index}')
+                                          for index in range(5)))
+
+        self.assertEqual(asyncio.run(main()),
+                         [f'db-{index}' for index in range(5)])
+
+    def test_threads_are_isolated(self):
+        """
+        Tests that other threads keep seeing the global configuration.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        seen = []
+        with manager.scope({'database': {'host': 'tenant-db'}}):
+            thread = threading.Thread(target=lambda: seen.append(
+                manager.get_setting(['database', 'host'])))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, ['localhost'])
+
+    def test_scope_sees_reload(self):
+        """
+        Tests that a scope reads the configuration published after it opened.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        with manager.scope({'database': {'host': 'tenant-db'}}):
+            manager.get_setting(['database', 'port'])
+            manager.config_data = {'database': {'host': 'new', 'port': 7000}}
+            self.assertEqual(manager.get_setting(['database', 'port']), 7000)
+            self.assertEqual(manager.get_setting(['database', 'host']),
+                             'tenant-db')
+
+    def test_scoped_sections_are_dicts(self):
+        """
+        Tests that overridden sections are read as merged dicts.
+
+        Returns
+        -------
+        None
+
+        """
+        manager = self.config_manager
+        limits = manager.config_data['features']['limits']
+        with manager.scope({'features': {'beta': True}}):
+            features = manager.get_setting(['features'])
+            self.assertIs(type(features), dict)
+            self.assertEqual(json.loads(json.dumps(features)),
+                             {'beta': True, 'limits': {'rps': 100}})
+            self.assertIs(features['limits'], limits)
+            self.assertIs(manager.get_setting(['features']), features)
+            (root, section), missing = manager.get_settings([[], ['features']])
+            self.assertEqual(missing, [])
+            self.assertIs(type(root), dict)
+            self.assertIs(section, features)
+
+class TestConfigAsync(unittest.TestCase):
+    """
+    Test class for async loading and reloading.
+
+    Methods
+    -------
+    setUp
+        Writes a configuration file to a temporary directory.
+    tearDown
+        Stops watching and removes the temporary directory.
+    write_config
+        Writes configuration data to the file.
+    test_load_config_async
+        Tests that an async load returns the published snapshot.
+    test_concurrent_loads_coalesce
+        Tests that concurrent loads of a file parse it once.
+    test_concurrent_reloads_coalesce
+        Tests that concurrent reloads parse a changed file once.
+    test_subscribe
+        Tests that subscribers receive snapshots published by any thread.
+
+    """
+
+    def setUp(self):
+        """
+        Writes a configuration file to a temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager = ConfigManager()
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'config.json')
+        self.write_config({'api': {'port': 8000}})
+
+    def tearDown(self):
+        """
+        Stops watching and removes the temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.stop_watching()
+        self.config_manager._watched_file = None
+        self.config_manager.config_data = {}
+        self.directory.cleanup()
+
+    def write_config(self, data):
+        """
+        Writes configuration data to the file through a rename.
+
+        Returns
+        -------
+        None
+
+        """
+        with open(self.filename + '.tmp', 'w') as config_file:
+            json.dump(data, config_file)
+        os.replace(self.filename + '.tmp', self.filename)
+
+    def test_load_config_async(self):
+        """
+        Tests that an async load returns the published snapshot.
+
+        Returns
+        -------
+        None
+
+        """
+        snapshot = asyncio.run(
+            self.config_manager.load_config_async(self.filename))
+        self.assertEqual(snapshot.data, {'api': {'port': 8000}})
+        self.assertEqual(self.config_manager.get_setting(['api', 'port']), 8000)
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(self.config_manager.load_config_async('missing.json'))
+
+    def test_concurrent_loads_coalesce(self):
+        """
+        Tests that concurrent loads of a file parse it once.
+
+        Returns
+        -------
+        None
+
+        """
+        async def main():
+            return await asyncio.gather(*(
+                self.config_manager.load_config_async(self.filename)
+                for _ in range(5)))
+
+        with patch.object(configuration_manager.json, 'load',
+                          wraps=json.load) as load:
+            snapshots = asyncio.run(main())
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(len({id(snapshot) for snapshot in snapshots}), 1)
+
+    def test_concurrent_reloads_coalesce(self):
+        """
+        Tests that concurrent reloads parse a changed file once.
+
+        Returns
+        -------
+        None
+
+        """
+        self.config_manager.start_watching(self.filename, interval=60)
+        self.write_config({'api': {'port': 9000}})
+
+        async def main():
+            return await asyncio.gather(*(self.config_manager.reload_async()
+                                          for _ in range(5)))
+
+        with patch.object(configuration_manager.json, 'load',
+                          wraps=json.load) as load:
+            snapshots = asyncio.run(main())
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual([snapshot.data['api']['port']
+                          for snapshot in snapshots], [9000] * 5)
+
+    def test_subscribe(self):
+        """
+        Tests that subscribers receive snapshots published by any thread.
+
+        Returns
+        -------
+        None
+
+        """
+        async def main():
+            updates = self.config_manager.subscribe()
+            first = asyncio.ensure_future(updates.__anext__())
+            await asyncio.sleep(0)  # Let the subscriber register
+            threading.Thread(target=self.config_manager.load_config,
+                             args=(self.filename,)).start()
+            snapshot = await asyncio.wait_for(first, timeout=2)
+            await updates.aclose()
+            return snapshot
+
+        snapshot = asyncio.run(main())
+        self.assertEqual(snapshot.data, {'api': {'port': 8000}})
+        self.assertEqual(self.config_manager._subscribers, set())
+
+class TestConfigMeta(unittest.TestCase):
+    """
+    Test class for ConfigMeta.
+
+    This class tests that the metaclass creates exactly one instance when many
+    threads ask for it at the same time.
+
+    Methods
+    -------
+    test_threads_share_one_instance
+        Tests that racing threads all get the single instance, created once.
+    test_nested_singletons
+        Tests that a singleton may create another singleton in __init__.
+
+    """
+
+    def test_threads_share_one_instance(self):
+        """
+        Tests that racing threads all get the single instance, created once.
+
+        A class with a slow __init__ widens the window in which threads could
+        each create an instance without the creation lock.
+
+        Returns
+        -------
+        None
+
+        """
+        created = []
+
+        class SlowSingleton(metaclass=ConfigMeta):
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.05)
+
+        barrier = threading.Barrier(8)
+        instances = []
+
+        def worker():
+            barrier.wait()
+            instances.append(SlowSingleton())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ConfigMeta._instances.pop(SlowSingleton)
+
+        self.assertEqual(len(created), 1)
+        self.assertTrue(all(instance is created[0] for instance in instances))
+
+    def test_nested_singletons(self):
+        """
+        Tests that a singleton may create another singleton in __init__.
+
+        The creation runs in a thread, so a deadlock fails the test instead
+        of hanging it.
+
+        Returns
+        -------
+        None
+
+        """
+        class Inner(metaclass=ConfigMeta):
+            pass
+
+        class Outer(metaclass=ConfigMeta):
+            def __init__(self):
+                self.inner = Inner()
+
+        instances = []
+        thread = threading.Thread(target=lambda: instances.append(Outer()),
+                                  daemon=True)
+        thread.start()
+        thread.join(timeout=2)
+        self.assertFalse(thread.is_alive(), 'Nested creation deadlocked')
+        self.assertIs(instances[0], Outer())
+        self.assertIs(instances[0].inner, Inner())
+        ConfigMeta._instances.pop(Outer)
+        ConfigMeta._instances.pop(Inner)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,142 @@
+"""
+Test for Lazy JSON Module
+
+This script tests the lazy_json module, which parses the values of JSON
+objects only when they are first accessed.
+
+Classes
+-------
+TestLazyJSONObject
+    Inherits from unittest.TestCase and contains test methods.
+
+Global functions
+----------------
+None
+
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from lazy_json import LazyJSONObject, load_lazy
+
+DOCUMENT = {
+    'database': {'host': 'localhost', 'port': 5432, 'tags': ['a', '}', '"']},
+    'routes': [{'path': '/{id}', 'weight': 1.5}, None, True],
+    'name': 'quote " and \\\\ backslash',
+    'empty': {},
+    'ünicode': -1e3,
+}
+
+class TestLazyJSONObject(unittest.TestCase):
+    """
+    Test class for LazyJSONObject.
+
+    Methods
+    -------
+    test_matches_json_load
+        Tests that the lazy object equals a fully parsed document.
+    test_values_parsed_on_access
+        Tests that values are only parsed when accessed.
+    test_nested_depth
+        Tests that nested objects stay lazy up to the depth.
+    test_load_lazy_file
+        Tests loading a memory-mapped file.
+    test_malformed_documents
+        Tests that malformed documents are rejected.
+
+    """
+
+    def setUp(self):
+        """
+        Encodes the sample document with irregular whitespace.
+
+        Returns
+        -------
+        None
+
+        """
+        self.buffer = json.dumps(DOCUMENT, indent=3, ensure_ascii=False).encode()
+
+    def test_matches_json_load(self):
+        """
+        Tests that the lazy object equals a fully parsed document.
+
+        Returns
+        -------
+        None
+
+        """
+        lazy = LazyJSONObject(self.buffer)
+        self.assertEqual(lazy, DOCUMENT)
+        self.assertEqual(LazyJSONObject(self.buffer, depth=3).to_dict(), DOCUMENT)
+        self.assertEqual(LazyJSONObject(memoryview(self.buffer)), DOCUMENT)
+
+    def test_values_parsed_on_access(self):
+        """
+        Tests that values are only parsed when accessed.
+
+        Returns
+        -------
+        None
+
+        """
+        lazy = LazyJSONObject(self.buffer)
+        self.assertEqual(len(lazy), 5)
+        self.assertIn('routes', lazy)
+        self.assertEqual(lazy._values, {})
+        self.assertEqual(lazy['database']['port'], 5432)
+        self.assertEqual(list(lazy._values), ['database'])
+        self.assertIs(lazy['database'], lazy['database'])
+        with self.assertRaises(KeyError):
+            lazy['missing']
+
+    def test_nested_depth(self):
+        """
+        Tests that nested objects stay lazy up to the depth.
+
+        Returns
+        -------
+        None
+
+        """
+        lazy = LazyJSONObject(self.buffer, depth=2)
+        self.assertIsInstance(lazy['database'], LazyJSONObject)
+        self.assertIsInstance(lazy['routes'], list)
+        self.assertEqual(lazy['database']['tags'], ['a', '}', '"'])
+
+    def test_load_lazy_file(self):
+        """
+        Tests loading a memory-mapped file.
+
+        Returns
+        -------
+        None
+
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'config.json')
+            with open(filename, 'wb') as config_file:
+                config_file.write(self.buffer)
+            lazy = load_lazy(filename)
+            self.assertEqual(lazy['name'], DOCUMENT['name'])
+            del lazy  # Release the mapping before the directory is removed
+
+    def test_malformed_documents(self):
+        """
+        Tests that malformed documents are rejected.
+
+        Returns
+        -------
+        None
+
+        """
+        for document in (b'[1, 2]', b'{"a" 1}', b'{"a": 1,', b'{"a": "1}',
+                         b'{"a": [1, 2}', b'{"a": 1 "b": 2}'):
+            with self.assertRaises(ValueError, msg=document):
+                LazyJSONObject(document)._entries()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+Test for Shared Configuration Module
+
+This script tests the shared_config module, which publishes a configuration
+for other processes to attach to through a read-only memory mapping.
+
+Classes
+-------
+TestSharedConfig
+    Inherits from unittest.TestCase and contains test methods.
+
+Global functions
+----------------
+read_setting(path, keys)
+    Reads a setting of a published configuration in a worker process.
+
+"""
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from shared_config import SharedJSONObject, attach, publish, shared_path
+
+DOCUMENT = {
+    'database': {'host': 'localhost', 'port': 5432, 'replicas': []},
+    'routes': [{'path': '/{id}'}, None, True],
+    'name': 'quote " and \\ backslash',
+    'empty': {},
+    'ünicode': -1e3,
+    'b': 1, 'a': 2, 'ab': 3, 'B': 4,
+}
+
+def read_setting(path, keys):
+    """Reads a setting of a published configuration in a worker process."""
+    value = attach(path)
+    for key in keys:
+        value = value[key]
+    return value
+
+class TestSharedConfig(unittest.TestCase):
+    """
+    Test class for the shared_config module.
+
+    Methods
+    -------
+    setUp
+        Publishes the test document to a temporary directory.
+    tearDown
+        Removes the temporary directory.
+    test_round_trip
+        Tests that the attached configuration equals the published one.
+    test_lookup
+        Tests key lookups, nested objects and missing keys.
+    test_other_process
+        Tests that another process reads the published configuration.
+    test_republish
+        Tests that attached mappings keep the version they attached to.
+    test_invalid_data
+        Tests that non-mappings and non-str keys cannot be published.
+    test_invalid_file
+        Tests that other files cannot be attached to.
+    test_shared_path
+        Tests the default location of published configurations.
+
+    """
+
+    def setUp(self):
+        """
+        Publishes the test document to a temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.config')
+        publish(DOCUMENT, self.path)
+
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+
+        Returns
+        -------
+        None
+
+        """
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+        Tests that the attached configuration equals the published one.
+
+        Returns
+        -------
+        None
+
+        """
+        shared = attach(self.path)
+        self.assertEqual(shared.to_dict(), DOCUMENT)
+        self.assertEqual(shared, DOCUMENT)
+        self.assertEqual(len(shared), len(DOCUMENT))
+
+    def test_lookup(self):
+        """
+        Tests key lookups, nested objects and missing keys.
+
+        Returns
+        -------
+        None
+
+        """
+        shared = attach(self.path)
+        for key, value in DOCUMENT.items():
+            self.assertEqual(shared[key], value)
+        self.assertIsInstance(shared['database'], SharedJSONObject)
+        self.assertEqual(shared['database']['port'], 5432)
+        for missing in ('', 'c', 'databasf', 1, None):
+            self.assertNotIn(missing, shared)
+        with self.assertRaises(KeyError):
+            shared['database']['user']
+
+    def test_other_process(self):
+        """
+        Tests that another process reads the published configuration.
+
+        Returns
+        -------
+        None
+
+        """
+        with ProcessPoolExecutor(1) as executor:
+            port = executor.submit(read_setting, self.path,
+                                   ['database', 'port']).result()
+        self.assertEqual(port, 5432)
+
+    def test_republish(self):
+        """
+        Tests that attached mappings keep the version they attached to.
+
+        Returns
+        -------
+        None
+
+        """
+        shared = attach(self.path)
+        publish({'database': {'port': 6432}}, self.path)
+        self.assertEqual(shared['database']['port'], 5432)
+        self.assertEqual(attach(self.path)['database']['port'], 6432)
+
+    def test_invalid_data(self):
+        """
+        Tests that non-mappings and non-str keys cannot be published.
+
+        Returns
+        -------
+        None
+
+        """
+        with self.assertRaises(TypeError):
+            publish([1, 2], self.path)
+        with self.assertRaises(TypeError):
+            publish({'ports': {1: 'a'}}, self.path)
+        self.assertEqual(os.listdir(self.directory.name), ['test.config'])
+        self.assertEqual(attach(self.path), DOCUMENT)
+
+    def test_invalid_file(self):
+        """
+        Tests that other files cannot be attached to.
+
+        Returns
+        -------
+        None
+
+        """
+        for content in (b'', b'{"database": {"port": 5432}}'):
+            with open(self.path, 'wb') as other_file:
+                other_file.write(content)
+            with self.assertRaises(ValueError):
+                attach(self.path)
+
+    def test_shared_path(self):
+        """
+        Tests the default location of published configurations.
+
+        Returns
+        -------
+        None
+
+        """
+        path = shared_path('service')
+        self.assertEqual(os.path.basename(path), 'service.config')
+        self.assertTrue(os.path.isdir(os.path.dirname(path)))
+
+if __name__ == '__main__':
+    unittest.main()
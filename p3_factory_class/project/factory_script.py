@@ -28,9 +28,14 @@ Bicycle(Vehicle):
     A concrete vehicle class representing a bicycle with a 'get_name' method
     returning the name 'Bicycle'.
 
+VehiclePool:
+    The shared instances of stateless vehicle classes and the released
+    instances of stateful ones, with hit-rate statistics.
+
 VehicleFactory:
     A class for creating different types of vehicles based on input parameters.
-    It includes a 'create_vehicle' method to instantiate specific vehicle types.
+    It includes a 'create_vehicle' method to instantiate specific vehicle types
+    through a registry that vehicle classes and plugins add themselves to.
 
 Main Function
 -------------
@@ -42,14 +47,32 @@ Usage
 -----
 Run this script as an example of Factory Design.
 
-TODO : Make VehicleType and VehicleFactory adhere to Open/Close from SOLID.
-Currently modifications to these classes are needed to be made incase of adding more
-vehicle concrete classes.
+Registry
+--------
+VehicleFactory dispatches with one dictionary lookup. Vehicle subclasses
+register themselves when they are defined, with a 'vehicle_type' class
+keyword, and other classes with the VehicleFactory.register decorator, so
+adding a vehicle needs no change to VehicleType or VehicleFactory. Plugins
+installed as packages can also declare vehicles as entry points in the
+'vehicle_factory.vehicles' group; they are only imported when they are
+first requested.
+
+Pooling
+-------
+VehicleFactory.enable_pooling makes the factory reuse vehicles instead of
+allocating one per call. Stateless vehicle classes, such as Car, Motorcycle
+and Bicycle, have one shared immutable instance (a flyweight) returned by
+every create_vehicle call. Stateful vehicles are reused explicitly: acquire
+takes one from the pool, and release resets it and returns it, up to a
+limited number of instances per class.
 
 """
 
 from abc import ABC, abstractmethod
 from enum import Enum, auto
+from importlib import metadata
+
+ENTRY_POINT_GROUP = 'vehicle_factory.vehicles'
 
 
 class VehicleType(Enum):
@@ -83,60 +106,214 @@ class Vehicle(ABC):
     This abstract class defines a contract for vehicle classes, requiring them
     to implement the 'get_name' method.
 
+    Subclasses given a 'vehicle_type' class keyword register themselves in
+    VehicleFactory, for example 'class Truck(Vehicle, vehicle_type="truck")'.
+
+    Vehicles are stateful unless their class sets 'stateless' to True. The
+    instances of a stateless class are interchangeable, so VehicleFactory
+    may share one between all callers when pooling is enabled; such classes
+    should declare empty '__slots__' so that their instances are immutable.
+
+    Attributes
+    ----------
+    stateless : bool
+        Whether the instances of the class hold no state of their own.
+
     Methods
     -------
     get_name(self)
         Abstract method to get the name of the vehicle.
+    reset(self)
+        Restore the initial state of a pooled vehicle before it is reused.
     """
+    __slots__ = ()
+    stateless = False
+
+    def __init_subclass__(cls, vehicle_type=None, **kwargs):
+        """Register the subclass in VehicleFactory if given a vehicle type."""
+        super().__init_subclass__(**kwargs)
+        if vehicle_type is not None:
+            VehicleFactory.register(vehicle_type)(cls)
+
     @abstractmethod
     def get_name(self):  # Requirement
         """Set requirement for method of same name."""
         pass
 
-# Create concrete vehicle classes (Car, Motorcycle, Bicycle)
-# Concrete = inherits from abstract with actual code
+    def reset(self):
+        """Restore the initial state before reuse; nothing by default."""
+        pass
 
+# Create a pool of reusable vehicles
 
-class Car(Vehicle):
+
+class VehiclePool:
     """
-    Concrete Car class.
+    Vehicle Pool class.
+
+    This class keeps one shared instance per stateless vehicle class and a
+    limited number of released instances per stateful vehicle class, and
+    counts how many requests it serves without creating a vehicle.
+
+    Attributes
+    ----------
+    max_size : int
+        The most released instances kept per stateful vehicle class.
+    hits : int
+        The requests served with an existing vehicle.
+    misses : int
+        The requests that created a new vehicle.
+    discarded : int
+        The released vehicles dropped because their pool was full.
+
+    Methods
+    -------
+    create(self, vehicle_class)
+        Return the shared instance of a stateless class, else a new vehicle.
+    acquire(self, vehicle_class)
+        Return a pooled or shared vehicle, creating one if none is free.
+    release(self, vehicle)
+        Reset an acquired vehicle and keep it for reuse.
+    stats(self)
+        Return the pool statistics.
 
-    This class represents a concrete car and implements the 'get_name' method
-    to return the name 'Car'. Inherits from abstract class Vechicle.
     """
+    def __init__(self, max_size=64):
+        """
+        Initialize an empty pool.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The most released instances kept per stateful vehicle class.
+
+        Raises
+        ------
+        ValueError
+            If 'max_size' is negative.
 
-    def get_name(self):
-        """Get name of the vehicle
         """
-        return "Car"
+        if max_size < 0:
+            raise ValueError(f'The pool size : "{max_size}" is invalid.')
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self._shared = {}  # Stateless class -> its one instance
+        self._free = {}  # Stateful class -> released instances
+        # Id -> acquired stateful instance, kept alive so its id is not reused
+        self._in_use = {}
+
+    def create(self, vehicle_class):
+        """
+        Return the shared instance of a stateless class, else a new vehicle.
 
+        Parameters
+        ----------
+        vehicle_class : type
+            The class of the vehicle.
 
-class Motorcycle(Vehicle):
-    """
-    Concrete Motorcycle class.
+        Returns
+        -------
+        Vehicle
+            The vehicle.
 
-    This class represents a concrete motorcycle and implements the 'get_name'
-    method to return the name 'Motorcycle'. Inherits from abstract class Vechicle.
-    """
+        """
+        vehicle = self._shared.get(vehicle_class)
+        if vehicle is not None:
+            self.hits += 1
+            return vehicle
+        self.misses += 1
+        vehicle = vehicle_class()
+        if getattr(vehicle_class, 'stateless', False):
+            self._shared[vehicle_class] = vehicle
+        return vehicle
+
+    def acquire(self, vehicle_class):
+        """
+        Return a pooled or shared vehicle, creating one if none is free.
+
+        Parameters
+        ----------
+        vehicle_class : type
+            The class of the vehicle.
+
+        Returns
+        -------
+        Vehicle
+            The vehicle, owned by the caller until it is released.
 
-    def get_name(self):
-        """Get name of the vehicle
         """
-        return "Motorcycle"
+        free = self._free.get(vehicle_class)
+        if free:
+            self.hits += 1
+            vehicle = free.pop()
+        else:
+            vehicle = self.create(vehicle_class)
+            if self._shared.get(vehicle_class) is vehicle:
+                return vehicle
+        self._in_use[id(vehicle)] = vehicle
+        return vehicle
+
+    def release(self, vehicle):
+        """
+        Reset an acquired vehicle and keep it for reuse.
 
+        Shared instances of stateless classes are left as they are. A vehicle
+        must not be used after it is released.
 
-class Bicycle(Vehicle):
-    """
-    Concrete Bicycle class.
+        Parameters
+        ----------
+        vehicle : Vehicle
+            A vehicle returned by acquire.
 
-    This class represents a concrete bicycle and implements the 'get_name'
-    method to return the name 'Bicycle'. Inherits from abstract class Vechicle.
-    """
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the vehicle is not acquired: it was already released, or it
+            was never returned by acquire.
 
-    def get_name(self):
-        """Get name of the vehicle
         """
-        return "Bicycle"
+        vehicle_class = type(vehicle)
+        if self._shared.get(vehicle_class) is vehicle:
+            return
+        if self._in_use.get(id(vehicle)) is not vehicle:
+            raise ValueError(f'The vehicle : "{vehicle!r}" was not acquired '
+                             f'from the pool.')
+        del self._in_use[id(vehicle)]
+        free = self._free.setdefault(vehicle_class, [])
+        if len(free) >= self.max_size:
+            self.discarded += 1
+            return
+        reset = getattr(vehicle, 'reset', None)
+        if reset is not None:
+            reset()
+        free.append(vehicle)
+
+    def stats(self):
+        """
+        Return the pool statistics.
+
+        Returns
+        -------
+        dict
+            'hits', 'misses', 'discarded', 'hit_rate' (hits per request, 0.0
+            before any request), 'shared' (the number of shared instances)
+            'pooled' (the number of released instances kept) and 'in_use'
+            (the number of acquired instances not released yet).
+
+        """
+        requests = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'discarded': self.discarded,
+                'hit_rate': self.hits / requests if requests else 0.0,
+                'shared': len(self._shared),
+                'pooled': sum(map(len, self._free.values())),
+                'in_use': len(self._in_use)}
 
 # Create a VehicleFactory class
 
@@ -146,24 +323,93 @@ class VehicleFactory:
     Vehicle Factory class.
 
     This class creates different types of vehicles based on the input
-    of the user.
+    of the user. Vehicle classes are kept in a registry keyed by VehicleType
+    member or by name, so creating a vehicle is one dictionary lookup
+    however many types are registered.
+
+    Pooling is off by default, and every call creates a new vehicle.
+
+    Attributes
+    ----------
+    registry : dict
+        The registered vehicle classes, keyed by VehicleType member or name.
+    pool : VehiclePool or None
+        The pool of reusable vehicles, while pooling is enabled.
 
     Methods
     -------
+    register(vehicle_type)
+        Return a class decorator registering a vehicle class.
     create_vehicle(vehicle_type)
         Create a vehicle instance based on the provided 'vehicle_type'.
+    available_types()
+        List the registered and installed vehicle types.
+    enable_pooling(max_size=64)
+        Reuse vehicles instead of creating one per call.
+    disable_pooling()
+        Create a new vehicle on every call again.
+    acquire(vehicle_type)
+        Return a vehicle owned by the caller until it is released.
+    release(vehicle)
+        Return an acquired vehicle for reuse.
 
     """
-    @staticmethod
-    def create_vehicle(vehicle_type):
+    registry = {}
+    pool = None
+    _entry_points = None  # Name -> entry point, read on the first miss
+
+    @classmethod
+    def register(cls, vehicle_type):
+        """
+        Return a class decorator registering a vehicle class.
+
+        Parameters
+        ----------
+        vehicle_type : VehicleType or str
+            The key the class is created by.
+
+        Returns
+        -------
+        callable
+            A decorator registering the class and returning it unchanged.
+
+        Raises
+        ------
+        ValueError
+            If another class is already registered for 'vehicle_type'.
+
+        """
+        def decorator(vehicle_class):
+            registered = cls.registry.setdefault(vehicle_type, vehicle_class)
+            if registered is not vehicle_class:
+                raise ValueError(f'The vehicle type : "{str(vehicle_type)}" '
+                                 f'is already registered.')
+            return vehicle_class
+        return decorator
+
+    @classmethod
+    def _load_entry_point(cls, vehicle_type):
+        """Import and register the plugin of a vehicle type, if installed."""
+        if cls._entry_points is None:
+            cls._entry_points = {entry_point.name: entry_point for entry_point
+                                 in metadata.entry_points(group=ENTRY_POINT_GROUP)}
+        entry_point = cls._entry_points.get(vehicle_type)
+        if entry_point is None:
+            return None
+        vehicle_class = entry_point.load()
+        return cls.registry.setdefault(vehicle_type, vehicle_class)
+
+    @classmethod
+    def create_vehicle(cls, vehicle_type):
         """
         Create a vehicle instance based on the provided 'vehicle_type'.
 
         Parameters
         ----------
-        vehicle_type : VehicleType
+        vehicle_type : VehicleType or str
             The type of vehicle to create, specified as a member of the
-            VehicleType enumeration.
+            VehicleType enumeration or as the name of a registered or
+            installed vehicle.
 
         Returns
         -------
@@ -175,15 +421,190 @@ class VehicleFactory:
         ValueError
             If the provided 'vehicle_type' is invalid.
 
+        With pooling enabled, stateless vehicle types return their shared
+        instance.
+
+        """
+        try:
+            vehicle_class = cls.registry[vehicle_type]
+        except (KeyError, TypeError):
+            vehicle_class = cls._vehicle_class(vehicle_type)
+        if cls.pool is not None:
+            return cls.pool.create(vehicle_class)
+        return vehicle_class()
+
+    @classmethod
+    def _vehicle_class(cls, vehicle_type):
+        """Return the class of a vehicle type, loading its plugin if needed."""
+        try:
+            return cls.registry[vehicle_type]
+        except KeyError:
+            vehicle_class = (cls._load_entry_point(vehicle_type)
+                             if isinstance(vehicle_type, str) else None)
+        except TypeError:  # Unhashable, so never registered
+            vehicle_class = None
+        if vehicle_class is None:
+            raise ValueError(
+                f'The vehicle type : "{str(vehicle_type)}" is invalid.')
+        return vehicle_class
+
+    @classmethod
+    def available_types(cls):
         """
-        if vehicle_type == VehicleType.CAR:
-            return Car()
-        if vehicle_type == VehicleType.BICYCLE:
-            return Bicycle()
-        if vehicle_type == VehicleType.MOTORCYCLE:
-            return Motorcycle()
-        raise ValueError(
-            f'The vehicle type : "{str(vehicle_type)}" is invalid.')
+        List the registered and installed vehicle types.
+
+        Installed plugins are listed without being imported.
+
+        Returns
+        -------
+        list
+            The VehicleType members and names vehicles can be created by.
+
+        """
+        cls._load_entry_point(None)  # Reads the entry points once
+        return list(cls.registry) + [name for name in cls._entry_points
+                                     if name not in cls.registry]
+
+    @classmethod
+    def enable_pooling(cls, max_size=64):
+        """
+        Reuse vehicles instead of creating one per call.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The most released instances kept per stateful vehicle class.
+
+        Returns
+        -------
+        VehiclePool
+            The new pool, which also holds the hit-rate statistics.
+
+        Raises
+        ------
+        ValueError
+            If 'max_size' is negative.
+
+        """
+        cls.pool = VehiclePool(max_size)
+        return cls.pool
+
+    @classmethod
+    def disable_pooling(cls):
+        """
+        Create a new vehicle on every call again.
+
+        Returns
+        -------
+        None
+
+        """
+        cls.pool = None
+
+    @classmethod
+    def acquire(cls, vehicle_type):
+        """
+        Return a vehicle owned by the caller until it is released.
+
+        Parameters
+        ----------
+        vehicle_type : VehicleType or str
+            The type of vehicle, as for 'create_vehicle'.
+
+        Returns
+        -------
+        Vehicle
+            A released vehicle of that type if the pool holds one, the shared
+            instance of a stateless type, or else a new vehicle.
+
+        Raises
+        ------
+        ValueError
+            If the provided 'vehicle_type' is invalid.
+
+        """
+        vehicle_class = cls._vehicle_class(vehicle_type)
+        if cls.pool is None:
+            return vehicle_class()
+        return cls.pool.acquire(vehicle_class)
+
+    @classmethod
+    def release(cls, vehicle):
+        """
+        Return an acquired vehicle for reuse.
+
+        The vehicle is reset and kept if its pool is not full. Without
+        pooling, nothing is kept.
+
+        Parameters
+        ----------
+        vehicle : Vehicle
+            A vehicle returned by 'acquire'.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If pooling is enabled and the vehicle was already released or
+            never acquired from the pool.
+
+        """
+        if cls.pool is not None:
+            cls.pool.release(vehicle)
+
+# Create concrete vehicle classes (Car, Motorcycle, Bicycle)
+# Concrete = inherits from abstract with actual code
+
+
+class Car(Vehicle, vehicle_type=VehicleType.CAR):
+    """
+    Concrete Car class.
+
+    This class represents a concrete car and implements the 'get_name' method
+    to return the name 'Car'. Inherits from abstract class Vechicle.
+    """
+    __slots__ = ()
+    stateless = True
+
+    def get_name(self):
+        """Get name of the vehicle
+        """
+        return "Car"
+
+
+class Motorcycle(Vehicle, vehicle_type=VehicleType.MOTORCYCLE):
+    """
+    Concrete Motorcycle class.
+
+    This class represents a concrete motorcycle and implements the 'get_name'
+    method to return the name 'Motorcycle'. Inherits from abstract class Vechicle.
+    """
+    __slots__ = ()
+    stateless = True
+
+    def get_name(self):
+        """Get name of the vehicle
+        """
+        return "Motorcycle"
+
+
+class Bicycle(Vehicle, vehicle_type=VehicleType.BICYCLE):
+    """
+    Concrete Bicycle class.
+
+    This class represents a concrete bicycle and implements the 'get_name'
+    method to return the name 'Bicycle'. Inherits from abstract class Vechicle.
+    """
+    __slots__ = ()
+    stateless = True
+
+    def get_name(self):
+        """Get name of the vehicle
+        """
+        return "Bicycle"
 
 # Example :
 
@@ -23,6 +23,12 @@ TestBicycle(unittest.TestCase):
 TestVehicleFactory(unittest.TestCase):
     A test case class for testing the VehicleFactory class.
 
+TestVehicleRegistry(unittest.TestCase):
+    A test case class for testing the registry of the VehicleFactory class.
+
+TestVehiclePool(unittest.TestCase):
+    A test case class for testing the pooling of the VehicleFactory class.
+
 TestVehicleFactoryScript(unittest.TestCase):
     A test case class for testing the main function of the script.
 
@@ -32,10 +38,10 @@ None
 """
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from io import StringIO
 from factory_script import VehicleFactory, VehicleType, Car, Motorcycle, Bicycle
-from factory_script import main
+from factory_script import Vehicle, VehiclePool, main
 
 class TestVehicleTypeEnum(unittest.TestCase):
     """
@@ -151,6 +157,223 @@ class TestVehicleFactory(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.factory.create_vehicle('invalid_type')
 
+class TestVehicleRegistry(unittest.TestCase):
+    """
+    TestVehicleRegistry Class
+
+    A test case class for testing the registry of the VehicleFactory class.
+
+    Methods
+    -------
+    setUp(self):
+        Save the registry before each test method.
+    tearDown(self):
+        Restore the registry after each test method.
+    test_subclass_registration(self):
+        Test that a subclass given a vehicle type registers itself.
+    test_decorator_registration(self):
+        Test registering a class with the 'register' decorator.
+    test_duplicate_registration(self):
+        Test that a vehicle type cannot be registered twice.
+    test_unhashable_vehicle_type(self):
+        Test that an unhashable vehicle type is invalid.
+    test_entry_point_is_lazy(self):
+        Test that a plugin is only imported when first requested.
+    """
+    def setUp(self) -> None:
+        """Save the registry before each test method."""
+        self.registry = VehicleFactory.registry.copy()
+
+    def tearDown(self) -> None:
+        """Restore the registry after each test method."""
+        VehicleFactory.registry = self.registry
+        VehicleFactory._entry_points = None
+
+    def test_subclass_registration(self):
+        """Test that a subclass given a vehicle type registers itself."""
+        class Truck(Vehicle, vehicle_type='truck'):
+            def get_name(self):
+                return 'Truck'
+
+        self.assertIsInstance(VehicleFactory.create_vehicle('truck'), Truck)
+        self.assertIn('truck', VehicleFactory.registry)
+
+    def test_decorator_registration(self):
+        """Test registering a class with the 'register' decorator."""
+        @VehicleFactory.register('bus')
+        class Bus:
+            def get_name(self):
+                return 'Bus'
+
+        self.assertEqual(VehicleFactory.create_vehicle('bus').get_name(), 'Bus')
+
+    def test_duplicate_registration(self):
+        """Test that a vehicle type cannot be registered twice."""
+        with self.assertRaises(ValueError):
+            VehicleFactory.register(VehicleType.CAR)(Bicycle)
+        self.assertIs(VehicleFactory.registry[VehicleType.CAR], Car)
+
+    def test_unhashable_vehicle_type(self):
+        """Test that an unhashable vehicle type is invalid."""
+        with self.assertRaises(ValueError) as context:
+            VehicleFactory.create_vehicle(['car'])
+        self.assertEqual(str(context.exception),
+                         'The vehicle type : "[\'car\']" is invalid.')
+
+    def test_entry_point_is_lazy(self):
+        """Test that a plugin is only imported when first requested."""
+        entry_point = Mock()
+        entry_point.name = 'tandem'
+        entry_point.load.return_value = Bicycle
+        with patch('factory_script.metadata.entry_points',
+                   return_value=[entry_point]) as entry_points:
+            self.assertIn('tandem', VehicleFactory.available_types())
+            entry_point.load.assert_not_called()
+
+            self.assertIsInstance(VehicleFactory.create_vehicle('tandem'),
+                                  Bicycle)
+            self.assertIsInstance(VehicleFactory.create_vehicle('tandem'),
+                                  Bicycle)
+            with self.assertRaises(ValueError):
+                VehicleFactory.create_vehicle('hj')
+        entry_point.load.assert_called_once()
+        entry_points.assert_called_once()
+
+class Trailer(Vehicle):
+    """A stateful vehicle for the pool tests."""
+    def __init__(self):
+        self.cargo = []
+
+    def get_name(self):
+        return 'Trailer'
+
+    def reset(self):
+        self.cargo.clear()
+
+class TestVehiclePool(unittest.TestCase):
+    """
+    TestVehiclePool Class
+
+    A test case class for testing the pooling of the VehicleFactory class.
+
+    Methods
+    -------
+    setUp(self):
+        Register a stateful vehicle and enable pooling before each test method.
+    tearDown(self):
+        Disable pooling and unregister the vehicle after each test method.
+    test_pooling_is_opt_in(self):
+        Test that vehicles are not shared while pooling is disabled.
+    test_stateless_vehicles_are_shared(self):
+        Test that stateless vehicles are shared and immutable.
+    test_stateful_vehicles_are_not_shared(self):
+        Test that create_vehicle creates new stateful vehicles.
+    test_acquire_release(self):
+        Test that released vehicles are reset and reused.
+    test_pool_size_limit(self):
+        Test that a full pool discards released vehicles.
+    test_release_checks_ownership(self):
+        Test that vehicles not acquired cannot be released.
+    test_dropped_vehicle_stays_acquired(self):
+        Test that the id of a dropped acquired vehicle is not reused.
+    test_stats(self):
+        Test the hit-rate statistics.
+    test_invalid(self):
+        Test invalid pool sizes and vehicle types.
+    """
+    def setUp(self) -> None:
+        """Register a stateful vehicle and enable pooling before each test."""
+        VehicleFactory.register('trailer')(Trailer)
+        self.pool = VehicleFactory.enable_pooling(max_size=2)
+
+    def tearDown(self) -> None:
+        """Disable pooling and unregister the vehicle after each test."""
+        VehicleFactory.disable_pooling()
+        del VehicleFactory.registry['trailer']
+
+    def test_pooling_is_opt_in(self):
+        """Test that vehicles are not shared while pooling is disabled."""
+        VehicleFactory.disable_pooling()
+        self.assertIsNot(VehicleFactory.create_vehicle(VehicleType.CAR),
+                         VehicleFactory.create_vehicle(VehicleType.CAR))
+        trailer = VehicleFactory.acquire('trailer')
+        VehicleFactory.release(trailer)
+        self.assertIsNot(VehicleFactory.acquire('trailer'), trailer)
+
+    def test_stateless_vehicles_are_shared(self):
+        """Test that stateless vehicles are shared and immutable."""
+        car = VehicleFactory.create_vehicle(VehicleType.CAR)
+        self.assertIs(VehicleFactory.create_vehicle(VehicleType.CAR), car)
+        self.assertIs(VehicleFactory.acquire(VehicleType.CAR), car)
+        self.assertIsNot(VehicleFactory.create_vehicle(VehicleType.BICYCLE),
+                         car)
+        with self.assertRaises(AttributeError):
+            car.color = 'red'
+        VehicleFactory.release(car)
+        self.assertEqual(self.pool.stats()['pooled'], 0)
+
+    def test_stateful_vehicles_are_not_shared(self):
+        """Test that create_vehicle creates new stateful vehicles."""
+        self.assertIsNot(VehicleFactory.create_vehicle('trailer'),
+                         VehicleFactory.create_vehicle('trailer'))
+
+    def test_acquire_release(self):
+        """Test that released vehicles are reset and reused."""
+        trailer = VehicleFactory.acquire('trailer')
+        other = VehicleFactory.acquire('trailer')
+        self.assertIsNot(trailer, other)
+        trailer.cargo.append('hay')
+        VehicleFactory.release(trailer)
+        self.assertIs(VehicleFactory.acquire('trailer'), trailer)
+        self.assertEqual(trailer.cargo, [])
+
+    def test_pool_size_limit(self):
+        """Test that a full pool discards released vehicles."""
+        trailers = [VehicleFactory.acquire('trailer') for _ in range(3)]
+        for trailer in trailers:
+            VehicleFactory.release(trailer)
+        self.assertEqual(self.pool.stats()['pooled'], 2)
+        self.assertEqual(self.pool.discarded, 1)
+
+    def test_release_checks_ownership(self):
+        """Test that vehicles not acquired cannot be released."""
+        trailer = VehicleFactory.acquire('trailer')
+        VehicleFactory.release(trailer)
+        with self.assertRaises(ValueError):
+            VehicleFactory.release(trailer)
+        with self.assertRaises(ValueError):
+            VehicleFactory.release(VehicleFactory.create_vehicle('trailer'))
+        self.assertIsNot(VehicleFactory.acquire('trailer'),
+                         VehicleFactory.acquire('trailer'))
+
+    def test_dropped_vehicle_stays_acquired(self):
+        """Test that the id of a dropped acquired vehicle is not reused."""
+        for _ in range(8):
+            VehicleFactory.acquire('trailer')  # Never released
+            with self.assertRaises(ValueError):
+                VehicleFactory.release(VehicleFactory.create_vehicle('trailer'))
+        self.assertEqual(self.pool.stats()['in_use'], 8)
+
+    def test_stats(self):
+        """Test the hit-rate statistics."""
+        self.assertEqual(self.pool.stats()['hit_rate'], 0.0)
+        for _ in range(4):
+            VehicleFactory.create_vehicle(VehicleType.CAR)
+        VehicleFactory.release(VehicleFactory.acquire('trailer'))
+        VehicleFactory.acquire('trailer')
+        self.assertEqual(self.pool.stats(), {
+            'hits': 4, 'misses': 2, 'discarded': 0, 'hit_rate': 4 / 6,
+            'shared': 1, 'pooled': 0, 'in_use': 1})
+
+    def test_invalid(self):
+        """Test invalid pool sizes and vehicle types."""
+        with self.assertRaises(ValueError):
+            VehiclePool(max_size=-1)
+        with self.assertRaises(ValueError) as context:
+            VehicleFactory.acquire('hj')
+        self.assertEqual(str(context.exception),
+                         'The vehicle type : "hj" is invalid.')
+
 class TestVehicleFactoryScript(unittest.TestCase):
     """
     TestVehicleFactoryScript Class
@@ -9,6 +9,10 @@ TemperatureSensorAdapter.
 
 Classes
 -------
+SensorHistory:
+    A fixed-capacity ring buffer of timestamped readings with rolling
+    statistics.
+
 CelsiusTemperatureSensor:
     A class representing a temperature sensor providing readings in Celsius.
 
@@ -33,6 +37,13 @@ if __name__ == "__main__":
     Initializes the temperature sensors, creates an adapter, displays
     temperatures, and runs tests.
 
+Notes
+-----
+NumPy is optional. When it is installed, the batch conversion of
+TemperatureSensorAdapter runs as vectorized ufuncs on NumPy arrays and on
+any other buffer of doubles (such as array('d')); otherwise buffers of
+doubles are converted in a single loop over memoryviews.
+
 Usage
 -----
 Run this script to demonstrate the Adapter Design Pattern for temperature
@@ -40,6 +51,185 @@ sensors.
 
 """
 
+import time
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, see fahrenheit_to_celsius_batch
+    np = None
+
+ROUNDING_BLOCK = 4096  # Readings rounded per block of the NumPy batch path
+
+
+class SensorHistory:
+    """
+    SensorHistory class.
+
+    A fixed-capacity ring buffer of timestamped readings. Readings and
+    timestamps live in two array('d') buffers that are written twice, once
+    at their ring position and once mirrored one capacity further on. This
+    keeps any window of the most recent readings contiguous, so it can be
+    handed out as a zero-copy memoryview. The minimum, maximum and mean of
+    the readings held are maintained incrementally on every append.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of readings held. Older readings are overwritten.
+
+    Methods
+    -------
+    append(self, value, timestamp=None)
+        Adds a reading in O(1), overwriting the oldest one when full.
+
+    recent_values(self, count=None)
+        Returns a memoryview of the most recent readings, oldest first.
+
+    recent_timestamps(self, count=None)
+        Returns a memoryview of the timestamps of the most recent readings.
+
+    minimum, maximum, mean
+        Rolling statistics over the readings held, or None when empty.
+
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize an empty history.
+
+        Parameters
+        ----------
+        capacity : int
+            The maximum number of readings to keep.
+
+        Raises
+        ------
+        ValueError
+            If the capacity is smaller than 1.
+
+        """
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1.")
+        self.capacity = capacity
+        self._values = array('d', bytes(16 * capacity))  # 2 * capacity zeros
+        self._timestamps = array('d', bytes(16 * capacity))
+        self._next = 0  # Ring position of the next write
+        self._count = 0
+        self._sequence = 0  # Number of readings ever appended
+        self._sum = 0.0
+        # Monotonic queues of (sequence, value) for the rolling min and max
+        self._min_queue = deque()
+        self._max_queue = deque()
+
+    def __len__(self) -> int:
+        """Return the number of readings held."""
+        return self._count
+
+    def append(self, value: float, timestamp: float = None) -> None:
+        """
+        Add a reading, overwriting the oldest one when the buffer is full.
+
+        Parameters
+        ----------
+        value : float
+            The reading to add.
+        timestamp : float, optional
+            The time of the reading in seconds since the epoch. Defaults to
+            the current time.
+
+        Returns
+        -------
+        None
+
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        position = self._next
+        if self._count == self.capacity:
+            self._sum -= self._values[position]  # The oldest reading
+        else:
+            self._count += 1
+        mirror = position + self.capacity
+        self._values[position] = self._values[mirror] = value
+        self._timestamps[position] = self._timestamps[mirror] = timestamp
+        self._sum += value
+
+        sequence = self._sequence
+        self._sequence += 1
+        oldest = sequence - self._count + 1  # Sequence of the oldest reading
+        min_queue, max_queue = self._min_queue, self._max_queue
+        while min_queue and min_queue[-1][1] >= value:
+            min_queue.pop()
+        min_queue.append((sequence, value))
+        if min_queue[0][0] < oldest:
+            min_queue.popleft()
+        while max_queue and max_queue[-1][1] <= value:
+            max_queue.pop()
+        max_queue.append((sequence, value))
+        if max_queue[0][0] < oldest:
+            max_queue.popleft()
+
+        self._next = (position + 1) % self.capacity
+
+    def _window(self, buffer: array, count: int) -> memoryview:
+        """Return a view of the last 'count' items of a mirrored buffer."""
+        if count is None or count > self._count:
+            count = self._count
+        end = self._next + self.capacity
+        return memoryview(buffer)[end - max(count, 0):end]
+
+    def recent_values(self, count: int = None) -> memoryview:
+        """
+        Return the most recent readings, oldest first, without copying.
+
+        Parameters
+        ----------
+        count : int, optional
+            The number of readings wanted. Defaults to all readings held.
+
+        Returns
+        -------
+        memoryview
+            A view of doubles. It is only valid until the next append.
+
+        """
+        return self._window(self._values, count)
+
+    def recent_timestamps(self, count: int = None) -> memoryview:
+        """
+        Return the timestamps of the most recent readings, oldest first,
+        without copying.
+
+        Parameters
+        ----------
+        count : int, optional
+            The number of timestamps wanted. Defaults to all readings held.
+
+        Returns
+        -------
+        memoryview
+            A view of doubles. It is only valid until the next append.
+
+        """
+        return self._window(self._timestamps, count)
+
+    @property
+    def minimum(self) -> float:
+        """Return the smallest reading held, or None when empty."""
+        return self._min_queue[0][1] if self._count else None
+
+    @property
+    def maximum(self) -> float:
+        """Return the largest reading held, or None when empty."""
+        return self._max_queue[0][1] if self._count else None
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the readings held, or None when empty."""
+        return self._sum / self._count if self._count else None
+
 
 class CelsiusTemperatureSensor:
     """
@@ -47,9 +237,14 @@ class CelsiusTemperatureSensor:
 
     A class representing a temperature sensor providing readings in Celsius.
 
+    Attributes
+    ----------
+    history : SensorHistory or None
+        The recent readings in Celsius, when a history capacity was given.
+
     Methods
     -------
-    __init__(self)
+    __init__(self, history_capacity=None)
         Initializes the CelsiusTemperatureSensor with a default temperature
         of 25°C.
 
@@ -61,12 +256,25 @@ class CelsiusTemperatureSensor:
 
     """
 
-    def __init__(self) -> None:
+    __slots__ = ('_temperature', 'history')  # No per-instance __dict__
+
+    def __init__(self, history_capacity: int = None) -> None:
         """
         Initialize the CelsiusTemperatureSensor with a default temperature
         of 25°C.
+
+        Parameters
+        ----------
+        history_capacity : int, optional
+            When given, the sensor keeps a SensorHistory of its most recent
+            readings with this capacity. By default no history is kept.
+
         """
         self._temperature = 25 # C
+        self.history = None
+        if history_capacity is not None:
+            self.history = SensorHistory(history_capacity)
+            self.history.append(self._temperature)
 
     def set_temperature(self, temperature:int) -> None:
         """
@@ -83,6 +291,8 @@ class CelsiusTemperatureSensor:
 
         """
         self._temperature = temperature # C
+        if self.history is not None:
+            self.history.append(temperature)
 
     def get_temperature_celsius(self) -> int:
         """
@@ -104,9 +314,14 @@ class FahrenheitTemperatureSensor:
     A class representing a temperature sensor providing readings in
     Fahrenheit.
 
+    Attributes
+    ----------
+    history : SensorHistory or None
+        The recent readings in Fahrenheit, when a history capacity was given.
+
     Methods
     -------
-    __init__(self)
+    __init__(self, history_capacity=None)
         Initializes the FahrenheitTemperatureSensor with a default
         temperature of 77°F.
 
@@ -118,12 +333,25 @@ class FahrenheitTemperatureSensor:
 
     """
 
-    def __init__(self) -> None:
+    __slots__ = ('_temperature', 'history')  # No per-instance __dict__
+
+    def __init__(self, history_capacity: int = None) -> None:
         """
         Initialize the FahrenheitTemperatureSensor with a default temperature
         of 77°F.
+
+        Parameters
+        ----------
+        history_capacity : int, optional
+            When given, the sensor keeps a SensorHistory of its most recent
+            readings with this capacity. By default no history is kept.
+
         """
         self._temperature = 77
+        self.history = None
+        if history_capacity is not None:
+            self.history = SensorHistory(history_capacity)
+            self.history.append(self._temperature)
 
     def set_temperature(self, temperature:int) -> None:
         """
@@ -140,6 +368,8 @@ class FahrenheitTemperatureSensor:
 
         """
         self._temperature = temperature # F
+        if self.history is not None:
+            self.history.append(temperature)
 
     def get_temperature_fahrenheit(self) -> int:
         """
@@ -175,8 +405,14 @@ class TemperatureSensorAdapter:
         Retrieves the current temperature reading in Celsius, converting
         from Fahrenheit.
 
+    fahrenheit_to_celsius_batch(readings, out)
+        Converts a whole buffer of Fahrenheit readings to Celsius, writing
+        the results into a caller-supplied output buffer.
+
     """
 
+    __slots__ = ('_sensor',)  # No per-instance __dict__
+
     def __init__(self, sensor: FahrenheitTemperatureSensor) -> None:
         """
         Initialize the adapter with a reference to a
@@ -224,6 +460,119 @@ class TemperatureSensorAdapter:
         return round(((self._sensor._temperature - 32) / 1.8), 2) # C
         # Return the converted Fahrenheit to Celsius value
 
+    @staticmethod
+    def fahrenheit_to_celsius_batch(readings, out):
+        """
+        Convert a buffer of Fahrenheit readings to Celsius in one pass.
+
+        The conversion and the 2-decimal rounding match
+        get_temperature_celsius exactly. Results are written into 'out'.
+        With NumPy installed, NumPy arrays and any other buffer of doubles
+        (such as array('d')) are converted with vectorized ufuncs, using a
+        fixed amount of scratch memory however many readings there are;
+        otherwise buffers of doubles are converted through memoryviews
+        without allocating.
+
+        Parameters
+        ----------
+        readings : numpy.ndarray or array.array
+            The Fahrenheit readings to convert.
+        out : numpy.ndarray or array.array
+            The output buffer for the Celsius values. It must hold at least
+            as many items as 'readings'. It may be 'readings' itself to
+            convert in place.
+
+        Returns
+        -------
+        numpy.ndarray or array.array
+            The 'out' buffer.
+
+        Raises
+        ------
+        ValueError
+            If 'out' is shorter than 'readings'.
+        TypeError
+            If a non-NumPy buffer does not hold doubles.
+
+        """
+        if np is not None:
+            source = (readings if isinstance(readings, np.ndarray)
+                      else np.frombuffer(_doubles(readings)))
+            # Writes through the view land in 'out' itself
+            target = (out if isinstance(out, np.ndarray)
+                      else np.frombuffer(_doubles(out)))
+            count = len(source)
+            if len(target) < count:
+                raise ValueError("Output buffer is shorter than the readings.")
+            target = target[:count]  # A view, not a copy
+            np.subtract(source, 32, out=target)
+            np.divide(target, 1.8, out=target)
+            _round_cents(target)
+            return out
+
+        source = _doubles(readings)
+        target = _doubles(out)
+        if len(target) < len(source):
+            raise ValueError("Output buffer is shorter than the readings.")
+        for index, fahrenheit in enumerate(source):
+            target[index] = round((fahrenheit - 32) / 1.8, 2)  # C
+        return out
+
+
+def _doubles(buffer):
+    """Return a memoryview of a buffer, or raise TypeError if not doubles."""
+    view = memoryview(buffer)
+    if view.format != 'd':
+        raise TypeError("Batch conversion needs buffers of doubles ('d').")
+    return view
+
+
+def _round_cents(values):
+    """
+    Round a NumPy array to 2 decimals in place, exactly like round(x, 2).
+
+    np.round scales by 100, rounds and scales back, so values whose scaled
+    form lies within rounding error of a half can round the other way than
+    Python's correctly rounded round. The scaled form is exact enough to
+    round every other value, and the few near halves are rounded by round.
+    Values are processed in blocks of ROUNDING_BLOCK with scratch arrays
+    allocated once, so the extra memory is bounded whatever the input size.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The float64 values to round.
+
+    Returns
+    -------
+    None
+
+    """
+    # Fixed-size scratch, so extra memory does not grow with the input
+    size = min(len(values), ROUNDING_BLOCK)
+    scaled, rounded, distance = np.empty((3, size))
+    near_half = np.empty(size, dtype=bool)
+    for start in range(0, len(values), size or 1):
+        block = values[start:start + size]
+        count = len(block)
+        block_scaled, block_rounded = scaled[:count], rounded[:count]
+        block_distance, block_near = distance[:count], near_half[:count]
+        np.multiply(block, 100, out=block_scaled)
+        np.rint(block_scaled, out=block_rounded)
+        with np.errstate(invalid='ignore'):  # inf - inf is nan, not a half
+            np.subtract(block_scaled, block_rounded, out=block_distance)
+            np.abs(block_distance, out=block_distance)
+            np.subtract(block_distance, 0.5, out=block_distance)
+        np.abs(block_distance, out=block_distance)
+        np.spacing(block_scaled, out=block_scaled)  # The error bound
+        np.abs(block_scaled, out=block_scaled)
+        np.multiply(block_scaled, 2, out=block_scaled)
+        np.less_equal(block_distance, block_scaled, out=block_near)
+        indices = np.flatnonzero(block_near)
+        exact = [round(value, 2) for value in block[indices].tolist()]
+        np.divide(block_rounded, 100, out=block)
+        block[indices] = exact
+
 
 def display_temperature(sensor) -> None:
     """
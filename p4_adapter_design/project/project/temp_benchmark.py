@@ -0,0 +1,362 @@
+"""
+Temperature Adapter Benchmark Script
+
+This script micro-benchmarks the hot paths of the temperature adapter:
+scalar reads and writes through TemperatureSensorAdapter, direct sensor
+reads against adapted reads, and the batch and streaming conversions.
+Every case reports nanoseconds per operation, operations per second and
+the memory allocated per operation. Results can be saved as JSON and
+compared with the results of an earlier commit.
+
+Classes
+-------
+BenchmarkResult:
+    The measurements of one benchmark case.
+
+Functions
+---------
+benchmark_cases(batch_size=10_000):
+    Returns the benchmark cases as (name, operation, ops per call) tuples.
+
+run_case(operation, ops_per_call=1, repeat=5, min_time=0.2):
+    Measures one benchmark case.
+
+run_benchmarks(repeat=5, min_time=0.2):
+    Measures every benchmark case.
+
+save_results(results, filename) / load_results(filename):
+    Write and read results as JSON, with details of the machine and commit.
+
+compare_results(baseline, current, tolerance=0.10):
+    Compares two sets of results and flags regressions.
+
+Main Function
+-------------
+main(argv=None):
+    Runs the benchmarks from the command line.
+
+Usage
+-----
+python temp_benchmark.py [--output FILE] [--compare BASELINE]
+    Runs all cases, optionally saving them and comparing them to a
+    baseline saved by an earlier run.
+
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+
+from temp_adapter_script import (CelsiusTemperatureSensor,
+                                 FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+from temp_fleet import SensorFleet
+from temp_stream import convert_stream
+from temp_units import UnitSensorAdapter
+
+
+class BenchmarkResult:
+    """
+    BenchmarkResult class.
+
+    The measurements of one benchmark case.
+
+    Attributes
+    ----------
+    name : str
+        The name of the case.
+    ns_per_op : float
+        The median time per operation in nanoseconds.
+    ops_per_sec : float
+        The number of operations per second at the median time.
+    alloc_bytes_per_op : float
+        The peak memory allocated by one call, per operation.
+    blocks_per_op : float
+        The net number of memory blocks left allocated per operation.
+    """
+
+    def __init__(self, name: str, ns_per_op: float, alloc_bytes_per_op: float,
+                 blocks_per_op: float) -> None:
+        """Initialize the measurements of one case."""
+        self.name = name
+        self.ns_per_op = ns_per_op
+        self.ops_per_sec = 1e9 / ns_per_op if ns_per_op else float('inf')
+        self.alloc_bytes_per_op = alloc_bytes_per_op
+        self.blocks_per_op = blocks_per_op
+
+    def to_dict(self) -> dict:
+        """Return the measurements as a JSON-compatible dict."""
+        return dict(vars(self))
+
+
+def benchmark_cases(batch_size: int = 10_000) -> list:
+    """
+    Return the benchmark cases.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        The number of readings per call of the batch and streaming cases.
+
+    Returns
+    -------
+    list of tuple
+        (name, operation, ops per call). Operations take no arguments.
+
+    """
+    cel_sensor = CelsiusTemperatureSensor()
+    far_sensor = FahrenheitTemperatureSensor()
+    adapter = TemperatureSensorAdapter(far_sensor)
+    unit_adapter = UnitSensorAdapter(far_sensor, 'fahrenheit')
+    fleet_sensor = SensorFleet(1, 'fahrenheit')[0]
+    readings = array('d', (float(i % 200) for i in range(batch_size)))
+    out = array('d', bytes(len(readings) * readings.itemsize))
+    batch = TemperatureSensorAdapter.fahrenheit_to_celsius_batch
+    discard = lambda chunk: None
+
+    return [
+        ('celsius_sensor.get_temperature_celsius',
+         cel_sensor.get_temperature_celsius, 1),
+        ('fahrenheit_sensor.get_temperature_fahrenheit',
+         far_sensor.get_temperature_fahrenheit, 1),
+        ('adapter.get_temperature_celsius', adapter.get_temperature_celsius, 1),
+        ('adapter.set_temperature', lambda: adapter.set_temperature(25), 1),
+        ('unit_adapter.get_temperature_celsius',
+         unit_adapter.get_temperature_celsius, 1),
+        ('fleet_view.get_temperature_celsius',
+         fleet_sensor.get_temperature_celsius, 1),
+        ('fahrenheit_to_celsius_batch (per reading)',
+         lambda: batch(readings, out), batch_size),
+        ('convert_stream (per reading)',
+         lambda: convert_stream(readings, discard, chunk_size=4096), batch_size),
+    ]
+
+
+def run_case(operation, ops_per_call: int = 1, repeat: int = 5,
+             min_time: float = 0.2) -> tuple:
+    """
+    Measure one benchmark case.
+
+    The operation is called in a loop, calibrated so that one timing run
+    lasts at least 'min_time' seconds, and the median of 'repeat' runs is
+    kept. The garbage collector is disabled while timing.
+
+    Parameters
+    ----------
+    operation : callable
+        The operation to measure, called without arguments.
+    ops_per_call : int, optional
+        The number of operations one call performs.
+    repeat : int, optional
+        The number of timing runs.
+    min_time : float, optional
+        The minimum duration of one timing run in seconds.
+
+    Returns
+    -------
+    tuple
+        (ns per op, peak bytes allocated per op, net blocks per op).
+
+    """
+    loops = 1
+    while True:  # Calibrate the number of calls per run
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            operation()
+        if time.perf_counter_ns() - start >= min_time * 1e9 or loops >= 1 << 30:
+            break
+        loops *= 2
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(loops):
+                operation()
+            timings.append(time.perf_counter_ns() - start)
+
+        blocks_before = sys.getallocatedblocks()
+        for _ in range(loops):
+            operation()
+        blocks = sys.getallocatedblocks() - blocks_before
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    ops = loops * ops_per_call
+    return (statistics.median(timings) / ops, (peak - base) / ops_per_call,
+            blocks / ops)
+
+
+def run_benchmarks(repeat: int = 5, min_time: float = 0.2) -> list:
+    """
+    Measure every benchmark case.
+
+    Parameters
+    ----------
+    repeat, min_time
+        See run_case.
+
+    Returns
+    -------
+    list of BenchmarkResult
+        One result per case, in the order of benchmark_cases.
+
+    """
+    return [BenchmarkResult(name, *run_case(operation, ops_per_call,
+                                            repeat, min_time))
+            for name, operation, ops_per_call in benchmark_cases()]
+
+
+def _git_commit() -> str:
+    """Return the current git commit, or None outside a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results: list, filename: str) -> None:
+    """
+    Write results as JSON, with details of the machine and commit.
+
+    Parameters
+    ----------
+    results : list of BenchmarkResult
+        The results to save.
+    filename : str
+        The path to the JSON file.
+
+    Returns
+    -------
+    None
+
+    """
+    document = {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': [result.to_dict() for result in results],
+    }
+    with open(filename, 'w') as json_file:
+        json.dump(document, json_file, indent=2)
+
+
+def load_results(filename: str) -> dict:
+    """
+    Read results written by save_results.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the JSON file.
+
+    Returns
+    -------
+    dict
+        The result dicts keyed by case name.
+
+    """
+    with open(filename, 'r') as json_file:
+        return {result['name']: result
+                for result in json.load(json_file)['results']}
+
+
+def compare_results(baseline: dict, current: list,
+                    tolerance: float = 0.10) -> list:
+    """
+    Compare results with a baseline and flag regressions.
+
+    Parameters
+    ----------
+    baseline : dict
+        Result dicts keyed by case name, as returned by load_results.
+    current : list of BenchmarkResult
+        The new results.
+    tolerance : float, optional
+        The relative slowdown accepted before a case counts as a regression.
+
+    Returns
+    -------
+    list of tuple
+        (name, baseline ns/op, current ns/op, ratio, regressed) for every
+        case present in both.
+
+    """
+    comparison = []
+    for result in current:
+        if result.name in baseline:
+            old = baseline[result.name]['ns_per_op']
+            ratio = result.ns_per_op / old if old else float('inf')
+            comparison.append((result.name, old, result.ns_per_op, ratio,
+                               ratio > 1 + tolerance))
+    return comparison
+
+
+def main(argv: list = None) -> int:
+    """
+    Run the benchmarks from the command line.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command line arguments. Defaults to sys.argv[1:].
+
+    Returns
+    -------
+    int
+        1 if a regression was found against the baseline, else 0.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--output', help='save the results to this JSON file')
+    parser.add_argument('--compare', help='compare with this saved JSON file')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.repeat, args.min_time)
+    print(f"{'case':<46} {'ns/op':>10} {'ops/sec':>14} "
+          f"{'bytes/op':>9} {'blocks/op':>9}")
+    for result in results:
+        print(f"{result.name:<46} {result.ns_per_op:>10.1f} "
+              f"{result.ops_per_sec:>14.0f} {result.alloc_bytes_per_op:>9.1f} "
+              f"{result.blocks_per_op:>9.3f}")
+    if args.output:
+        save_results(results, args.output)
+
+    regressed = False
+    if args.compare:
+        print(f"\nCompared with {args.compare}:")
+        for name, old, new, ratio, slower in compare_results(
+                load_results(args.compare), results, args.tolerance):
+            regressed = regressed or slower
+            print(f"{name:<46} {old:>10.1f} -> {new:>10.1f} ns/op "
+                  f"({ratio:.2f}x){'  REGRESSION' if slower else ''}")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
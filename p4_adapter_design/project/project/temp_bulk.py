@@ -0,0 +1,200 @@
+"""
+Temperature Bulk Conversion Script
+
+This script converts large sets of Fahrenheit readings to Celsius on all
+cores, for backfills of historical sensor data. The readings are copied
+once into a shared memory segment, which a ProcessPoolExecutor converts in
+place in contiguous chunks with the batch conversion of
+TemperatureSensorAdapter. Workers only receive the name of the segment and
+the bounds of their chunk, so no readings are pickled.
+
+Functions
+---------
+bulk_convert(readings, out=None, chunk_size=1 << 20, workers=None,
+             executor=None):
+    Converts a buffer of Fahrenheit readings to Celsius on a process pool.
+
+benchmark(count=4_000_000, chunk_size=1 << 18, repeat=3):
+    Times bulk_convert for every worker count up to the number of cores,
+    apart from the startup of the process pool.
+
+Main Function
+-------------
+if __name__ == "__main__":
+    Runs the benchmark and prints how the conversion scales with cores.
+
+Usage
+-----
+python temp_bulk.py [COUNT]
+    Benchmarks bulk conversion of COUNT readings.
+
+"""
+
+import contextlib
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from temp_adapter_script import TemperatureSensorAdapter, _doubles
+
+READING_SIZE = array('d').itemsize
+
+
+def _convert_chunk(name: str, start: int, stop: int) -> int:
+    """Convert readings [start, stop) of a shared segment in place."""
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        view = segment.buf.cast('d')[start:stop]
+        TemperatureSensorAdapter.fahrenheit_to_celsius_batch(view, view)
+        view.release()
+    finally:
+        segment.close()
+    return stop - start
+
+
+def _flat_doubles(buffer):
+    """Return a flat memoryview of doubles, or raise TypeError."""
+    return _doubles(buffer).cast('B').cast('d')  # Flattens N-d arrays
+
+
+def _ready() -> int:
+    """Return the process id; submitted to start the workers of a pool."""
+    return os.getpid()
+
+
+def bulk_convert(readings, out=None, chunk_size: int = 1 << 20,
+                 workers: int = None,
+                 executor: ProcessPoolExecutor = None):
+    """
+    Convert a buffer of Fahrenheit readings to Celsius on a process pool.
+
+    Parameters
+    ----------
+    readings : array.array or numpy.ndarray
+        A buffer of doubles holding the Fahrenheit readings.
+    out : array.array or numpy.ndarray, optional
+        A buffer of doubles for the Celsius readings, which may be
+        'readings' itself. By default a new array('d') is returned.
+    chunk_size : int, optional
+        The number of readings per task. Each worker converts one
+        contiguous chunk at a time.
+    workers : int, optional
+        The number of worker processes. Defaults to the number of cores.
+        With one worker, or when everything fits in a single chunk, the
+        readings are converted in this process.
+    executor : concurrent.futures.ProcessPoolExecutor, optional
+        A pool to convert on, which is left running, so repeated calls do
+        not pay for starting processes. 'workers' is then ignored. By
+        default a pool of 'workers' processes is started for the call.
+
+    Returns
+    -------
+    array.array or numpy.ndarray
+        The 'out' buffer.
+
+    Raises
+    ------
+    ValueError
+        If 'out' is shorter than 'readings' or chunk_size is below 1.
+    TypeError
+        If 'readings' or 'out' does not hold doubles.
+
+    """
+    source = _flat_doubles(readings)
+    count = len(source)
+    if out is None:
+        out = array('d', bytes(READING_SIZE * count))
+    target = _flat_doubles(out)
+    if len(target) < count:
+        raise ValueError("Output buffer is shorter than the readings.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    workers = workers or os.cpu_count()
+
+    if (executor is None and workers == 1) or count <= chunk_size:
+        TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+            source, target[:count])
+        return out
+
+    segment = shared_memory.SharedMemory(create=True,
+                                         size=READING_SIZE * count)
+    shared = segment.buf.cast('d')
+    try:
+        shared[:] = source  # The only copy of the readings going in
+        with contextlib.ExitStack() as stack:
+            if executor is None:
+                executor = stack.enter_context(ProcessPoolExecutor(workers))
+            futures = [executor.submit(_convert_chunk, segment.name, start,
+                                       min(start + chunk_size, count))
+                       for start in range(0, count, chunk_size)]
+            for future in futures:
+                future.result()  # Re-raise errors from the workers
+        target[:count] = shared  # And the only copy coming out
+    finally:
+        shared.release()  # The segment cannot close while views exist
+        segment.close()
+        segment.unlink()
+    return out
+
+
+def benchmark(count: int = 4_000_000, chunk_size: int = 1 << 18,
+              repeat: int = 3) -> list:
+    """
+    Time bulk_convert for every worker count up to the number of cores.
+
+    One worker converts in this process. For more workers, a process pool
+    is started and warmed up once, timed on its own, and then reused by
+    every timed run, so the conversion times do not include process
+    startup.
+
+    Parameters
+    ----------
+    count : int, optional
+        The number of readings converted per run.
+    chunk_size : int, optional
+        The chunk size passed to bulk_convert.
+    repeat : int, optional
+        The number of runs per worker count; the fastest one is kept.
+
+    Returns
+    -------
+    list of tuple
+        (workers, seconds, speedup over one worker, pool startup seconds)
+        for every worker count; the startup is 0.0 for one worker.
+
+    """
+    readings = array('d', (float(i % 2000) / 10 for i in range(count)))
+    out = array('d', bytes(READING_SIZE * count))
+    results = []
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        with contextlib.ExitStack() as stack:
+            executor, startup = None, 0.0
+            if workers > 1:
+                start = time.perf_counter()
+                executor = stack.enter_context(ProcessPoolExecutor(workers))
+                for future in [executor.submit(_ready)
+                               for _ in range(workers)]:
+                    future.result()
+                startup = time.perf_counter() - start
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                bulk_convert(readings, out, chunk_size, workers, executor)
+                best = min(best, time.perf_counter() - start)
+        speedup = results[0][1] / best if results else 1.0
+        results.append((workers, best, speedup, startup))
+    return results
+
+
+if __name__ == "__main__":
+    reading_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000_000
+    print(f"Converting {reading_count} readings")
+    print(f"{'workers':>7} {'seconds':>9} {'rows/sec':>12} {'speedup':>8} "
+          f"{'startup':>8}")
+    for worker_count, seconds, speedup, startup in benchmark(reading_count):
+        print(f"{worker_count:>7} {seconds:>9.3f} "
+              f"{reading_count / seconds:>12.0f} {speedup:>7.2f}x "
+              f"{startup:>8.3f}")
@@ -0,0 +1,193 @@
+"""
+Temperature Deadband Script
+
+This script adds opt-in change detection on top of sensor reads. A
+DeadbandFilter remembers the last value it emitted for every sensor and
+suppresses new readings that moved less than a threshold, so consumers only
+process deltas. Every emitted change gets a version number, which lets
+consumers ask which sensors changed since the last version they saw.
+
+Classes
+-------
+DeadbandFilter:
+    Change detection and deadband filtering of sensor readings.
+
+Main Function
+-------------
+if __name__ == "__main__":
+    Reads an adapted Fahrenheit sensor through a deadband and prints the
+    readings that get through.
+
+Usage
+-----
+Run this script to demonstrate deadband filtering of adapter reads.
+
+"""
+
+from temp_adapter_script import (FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+
+
+class DeadbandFilter:
+    """
+    DeadbandFilter class.
+
+    Change detection and deadband filtering of sensor readings. Sensors are
+    read through 'get_temperature_celsius', so both Celsius sensors and
+    adapters can be filtered. A reading is emitted when it is the first one
+    of a sensor or when it differs from the last emitted one by at least
+    the threshold; otherwise it is suppressed.
+
+    Attributes
+    ----------
+    threshold : float
+        The smallest change that is emitted. With 0 only repeated values
+        are suppressed.
+    version : int
+        The number of changes emitted so far.
+    suppressed : int
+        The number of readings suppressed so far.
+
+    Methods
+    -------
+    read(self, sensor)
+        Reads a sensor, returning the reading or None if suppressed.
+
+    poll(self, sensors)
+        Reads several sensors, returning only the changed readings.
+
+    changed_since(self, version)
+        Returns the sensors whose emitted value changed after a version.
+
+    last_value(self, sensor)
+        Returns the last emitted reading of a sensor.
+
+    """
+
+    def __init__(self, threshold: float = 0.0) -> None:
+        """
+        Initialize the filter.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            The smallest change that is emitted.
+
+        """
+        self.threshold = threshold
+        self.version = 0
+        self.suppressed = 0
+        # sensor -> (value, version), ordered by version
+        self._emitted = {}
+
+    def read(self, sensor):
+        """
+        Read a sensor, returning the reading or None if suppressed.
+
+        Parameters
+        ----------
+        sensor : object
+            Any object with a 'get_temperature_celsius' method.
+
+        Returns
+        -------
+        float or None
+            The reading in Celsius, or None if it moved less than the
+            threshold since the last emitted reading of this sensor.
+
+        """
+        value = sensor.get_temperature_celsius()
+        last = self._emitted.get(sensor)
+        if last is not None:
+            delta = abs(value - last[0])
+            if delta < self.threshold or delta == 0:
+                self.suppressed += 1
+                return None
+            del self._emitted[sensor]  # Re-inserted below as the newest
+        self.version += 1
+        self._emitted[sensor] = (value, self.version)  # Now the newest
+        return value
+
+    def poll(self, sensors) -> list:
+        """
+        Read several sensors, returning only the changed readings.
+
+        Parameters
+        ----------
+        sensors : iterable
+            The sensors to read.
+
+        Returns
+        -------
+        list of tuple
+            (sensor, value) for every reading that was emitted.
+
+        """
+        changed = []
+        for sensor in sensors:
+            value = self.read(sensor)
+            if value is not None:
+                changed.append((sensor, value))
+        return changed
+
+    def changed_since(self, version: int) -> list:
+        """
+        Return the sensors whose emitted value changed after a version.
+
+        Only the changed sensors are visited, since the emitted values are
+        kept ordered by version.
+
+        Parameters
+        ----------
+        version : int
+            A version previously read from the 'version' attribute.
+
+        Returns
+        -------
+        list of tuple
+            (sensor, value) for every sensor changed after the version,
+            oldest change first.
+
+        """
+        changed = []
+        for sensor, (value, changed_in) in reversed(self._emitted.items()):
+            if changed_in <= version:
+                break
+            changed.append((sensor, value))
+        changed.reverse()
+        return changed
+
+    def last_value(self, sensor):
+        """
+        Return the last emitted reading of a sensor.
+
+        Parameters
+        ----------
+        sensor : object
+            A sensor read through this filter.
+
+        Returns
+        -------
+        float
+            The last emitted reading in Celsius.
+
+        Raises
+        ------
+        KeyError
+            If the sensor was never read through this filter.
+
+        """
+        return self._emitted[sensor][0]
+
+
+if __name__ == "__main__":
+    far_sensor = FahrenheitTemperatureSensor()
+    far_adapter = TemperatureSensorAdapter(far_sensor)
+    deadband = DeadbandFilter(threshold=0.5)
+
+    for fahrenheit in (77, 77, 77.5, 78, 80, 80):
+        far_sensor.set_temperature(fahrenheit)
+        reading = deadband.read(far_adapter)
+        print(f"{fahrenheit} °F -> "
+              f"{'suppressed' if reading is None else f'{reading:.2f} °C'}")
+    print(f"Suppressed {deadband.suppressed} of 6 reads")
@@ -0,0 +1,313 @@
+"""
+Temperature Sensor Fleet Script
+
+This script stores the temperatures of a large fleet of simulated sensors
+in one contiguous array('d') instead of one object per sensor. Sensors are
+handed out as lightweight view objects with the same
+'get_temperature_celsius' / 'set_temperature' interface as
+CelsiusTemperatureSensor and TemperatureSensorAdapter, so they can be used
+wherever those are expected. Views are created on demand and hold no
+temperature of their own.
+
+Classes
+-------
+SensorFleet:
+    A struct-of-arrays container of sensor temperatures.
+
+CelsiusSensorView:
+    A view of one Celsius sensor of a fleet.
+
+FahrenheitSensorView:
+    A view of one Fahrenheit sensor of a fleet, adapted to Celsius.
+
+Functions
+---------
+memory_comparison(count=100_000):
+    Measures the memory used per sensor by each representation.
+
+Main Function
+-------------
+if __name__ == "__main__":
+    Prints the memory comparison.
+
+Usage
+-----
+python temp_fleet.py [COUNT]
+    Compares the memory used by COUNT sensors in each representation.
+
+"""
+
+import sys
+import tracemalloc
+from array import array
+
+from temp_adapter_script import (CelsiusTemperatureSensor,
+                                 FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+
+
+class CelsiusSensorView:
+    """
+    CelsiusSensorView class.
+
+    A view of one Celsius sensor of a SensorFleet, compatible with
+    CelsiusTemperatureSensor.
+
+    Methods
+    -------
+    set_temperature(self, temperature)
+        Sets the temperature of the sensor in Celsius.
+
+    get_temperature_celsius(self)
+        Retrieves the current temperature reading in Celsius.
+
+    """
+
+    __slots__ = ('_temperatures', '_index')
+
+    def __init__(self, temperatures: array, index: int) -> None:
+        """Initialize the view of one slot of the fleet temperatures."""
+        self._temperatures = temperatures
+        self._index = index
+
+    def set_temperature(self, temperature: float) -> None:
+        """Set the temperature of the sensor in Celsius."""
+        self._temperatures[self._index] = temperature # C
+
+    def get_temperature_celsius(self) -> float:
+        """Retrieve the current temperature reading in Celsius."""
+        return self._temperatures[self._index] # C
+
+
+class FahrenheitSensorView(CelsiusSensorView):
+    """
+    FahrenheitSensorView class.
+
+    A view of one Fahrenheit sensor of a SensorFleet. Like
+    TemperatureSensorAdapter, it is set and read in Celsius, converting to
+    and from the Fahrenheit value stored in the fleet.
+
+    Methods
+    -------
+    set_temperature(self, temperature)
+        Sets the temperature of the sensor from a value in Celsius.
+
+    get_temperature_celsius(self)
+        Retrieves the current temperature reading in Celsius.
+
+    get_temperature_fahrenheit(self)
+        Retrieves the stored temperature reading in Fahrenheit.
+
+    """
+
+    __slots__ = ()
+
+    def set_temperature(self, temperature: float) -> None:
+        """Set the temperature of the sensor from a value in Celsius."""
+        self._temperatures[self._index] = round((temperature * 1.8) + 32, 2) # F
+
+    def get_temperature_celsius(self) -> float:
+        """Retrieve the current temperature reading in Celsius."""
+        return round(((self._temperatures[self._index] - 32) / 1.8), 2) # C
+
+    def get_temperature_fahrenheit(self) -> float:
+        """Retrieve the stored temperature reading in Fahrenheit."""
+        return self._temperatures[self._index] # F
+
+
+class SensorFleet:
+    """
+    SensorFleet class.
+
+    A struct-of-arrays container holding the temperatures of all sensors of
+    one unit in a single array('d'), 8 bytes per sensor. Indexing the fleet
+    returns a view object for one sensor.
+
+    Attributes
+    ----------
+    unit : str
+        The unit the temperatures are stored in, 'celsius' or 'fahrenheit'.
+
+    Methods
+    -------
+    __init__(self, count=0, unit='celsius')
+        Initializes a fleet of sensors at the default temperature.
+
+    add(self, temperature=None)
+        Adds a sensor and returns its index.
+
+    __getitem__(self, index)
+        Returns a view of one sensor.
+
+    temperatures(self)
+        Returns a memoryview of all stored temperatures.
+
+    temperatures_celsius(self, out)
+        Converts all temperatures to Celsius into a caller-supplied buffer.
+
+    """
+
+    DEFAULTS = {'celsius': 25.0, 'fahrenheit': 77.0}  # As the sensor classes
+    VIEWS = {'celsius': CelsiusSensorView, 'fahrenheit': FahrenheitSensorView}
+
+    def __init__(self, count: int = 0, unit: str = 'celsius') -> None:
+        """
+        Initialize a fleet of sensors at the default temperature.
+
+        Parameters
+        ----------
+        count : int, optional
+            The number of sensors to start with.
+        unit : str, optional
+            The unit the sensors read in, 'celsius' or 'fahrenheit'.
+
+        Raises
+        ------
+        ValueError
+            If the unit is not supported.
+
+        """
+        if unit not in self.VIEWS:
+            raise ValueError(f'The unit : "{unit}" is invalid.')
+        self.unit = unit
+        self._view = self.VIEWS[unit]
+        self._temperatures = array('d', [self.DEFAULTS[unit]]) * count
+
+    def __len__(self) -> int:
+        """Return the number of sensors."""
+        return len(self._temperatures)
+
+    def add(self, temperature: float = None) -> int:
+        """
+        Add a sensor and return its index.
+
+        Parameters
+        ----------
+        temperature : float, optional
+            The starting temperature in the unit of the fleet. Defaults to
+            the default temperature of the matching sensor class.
+
+        Returns
+        -------
+        int
+            The index of the new sensor.
+
+        """
+        if temperature is None:
+            temperature = self.DEFAULTS[self.unit]
+        self._temperatures.append(temperature)
+        return len(self._temperatures) - 1
+
+    def __getitem__(self, index: int) -> CelsiusSensorView:
+        """
+        Return a view of one sensor.
+
+        Parameters
+        ----------
+        index : int
+            The index of the sensor.
+
+        Returns
+        -------
+        CelsiusSensorView or FahrenheitSensorView
+            A view with the CelsiusTemperatureSensor interface.
+
+        Raises
+        ------
+        IndexError
+            If there is no sensor at the index.
+
+        """
+        if not -len(self._temperatures) <= index < len(self._temperatures):
+            raise IndexError(f"No sensor at index {index}.")
+        return self._view(self._temperatures, index % len(self._temperatures))
+
+    def temperatures(self) -> memoryview:
+        """Return a memoryview of all stored temperatures, in the fleet unit."""
+        return memoryview(self._temperatures)
+
+    def temperatures_celsius(self, out):
+        """
+        Convert all temperatures to Celsius into a caller-supplied buffer.
+
+        Parameters
+        ----------
+        out : array.array or numpy.ndarray
+            A buffer of doubles at least as long as the fleet.
+
+        Returns
+        -------
+        array.array or numpy.ndarray
+            The 'out' buffer.
+
+        """
+        if self.unit == 'fahrenheit':
+            return TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+                self._temperatures, out)
+        memoryview(out)[:len(self._temperatures)] = self.temperatures()
+        return out
+
+
+class _DictCelsiusTemperatureSensor(CelsiusTemperatureSensor):
+    """A sensor with a per-instance __dict__, as before __slots__."""
+
+
+class _DictFahrenheitTemperatureSensor(FahrenheitTemperatureSensor):
+    """A sensor with a per-instance __dict__, as before __slots__."""
+
+
+class _DictTemperatureSensorAdapter(TemperatureSensorAdapter):
+    """An adapter with a per-instance __dict__, as before __slots__."""
+
+
+def _measure(build) -> int:
+    """Return the bytes still allocated by the object that build returns."""
+    tracemalloc.start()
+    try:
+        kept = build()  # Kept alive until measured
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def memory_comparison(count: int = 100_000) -> dict:
+    """
+    Measure the memory used per sensor by each representation.
+
+    Every representation holds 'count' Celsius sensors plus 'count'
+    adapted Fahrenheit sensors.
+
+    Parameters
+    ----------
+    count : int, optional
+        The number of sensors of each kind.
+
+    Returns
+    -------
+    dict
+        Bytes per sensor pair, keyed by representation name.
+
+    """
+    builds = {
+        'objects with __dict__': lambda: (
+            [_DictCelsiusTemperatureSensor() for _ in range(count)],
+            [_DictTemperatureSensorAdapter(_DictFahrenheitTemperatureSensor())
+             for _ in range(count)]),
+        'objects with __slots__': lambda: (
+            [CelsiusTemperatureSensor() for _ in range(count)],
+            [TemperatureSensorAdapter(FahrenheitTemperatureSensor())
+             for _ in range(count)]),
+        'SensorFleet': lambda: (SensorFleet(count, 'celsius'),
+                                SensorFleet(count, 'fahrenheit')),
+    }
+    return {name: _measure(build) / count for name, build in builds.items()}
+
+
+if __name__ == "__main__":
+    sensor_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Memory per Celsius sensor + adapted Fahrenheit sensor "
+          f"({sensor_count} of each)")
+    for representation, size in memory_comparison(sensor_count).items():
+        print(f"{representation:>24}: {size:8.1f} bytes")
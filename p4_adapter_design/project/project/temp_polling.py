@@ -0,0 +1,265 @@
+"""
+Temperature Sensor Polling Script
+
+This script polls a fleet of temperature sensors concurrently with asyncio.
+Any object exposing 'get_temperature_celsius' can be polled, including
+CelsiusTemperatureSensor and TemperatureSensorAdapter, which lets adapted
+Fahrenheit sensors be polled side by side with Celsius sensors.
+
+Classes
+-------
+PollResult(NamedTuple):
+    A single reading taken from a sensor.
+
+SensorPoller:
+    A scheduler that polls every sensor at its own interval, bounds the
+    number of reads in flight and streams the readings through an async
+    iterator.
+
+Main Function
+-------------
+main():
+    Polls a small fleet of sensors and adapters and prints the readings.
+
+Usage
+-----
+Run this script to demonstrate concurrent polling of temperature sensors.
+
+"""
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from temp_adapter_script import (CelsiusTemperatureSensor,
+                                 FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+
+
+class PollResult(NamedTuple):
+    """
+    A single reading taken from a sensor.
+
+    Attributes
+    ----------
+    sensor : object
+        The sensor that was read.
+    temperature : float or None
+        The reading in Celsius, or None if the read failed.
+    timestamp : float
+        The time of the read in seconds since the epoch.
+    error : BaseException or None
+        The error raised by the read, or TimeoutError if it took too long.
+    """
+    sensor: object
+    temperature: float
+    timestamp: float
+    error: BaseException = None
+
+
+class SensorPoller:
+    """
+    SensorPoller class.
+
+    Polls sensors concurrently, each on its own schedule. Every sensor gets
+    its own polling task, so a slow sensor only delays its own next reading
+    and never the polling cycle of the others. Blocking reads run on a
+    thread pool, coroutine reads are awaited directly, and a semaphore
+    bounds how many reads are in flight at once.
+
+    A blocking read that times out cannot be interrupted, so it keeps its
+    thread and its place in the semaphore until it returns, and the next
+    read of that sensor waits for it. A hung sensor therefore holds at most
+    one thread and cannot starve the others. Readings wait in a bounded
+    queue, so a slow consumer pauses polling instead of piling them up.
+
+    Methods
+    -------
+    __init__(self, interval=1.0, max_in_flight=32, timeout=None,
+             max_queued=1024)
+        Initializes the poller with its default interval and limits.
+
+    add_sensor(self, sensor, interval=None)
+        Adds a sensor to poll, optionally with its own interval.
+
+    results(self)
+        Polls all sensors and yields PollResult objects as they arrive.
+
+    stop(self)
+        Stops polling and ends the results iterator.
+
+    """
+
+    def __init__(self, interval: float = 1.0, max_in_flight: int = 32,
+                 timeout: float = None, max_queued: int = 1024) -> None:
+        """
+        Initialize the poller.
+
+        Parameters
+        ----------
+        interval : float, optional
+            The default number of seconds between two reads of a sensor.
+        max_in_flight : int, optional
+            The maximum number of reads running at the same time.
+        timeout : float, optional
+            The number of seconds after which a read is reported as a
+            TimeoutError. By default reads never time out.
+        max_queued : int, optional
+            The maximum number of readings waiting for the consumer. Sensors
+            are not read while the queue is full.
+
+        """
+        self.interval = interval
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.max_queued = max_queued
+        self._sensors = []  # (sensor, interval) pairs
+        self._stopped = None
+
+    def add_sensor(self, sensor, interval: float = None) -> None:
+        """
+        Add a sensor to poll.
+
+        Parameters
+        ----------
+        sensor : object
+            Any object with a 'get_temperature_celsius' method, which may be
+            a plain or a coroutine function.
+        interval : float, optional
+            The number of seconds between two reads of this sensor. Defaults
+            to the interval of the poller.
+
+        Returns
+        -------
+        None
+
+        """
+        self._sensors.append(
+            (sensor, self.interval if interval is None else interval))
+
+    def __aiter__(self):
+        """Return the results iterator, see results."""
+        return self.results()
+
+    async def results(self):
+        """
+        Poll all sensors and yield readings as they arrive.
+
+        Polling runs until stop is called or the consumer stops iterating.
+        Failed reads are yielded with their error instead of ending the
+        iteration.
+
+        Yields
+        ------
+        PollResult
+            The next reading, from whichever sensor delivered it first.
+
+        """
+        queue = asyncio.Queue(self.max_queued)
+        self._stopped = asyncio.Event()
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        # Shut down without waiting, so a hung read never blocks the loop
+        executor = ThreadPoolExecutor(self.max_in_flight)
+        tasks = [asyncio.create_task(
+            self._poll(sensor, interval, queue, in_flight, executor))
+            for sensor, interval in self._sensors]
+        stopped = asyncio.create_task(self._stopped.wait())
+        try:
+            while True:
+                getter = asyncio.create_task(queue.get())
+                await asyncio.wait({getter, stopped},
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    break
+                yield getter.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            stopped.cancel()
+            await asyncio.gather(*tasks, stopped, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stop(self) -> None:
+        """
+        Stop polling and end the results iterator.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def _poll(self, sensor, interval, queue, in_flight, executor):
+        """Read one sensor on a fixed schedule until cancelled."""
+        loop = asyncio.get_running_loop()
+        read = sensor.get_temperature_celsius
+        blocking = not inspect.iscoroutinefunction(read)
+        outstanding = None  # A timed out blocking read still running
+        next_read = loop.time()
+        while True:
+            if outstanding is not None:
+                # Defer the read rather than queue another behind a hung one
+                await asyncio.wait({outstanding})
+                outstanding = None
+            await in_flight.acquire()
+            if blocking:
+                pending = asyncio.wrap_future(executor.submit(read))
+                # The slot is freed when the thread is, not at the timeout
+                pending.add_done_callback(lambda _: in_flight.release())
+                waited = asyncio.shield(pending)
+            else:
+                pending = waited = asyncio.ensure_future(read())
+                pending.add_done_callback(lambda _: in_flight.release())
+            try:
+                temperature = await asyncio.wait_for(waited, self.timeout)
+                error = None
+            except asyncio.TimeoutError:
+                temperature, error = None, TimeoutError(
+                    f"Read took longer than {self.timeout} seconds.")
+                if blocking:
+                    outstanding = pending
+            except Exception as the_error:  # Reported, not raised
+                temperature, error = None, the_error
+            await queue.put(PollResult(sensor, temperature, time.time(), error))
+
+            # Keep a fixed rate, skipping ticks missed by a slow read
+            next_read += interval
+            now = loop.time()
+            if next_read < now:
+                next_read = now
+            await asyncio.sleep(next_read - now)
+
+
+async def main():
+    """
+    Main function for demonstrating the SensorPoller.
+
+    Polls a Celsius sensor every 0.1 seconds and an adapted Fahrenheit
+    sensor every 0.2 seconds, then prints the readings.
+
+    Returns
+    -------
+    None
+
+    """
+    poller = SensorPoller(interval=0.1, max_in_flight=4)
+    poller.add_sensor(CelsiusTemperatureSensor())
+    poller.add_sensor(
+        TemperatureSensorAdapter(FahrenheitTemperatureSensor()), interval=0.2)
+
+    count = 0
+    async for result in poller:
+        name = type(result.sensor).__name__
+        print(f"{name}: {result.temperature:.2f} °C")
+        count += 1
+        if count == 6:
+            poller.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
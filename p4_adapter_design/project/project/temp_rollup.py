@@ -0,0 +1,292 @@
+"""
+Temperature Rollup Script
+
+This script downsamples sensor readings into multi-resolution rollups for
+long-term storage, for example 1-minute and 1-hour aggregates. Each reading
+updates the open bucket of every resolution in O(1). Closed buckets are
+kept in a bounded deque per resolution, so memory stays bounded however
+long the engine runs. Range queries combine the stored bucket aggregates
+and never touch raw readings.
+
+Classes
+-------
+Rollup:
+    The min/max/mean/count aggregate of the readings in one time bucket.
+
+Downsampler:
+    Maintains the rollups of a stream of readings at several resolutions.
+
+Main Function
+-------------
+if __name__ == "__main__":
+    Feeds a simulated day of adapted Fahrenheit readings through the
+    engine and prints the hourly rollups.
+
+Usage
+-----
+Run this script to demonstrate downsampling of sensor readings.
+
+"""
+
+import time
+from collections import deque
+
+from temp_adapter_script import (FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+
+
+class Rollup:
+    """
+    Rollup class.
+
+    The aggregate of the readings in one time bucket.
+
+    Attributes
+    ----------
+    start : float
+        The start of the bucket in seconds since the epoch. For the result
+        of a range query, the start of its first bucket.
+    minimum, maximum : float
+        The smallest and largest reading.
+    total : float
+        The sum of the readings.
+    count : int
+        The number of readings.
+    """
+
+    __slots__ = ('start', 'minimum', 'maximum', 'total', 'count')
+
+    def __init__(self, start: float, value: float) -> None:
+        """Initialize a bucket holding one reading."""
+        self.start = start
+        self.minimum = self.maximum = self.total = value
+        self.count = 1
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the readings."""
+        return self.total / self.count
+
+    def add(self, value: float) -> None:
+        """Add a reading to the bucket."""
+        if value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: 'Rollup') -> None:
+        """Add the readings of another aggregate to this one."""
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.total += other.total
+        self.count += other.count
+
+    def __repr__(self) -> str:
+        """Return a readable summary of the aggregate."""
+        return (f"Rollup(start={self.start}, min={self.minimum}, "
+                f"max={self.maximum}, mean={self.mean:.2f}, count={self.count})")
+
+
+class Downsampler:
+    """
+    Downsampler class.
+
+    Maintains the rollups of a stream of readings at several resolutions.
+    Readings must arrive in time order; a reading older than the open
+    bucket of a resolution is not added to that resolution and is counted
+    in 'late' instead.
+
+    Attributes
+    ----------
+    resolutions : tuple of float
+        The bucket sizes in seconds, finest first.
+    late : int
+        The number of (reading, resolution) pairs dropped for being late.
+
+    Methods
+    -------
+    __init__(self, resolutions=(60, 3600), retention=(1440, 720))
+        Initializes the engine with its resolutions and retention.
+
+    record(self, value, timestamp=None)
+        Adds a reading to every resolution in O(1).
+
+    record_sensor(self, sensor, timestamp=None)
+        Reads a sensor in Celsius and records the reading.
+
+    buckets(self, resolution, start=None, end=None)
+        Returns the rollups of one resolution in a time range.
+
+    query(self, start, end, resolution=None)
+        Returns the aggregate of all readings in a time range.
+
+    """
+
+    def __init__(self, resolutions: tuple = (60, 3600),
+                 retention: tuple = (1440, 720)) -> None:
+        """
+        Initialize the engine.
+
+        Parameters
+        ----------
+        resolutions : tuple of float, optional
+            The bucket sizes in seconds. Defaults to 1 minute and 1 hour.
+        retention : tuple of int, optional
+            The number of buckets kept per resolution, in the same order.
+            Defaults to one day of minutes and 30 days of hours.
+
+        Raises
+        ------
+        ValueError
+            If the two tuples differ in length or a value is not positive.
+
+        """
+        if len(resolutions) != len(retention):
+            raise ValueError("Give one retention per resolution.")
+        if min(resolutions, default=0) <= 0 or min(retention, default=0) <= 0:
+            raise ValueError("Resolutions and retention must be positive.")
+        pairs = sorted(zip(resolutions, retention))
+        self.resolutions = tuple(resolution for resolution, _ in pairs)
+        self._buckets = {resolution: deque(maxlen=kept)
+                         for resolution, kept in pairs}
+        self.late = 0
+
+    def record(self, value: float, timestamp: float = None) -> None:
+        """
+        Add a reading to every resolution in O(1).
+
+        Parameters
+        ----------
+        value : float
+            The reading.
+        timestamp : float, optional
+            The time of the reading in seconds since the epoch. Defaults to
+            the current time.
+
+        Returns
+        -------
+        None
+
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        for resolution, buckets in self._buckets.items():
+            start = timestamp - timestamp % resolution
+            if buckets and buckets[-1].start == start:
+                buckets[-1].add(value)
+            elif not buckets or buckets[-1].start < start:
+                buckets.append(Rollup(start, value))  # Drops the oldest
+            else:
+                self.late += 1
+
+    def record_sensor(self, sensor, timestamp: float = None) -> None:
+        """
+        Read a sensor in Celsius and record the reading.
+
+        Parameters
+        ----------
+        sensor : object
+            Any object with a 'get_temperature_celsius' method, such as
+            CelsiusTemperatureSensor or TemperatureSensorAdapter.
+        timestamp : float, optional
+            The time of the reading. Defaults to the current time.
+
+        Returns
+        -------
+        None
+
+        """
+        self.record(sensor.get_temperature_celsius(), timestamp)
+
+    def buckets(self, resolution: float, start: float = None,
+                end: float = None) -> list:
+        """
+        Return the rollups of one resolution in a time range.
+
+        Parameters
+        ----------
+        resolution : float
+            One of the resolutions of the engine.
+        start : float, optional
+            Only buckets starting at or after this time are returned.
+        end : float, optional
+            Only buckets starting before this time are returned.
+
+        Returns
+        -------
+        list of Rollup
+            The stored rollups, oldest first. The last one may still be
+            open. The caller must not modify them.
+
+        Raises
+        ------
+        KeyError
+            If the resolution is not one of the engine.
+
+        """
+        selected = []
+        for bucket in reversed(self._buckets[resolution]):
+            if start is not None and bucket.start < start:
+                break
+            if end is None or bucket.start < end:
+                selected.append(bucket)
+        selected.reverse()
+        return selected
+
+    def query(self, start: float, end: float,
+              resolution: float = None) -> Rollup:
+        """
+        Return the aggregate of all readings in a time range.
+
+        The stored rollups are merged; raw readings are never revisited. By
+        default the coarsest resolution whose buckets line up with both
+        ends of the range is used, so the fewest buckets are merged.
+
+        Parameters
+        ----------
+        start : float
+            The start of the range. Buckets starting before it are skipped.
+        end : float
+            The end of the range. Buckets starting at or after it are
+            skipped.
+        resolution : float, optional
+            The resolution to query. Defaults as described above, falling
+            back to the finest resolution.
+
+        Returns
+        -------
+        Rollup or None
+            The aggregate, or None if no readings fall in the range.
+
+        """
+        if resolution is None:
+            resolution = self.resolutions[0]
+            for candidate in reversed(self.resolutions):
+                if not start % candidate and not end % candidate:
+                    resolution = candidate
+                    break
+        result = None
+        for bucket in self.buckets(resolution, start, end):
+            if result is None:
+                result = Rollup(bucket.start, bucket.minimum)
+                result.maximum = bucket.maximum
+                result.total, result.count = bucket.total, bucket.count
+            else:
+                result.merge(bucket)
+        return result
+
+
+if __name__ == "__main__":
+    far_sensor = FahrenheitTemperatureSensor()
+    far_adapter = TemperatureSensorAdapter(far_sensor)
+    downsampler = Downsampler()
+
+    for second in range(0, 24 * 3600, 10):  # A day of 10-second readings
+        far_sensor.set_temperature(60 + 20 * (second % 86400) / 86400)
+        downsampler.record_sensor(far_adapter, timestamp=float(second))
+
+    for hour in downsampler.buckets(3600)[:3]:
+        print(hour)
+    print("Day:", downsampler.query(0, 24 * 3600))
@@ -0,0 +1,313 @@
+"""
+Temperature Log Streaming Script
+
+This script converts archived Fahrenheit sensor logs to Celsius as a
+stream. Readings are read lazily from CSV files or, through mmap, from
+fixed-width binary files of doubles. They are converted in chunks with the
+batch conversion of TemperatureSensorAdapter and written out as they go,
+so memory use stays flat regardless of the size of the log.
+
+Classes
+-------
+StreamStats:
+    Row count and throughput of a conversion run.
+
+Functions
+---------
+read_csv_readings(filename, column=0, skip_header=False):
+    Yields Fahrenheit readings from one column of a CSV file.
+
+read_binary_chunks(filename, chunk_size=65536):
+    Yields chunks of Fahrenheit readings from a binary file of doubles using
+    mmap.
+
+convert_stream(readings, write, chunk_size=65536):
+    Converts an iterable of Fahrenheit readings to Celsius chunk by chunk.
+
+convert_chunks(chunks, write):
+    Converts buffers of Fahrenheit readings to Celsius one by one.
+
+convert_csv_file(source, target, column=0, skip_header=False, chunk_size=65536):
+    Converts a CSV log to a CSV file of Celsius readings.
+
+convert_binary_file(source, target, chunk_size=65536):
+    Converts a binary log of doubles to a binary file of Celsius doubles.
+
+Main Function
+-------------
+if __name__ == "__main__":
+    Converts the file given on the command line and reports rows/sec.
+
+Usage
+-----
+python temp_stream.py SOURCE TARGET
+    Files ending in '.csv' are read and written as CSV, anything else as
+    native-endian doubles.
+
+"""
+
+import csv
+import mmap
+import sys
+import time
+from array import array
+from itertools import islice
+
+from temp_adapter_script import TemperatureSensorAdapter
+
+READING_SIZE = array('d').itemsize  # Bytes per reading in binary logs
+
+
+class StreamStats:
+    """
+    StreamStats class.
+
+    Row count and throughput of a conversion run.
+
+    Attributes
+    ----------
+    rows : int
+        The number of readings converted.
+    seconds : float
+        The wall-clock duration of the run.
+    """
+
+    def __init__(self, rows: int, seconds: float) -> None:
+        """Initialize the stats of a finished run."""
+        self.rows = rows
+        self.seconds = seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the conversion throughput."""
+        return self.rows / self.seconds if self.seconds else float('inf')
+
+    def __repr__(self) -> str:
+        """Return a readable summary of the run."""
+        return (f"StreamStats(rows={self.rows}, seconds={self.seconds:.3f}, "
+                f"rows_per_second={self.rows_per_second:.0f})")
+
+
+def read_csv_readings(filename: str, column: int = 0,
+                      skip_header: bool = False):
+    """
+    Yield Fahrenheit readings from one column of a CSV file.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the CSV file.
+    column : int, optional
+        The index of the column holding the readings.
+    skip_header : bool, optional
+        Whether the first row is a header.
+
+    Yields
+    ------
+    float
+        The next reading. Empty rows are skipped.
+
+    """
+    with open(filename, 'r', newline='') as csv_file:
+        rows = csv.reader(csv_file)
+        if skip_header:
+            next(rows, None)
+        for row in rows:
+            if row:
+                yield float(row[column])
+
+
+def read_binary_chunks(filename: str, chunk_size: int = 65536):
+    """
+    Yield chunks of Fahrenheit readings from a binary file of doubles.
+
+    The file is memory-mapped, so only the pages being read are loaded, and
+    each chunk is a view of the mapping: no reading is copied or turned
+    into a Python float. A chunk is only valid until the next one is
+    requested.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the binary file of native-endian doubles.
+    chunk_size : int, optional
+        The number of readings per chunk; the last chunk may be shorter.
+
+    Yields
+    ------
+    memoryview
+        The next chunk, a read-only view of doubles ('d').
+
+    Raises
+    ------
+    ValueError
+        If the file size is not a multiple of the reading size.
+
+    """
+    with open(filename, 'rb') as binary_file:
+        size = binary_file.seek(0, 2)
+        if size % READING_SIZE:
+            raise ValueError(
+                f'"{filename}" is not a whole number of {READING_SIZE}-byte readings.')
+        if not size:
+            return
+        with mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped).cast('d')
+            try:
+                for start in range(0, len(view), chunk_size):
+                    chunk = view[start:start + chunk_size]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+            finally:
+                view.release()  # The mmap cannot close while views exist
+
+
+def convert_stream(readings, write, chunk_size: int = 65536) -> StreamStats:
+    """
+    Convert an iterable of Fahrenheit readings to Celsius chunk by chunk.
+
+    Readings are collected into one reusable array('d') chunk, converted in
+    place with TemperatureSensorAdapter.fahrenheit_to_celsius_batch and
+    handed to 'write'. Only one chunk is ever held in memory.
+
+    Parameters
+    ----------
+    readings : iterable of float
+        The Fahrenheit readings, for example from read_csv_readings.
+    write : callable
+        Called with each converted chunk. The chunk is reused afterwards,
+        so 'write' must consume it before returning.
+    chunk_size : int, optional
+        The number of readings converted per batch.
+
+    Returns
+    -------
+    StreamStats
+        The number of rows converted and the throughput.
+
+    """
+    start = time.perf_counter()
+    rows = 0
+    chunk = array('d', bytes(READING_SIZE * chunk_size))
+    readings = iter(readings)
+    while True:
+        count = 0
+        for count, reading in enumerate(islice(readings, chunk_size), 1):
+            chunk[count - 1] = reading
+        if not count:
+            break
+        view = memoryview(chunk)[:count]
+        TemperatureSensorAdapter.fahrenheit_to_celsius_batch(view, view)
+        write(view)
+        view.release()
+        rows += count
+        if count < chunk_size:
+            break
+    return StreamStats(rows, time.perf_counter() - start)
+
+
+def convert_chunks(chunks, write) -> StreamStats:
+    """
+    Convert buffers of Fahrenheit readings to Celsius one by one.
+
+    Each buffer is converted with one call to
+    TemperatureSensorAdapter.fahrenheit_to_celsius_batch into a reusable
+    array('d'), so read-only buffers such as views of a memory-mapped file
+    are converted without copying them first.
+
+    Parameters
+    ----------
+    chunks : iterable of buffers
+        Buffers of Fahrenheit doubles, for example from read_binary_chunks.
+    write : callable
+        Called with each converted chunk. The chunk is reused afterwards,
+        so 'write' must consume it before returning.
+
+    Returns
+    -------
+    StreamStats
+        The number of rows converted and the throughput.
+
+    """
+    start = time.perf_counter()
+    rows = 0
+    converted = array('d')
+    for readings in chunks:
+        count = len(readings)
+        if len(converted) < count:
+            converted = array('d', bytes(READING_SIZE * count))
+        view = memoryview(converted)[:count]
+        TemperatureSensorAdapter.fahrenheit_to_celsius_batch(readings, view)
+        write(view)
+        view.release()
+        rows += count
+    return StreamStats(rows, time.perf_counter() - start)
+
+
+def convert_csv_file(source: str, target: str, column: int = 0,
+                     skip_header: bool = False,
+                     chunk_size: int = 65536) -> StreamStats:
+    """
+    Convert a CSV log of Fahrenheit readings to a CSV file of Celsius ones.
+
+    Parameters
+    ----------
+    source : str
+        The path to the Fahrenheit CSV log.
+    target : str
+        The path to write the Celsius readings to, one per row.
+    column, skip_header
+        See read_csv_readings.
+    chunk_size : int, optional
+        The number of readings converted per batch.
+
+    Returns
+    -------
+    StreamStats
+        The number of rows converted and the throughput.
+
+    """
+    with open(target, 'w', newline='') as csv_file:
+        def write(chunk):
+            csv_file.write(''.join(f'{celsius:.2f}\n' for celsius in chunk))
+        return convert_stream(read_csv_readings(source, column, skip_header),
+                              write, chunk_size)
+
+
+def convert_binary_file(source: str, target: str,
+                        chunk_size: int = 65536) -> StreamStats:
+    """
+    Convert a binary log of Fahrenheit doubles to Celsius doubles.
+
+    Parameters
+    ----------
+    source : str
+        The path to the Fahrenheit log of native-endian doubles.
+    target : str
+        The path to write the Celsius doubles to.
+    chunk_size : int, optional
+        The number of readings converted per batch.
+
+    Returns
+    -------
+    StreamStats
+        The number of rows converted and the throughput.
+
+    """
+    with open(target, 'wb') as binary_file:
+        return convert_chunks(read_binary_chunks(source, chunk_size),
+                              binary_file.write)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(__doc__)
+    source_path, target_path = sys.argv[1:]
+    if source_path.endswith('.csv'):
+        stats = convert_csv_file(source_path, target_path)
+    else:
+        stats = convert_binary_file(source_path, target_path)
+    print(f"Converted {stats.rows} rows in {stats.seconds:.3f} s "
+          f"({stats.rows_per_second:.0f} rows/sec)")
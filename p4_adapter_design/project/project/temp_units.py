@@ -0,0 +1,296 @@
+"""
+Temperature Unit Registry Script
+
+This script generalizes the Adapter Design Pattern of temp_adapter_script to
+any temperature unit. Conversions between units are registered once as
+linear transforms. A conversion between any two registered units, such as
+kelvin to celsius through fahrenheit, is composed by following the
+registered conversions and fused into a single shift and divisor, which is
+cached per unit pair. An adapter therefore pays one add and one division
+per reading, however many conversions it chains.
+
+Conversions are kept in the form '(value + shift) / divisor' rather than
+'value * scale + offset', so that fahrenheit to celsius computes exactly
+'(value - 32) / 1.8' like TemperatureSensorAdapter, and rounds the same.
+
+Classes
+-------
+LinearConversion(NamedTuple):
+    A conversion of the form '(value + shift) / divisor'.
+
+ConversionRegistry:
+    A registry of conversions between named units, composing and caching
+    the conversion for any pair of connected units.
+
+UnitSensorAdapter:
+    An adapter making a sensor of any registered unit compatible with
+    CelsiusTemperatureSensor.
+
+Global variables
+----------------
+DEFAULT_REGISTRY : ConversionRegistry
+    A registry of the celsius, fahrenheit, kelvin and rankine units.
+
+Main Function
+-------------
+if __name__ == "__main__":
+    Adapts a Fahrenheit sensor and displays its temperature, and shows a
+    composed kelvin to rankine conversion.
+
+Usage
+-----
+Run this script to demonstrate adapters built from the unit registry.
+
+"""
+
+from collections import deque
+from typing import NamedTuple
+
+from temp_adapter_script import FahrenheitTemperatureSensor, display_temperature
+
+
+class LinearConversion(NamedTuple):
+    """
+    A conversion of the form '(value + shift) / divisor'.
+
+    Attributes
+    ----------
+    shift : float
+        The amount added to the value.
+    divisor : float
+        The divisor applied after shifting.
+    """
+    shift: float
+    divisor: float
+
+    def __call__(self, value: float) -> float:
+        """Convert a value."""
+        return (value + self.shift) / self.divisor
+
+    def undo(self, value: float) -> float:
+        """Convert a value back, as 'value * divisor - shift'."""
+        return value * self.divisor - self.shift
+
+    @property
+    def scale(self) -> float:
+        """Return the factor of the equivalent 'value * scale + offset'."""
+        return 1 / self.divisor
+
+    @property
+    def offset(self) -> float:
+        """Return the offset of the equivalent 'value * scale + offset'."""
+        return self.shift / self.divisor
+
+    def then(self, other: 'LinearConversion') -> 'LinearConversion':
+        """Return the single conversion applying self, then other."""
+        return LinearConversion(self.shift + other.shift * self.divisor,
+                                self.divisor * other.divisor)
+
+    def inverse(self) -> 'LinearConversion':
+        """Return the conversion undoing this one."""
+        return LinearConversion(-self.shift / self.divisor, 1 / self.divisor)
+
+
+IDENTITY = LinearConversion(0.0, 1.0)
+
+
+class ConversionRegistry:
+    """
+    ConversionRegistry class.
+
+    A registry of linear conversions between named units. Registering a
+    conversion also registers its inverse. Looking up the conversion between
+    two units composes the registered conversions along the shortest path
+    between them and caches the fused result per unit pair.
+
+    Methods
+    -------
+    register(self, source, target, shift=0.0, divisor=1.0)
+        Registers the conversion from one unit to another, and its inverse.
+
+    get(self, source, target)
+        Returns the fused conversion from one unit to another.
+
+    units(self)
+        Returns the registered unit names.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._edges = {}  # unit -> {neighbour unit: LinearConversion}
+        self._cache = {}  # (source, target) -> fused LinearConversion
+
+    def register(self, source: str, target: str, shift: float = 0.0,
+                 divisor: float = 1.0) -> None:
+        """
+        Register the conversion from one unit to another, and its inverse.
+
+        Parameters
+        ----------
+        source : str
+            The unit converted from, for example 'fahrenheit'.
+        target : str
+            The unit converted to, for example 'celsius'.
+        shift : float, optional
+            The amount added to a value in the source unit.
+        divisor : float, optional
+            The divisor applied after shifting.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the divisor is zero.
+
+        """
+        if not divisor:
+            raise ValueError("A conversion divisor cannot be zero.")
+        conversion = LinearConversion(float(shift), float(divisor))
+        self._edges.setdefault(source, {})[target] = conversion
+        self._edges.setdefault(target, {})[source] = conversion.inverse()
+        self._cache.clear()  # New conversions may give shorter paths
+
+    def get(self, source: str, target: str) -> LinearConversion:
+        """
+        Return the fused conversion from one unit to another.
+
+        Parameters
+        ----------
+        source : str
+            The unit converted from.
+        target : str
+            The unit converted to.
+
+        Returns
+        -------
+        LinearConversion
+            A single conversion equal to the chain of registered ones.
+
+        Raises
+        ------
+        KeyError
+            If either unit is unknown or the units are not connected.
+
+        """
+        try:
+            return self._cache[(source, target)]
+        except KeyError:
+            pass
+        for unit in (source, target):
+            if unit not in self._edges:
+                raise KeyError(f'The unit : "{unit}" is not registered.')
+
+        # Breadth-first search, fusing the conversions along the way
+        fused = {source: IDENTITY}
+        queue = deque([source])
+        while queue and target not in fused:
+            unit = queue.popleft()
+            for neighbour, conversion in self._edges[unit].items():
+                if neighbour not in fused:
+                    fused[neighbour] = fused[unit].then(conversion)
+                    queue.append(neighbour)
+        if target not in fused:
+            raise KeyError(f'No conversion from "{source}" to "{target}".')
+        self._cache[(source, target)] = fused[target]
+        return fused[target]
+
+    def units(self) -> list:
+        """Return the registered unit names."""
+        return list(self._edges)
+
+
+DEFAULT_REGISTRY = ConversionRegistry()
+DEFAULT_REGISTRY.register('fahrenheit', 'celsius', -32, 1.8)
+DEFAULT_REGISTRY.register('celsius', 'kelvin', 273.15)
+DEFAULT_REGISTRY.register('fahrenheit', 'rankine', 459.67)
+
+
+class UnitSensorAdapter:
+    """
+    UnitSensorAdapter class.
+
+    An adapter making a sensor of any registered unit compatible with
+    CelsiusTemperatureSensor. The sensor is read with its
+    'get_temperature_<unit>' method and written with 'set_temperature'. The
+    fused conversion to Celsius is looked up once, when the adapter is
+    created, and undone to write Celsius values, so a Fahrenheit sensor is
+    read and written with exactly the arithmetic of TemperatureSensorAdapter.
+
+    Methods
+    -------
+    __init__(self, sensor, unit, registry=DEFAULT_REGISTRY)
+        Initializes the adapter for a sensor reading in the given unit.
+
+    set_temperature(self, temperature)
+        Sets the temperature of the sensor from a value in Celsius.
+
+    get_temperature_celsius(self)
+        Retrieves the current temperature reading in Celsius.
+
+    """
+
+    def __init__(self, sensor, unit: str,
+                 registry: ConversionRegistry = DEFAULT_REGISTRY) -> None:
+        """
+        Initialize the adapter for a sensor reading in the given unit.
+
+        Parameters
+        ----------
+        sensor : object
+            A sensor with 'set_temperature' and 'get_temperature_<unit>'
+            methods, such as FahrenheitTemperatureSensor.
+        unit : str
+            The unit of the sensor, for example 'fahrenheit'.
+        registry : ConversionRegistry, optional
+            The registry to look the conversions up in.
+
+        Raises
+        ------
+        KeyError
+            If the unit cannot be converted to Celsius.
+
+        """
+        self._sensor = sensor
+        self._read = getattr(sensor, f'get_temperature_{unit}')
+        self._to_celsius = registry.get(unit, 'celsius')
+
+    def set_temperature(self, temperature: float) -> None:
+        """
+        Set the temperature of the sensor from a value in Celsius.
+
+        Parameters
+        ----------
+        temperature : float
+            The new temperature value in Celsius.
+
+        Returns
+        -------
+        None
+
+        """
+        self._sensor.set_temperature(round(self._to_celsius.undo(temperature), 2))
+
+    def get_temperature_celsius(self) -> float:
+        """
+        Retrieve the current temperature reading in Celsius.
+
+        Returns
+        -------
+        float
+            The current temperature reading in Celsius.
+
+        """
+        return round(self._to_celsius(self._read()), 2)
+
+
+if __name__ == "__main__":
+    far_adapter = UnitSensorAdapter(FahrenheitTemperatureSensor(), 'fahrenheit')
+    display_temperature(far_adapter)  # -> 77°F conv to 25°C
+
+    kelvin_to_rankine = DEFAULT_REGISTRY.get('kelvin', 'rankine')
+    print(f"0 K = {kelvin_to_rankine(0):.2f} °R "
+          f"(x{kelvin_to_rankine.scale:.2f} {kelvin_to_rankine.offset:+.2f})")
@@ -0,0 +1,258 @@
+"""
+Temperature Sensor Adapter Unit Tests
+
+This module contains unit tests for the temperature sensor adapter script,
+which uses the Adapter Design Pattern to make a FahrenheitTemperatureSensor
+usable wherever a CelsiusTemperatureSensor is expected.
+
+Classes
+-------
+TestSensorHistory(unittest.TestCase):
+    A test case class for testing the SensorHistory ring buffer.
+
+TestTemperatureSensors(unittest.TestCase):
+    A test case class for testing the Celsius and Fahrenheit sensors.
+
+TestTemperatureSensorAdapter(unittest.TestCase):
+    A test case class for testing the TemperatureSensorAdapter class.
+
+TestNumpyBatch(unittest.TestCase):
+    A test case class for testing the batch conversion with NumPy.
+
+Global functions
+----------------
+None
+"""
+
+import random
+import tracemalloc
+import unittest
+from array import array
+from temp_adapter_script import (ROUNDING_BLOCK, SensorHistory, CelsiusTemperatureSensor,
+                                 FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TestSensorHistory(unittest.TestCase):
+    """
+    TestSensorHistory Class
+
+    A test case class for testing the SensorHistory ring buffer.
+
+    Methods
+    -------
+    test_empty_history(self):
+        Test the statistics and views of an empty history.
+    test_recent_values_wrap_around(self):
+        Test that recent readings stay in order once the buffer wraps.
+    test_rolling_statistics(self):
+        Test that min, max and mean follow the readings held.
+    test_invalid_capacity(self):
+        Test that a capacity below 1 is rejected.
+    """
+    def test_empty_history(self):
+        """Test the statistics and views of an empty history."""
+        history = SensorHistory(3)
+        self.assertEqual(len(history), 0)
+        self.assertIsNone(history.minimum)
+        self.assertIsNone(history.maximum)
+        self.assertIsNone(history.mean)
+        self.assertEqual(list(history.recent_values()), [])
+
+    def test_recent_values_wrap_around(self):
+        """Test that recent readings stay in order once the buffer wraps."""
+        history = SensorHistory(3)
+        for second, value in enumerate([1, 2, 3, 4, 5]):
+            history.append(value, timestamp=float(second))
+        self.assertEqual(len(history), 3)
+        self.assertEqual(list(history.recent_values()), [3.0, 4.0, 5.0])
+        self.assertEqual(list(history.recent_values(2)), [4.0, 5.0])
+        self.assertEqual(list(history.recent_timestamps(2)), [3.0, 4.0])
+        self.assertIsInstance(history.recent_values(), memoryview)
+
+    def test_rolling_statistics(self):
+        """Test that min, max and mean follow the readings held."""
+        history = SensorHistory(3)
+        readings = [5, 1, 9, 7, 8, 2, 3]
+        for index, value in enumerate(readings):
+            history.append(value)
+            window = readings[max(0, index - 2):index + 1]
+            self.assertEqual(history.minimum, min(window))
+            self.assertEqual(history.maximum, max(window))
+            self.assertAlmostEqual(history.mean, sum(window) / len(window))
+
+    def test_invalid_capacity(self):
+        """Test that a capacity below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            SensorHistory(0)
+
+class TestTemperatureSensors(unittest.TestCase):
+    """
+    TestTemperatureSensors Class
+
+    A test case class for testing the Celsius and Fahrenheit sensors.
+
+    Methods
+    -------
+    test_default_temperatures(self):
+        Test the default readings of both sensors.
+    test_set_temperature(self):
+        Test that set_temperature changes the reading of both sensors.
+    test_history(self):
+        Test that sensors record their readings when a history is enabled.
+    """
+    def test_default_temperatures(self):
+        """Test the default readings of both sensors."""
+        self.assertEqual(CelsiusTemperatureSensor().get_temperature_celsius(), 25)
+        self.assertEqual(
+            FahrenheitTemperatureSensor().get_temperature_fahrenheit(), 77)
+
+    def test_set_temperature(self):
+        """Test that set_temperature changes the reading of both sensors."""
+        cel_sensor = CelsiusTemperatureSensor()
+        far_sensor = FahrenheitTemperatureSensor()
+        cel_sensor.set_temperature(10)
+        far_sensor.set_temperature(50)
+        self.assertEqual(cel_sensor.get_temperature_celsius(), 10)
+        self.assertEqual(far_sensor.get_temperature_fahrenheit(), 50)
+
+    def test_history(self):
+        """Test that sensors record their readings when a history is enabled."""
+        self.assertIsNone(CelsiusTemperatureSensor().history)
+        far_sensor = FahrenheitTemperatureSensor(history_capacity=2)
+        TemperatureSensorAdapter(far_sensor).set_temperature(100)
+        self.assertEqual(list(far_sensor.history.recent_values()), [77.0, 212.0])
+
+class TestTemperatureSensorAdapter(unittest.TestCase):
+    """
+    TestTemperatureSensorAdapter Class
+
+    A test case class for testing the TemperatureSensorAdapter class.
+
+    Methods
+    -------
+    setUp(self):
+        Set up the test environment before each test method.
+    test_get_temperature_celsius(self):
+        Test the Fahrenheit to Celsius conversion of the adapter.
+    test_set_temperature(self):
+        Test the Celsius to Fahrenheit conversion of the adapter.
+    test_batch_matches_scalar(self):
+        Test that the batch conversion matches the scalar conversion.
+    test_batch_in_place(self):
+        Test converting a buffer in place.
+    test_batch_short_output(self):
+        Test that a too short output buffer is rejected.
+    test_batch_wrong_format(self):
+        Test that buffers not holding doubles are rejected.
+    """
+    def setUp(self) -> None:
+        """Set up the test environment before each test method."""
+        self.far_sensor = FahrenheitTemperatureSensor()
+        self.adapter = TemperatureSensorAdapter(self.far_sensor)
+
+    def test_get_temperature_celsius(self):
+        """Test the Fahrenheit to Celsius conversion of the adapter."""
+        self.far_sensor.set_temperature(100)
+        self.assertEqual(self.adapter.get_temperature_celsius(), 37.78)
+
+    def test_set_temperature(self):
+        """Test the Celsius to Fahrenheit conversion of the adapter."""
+        self.adapter.set_temperature(0)
+        self.assertEqual(self.far_sensor.get_temperature_fahrenheit(), 32)
+        self.assertEqual(self.adapter.get_temperature_celsius(), 0)
+
+    def test_batch_matches_scalar(self):
+        """Test that the batch conversion matches the scalar conversion."""
+        readings = array('d', [-40, 0, 32, 77, 100, 212.5])
+        out = array('d', [0.0] * len(readings))
+        result = TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+            readings, out)
+        self.assertIs(result, out)
+        for fahrenheit, celsius in zip(readings, out):
+            self.far_sensor.set_temperature(fahrenheit)
+            self.assertEqual(celsius, self.adapter.get_temperature_celsius())
+
+    def test_batch_in_place(self):
+        """Test converting a buffer in place."""
+        readings = array('d', [32, 212])
+        TemperatureSensorAdapter.fahrenheit_to_celsius_batch(readings, readings)
+        self.assertEqual(list(readings), [0.0, 100.0])
+
+    def test_batch_short_output(self):
+        """Test that a too short output buffer is rejected."""
+        with self.assertRaises(ValueError):
+            TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+                array('d', [1, 2, 3]), array('d', [0.0]))
+
+    def test_batch_wrong_format(self):
+        """Test that buffers not holding doubles are rejected."""
+        with self.assertRaises(TypeError):
+            TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+                array('i', [1, 2]), array('d', [0.0, 0.0]))
+
+@unittest.skipUnless(np, "NumPy is not installed")
+class TestNumpyBatch(unittest.TestCase):
+    """
+    TestNumpyBatch Class
+
+    A test case class for testing the batch conversion with NumPy.
+
+    Methods
+    -------
+    test_rounding_matches_scalar(self):
+        Test that the vectorized rounding matches round(x, 2) exactly.
+    test_array_buffers(self):
+        Test that array('d') buffers are converted through NumPy views.
+    test_wrong_format(self):
+        Test that buffers not holding doubles are rejected.
+    test_scratch_is_bounded(self):
+        Test that the scratch memory does not grow with the input.
+    """
+    def test_rounding_matches_scalar(self):
+        """Test that the vectorized rounding matches round(x, 2) exactly."""
+        generator = random.Random(1)
+        readings = [219.911] + [round(generator.uniform(-500, 500), 3)
+                                for _ in range(20000)]
+        out = np.empty(len(readings))
+        TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+            np.array(readings), out)
+        self.assertEqual(out[0], 104.39)
+        self.assertEqual(out.tolist(),
+                         [round((fahrenheit - 32) / 1.8, 2)
+                          for fahrenheit in readings])
+
+    def test_array_buffers(self):
+        """Test that array('d') buffers are converted through NumPy views."""
+        readings = array('d', [32, 212, 219.911])
+        out = array('d', [0.0] * 4)
+        result = TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+            readings, out)
+        self.assertIs(result, out)
+        self.assertEqual(list(out), [0.0, 100.0, 104.39, 0.0])
+
+    def test_wrong_format(self):
+        """Test that buffers not holding doubles are rejected."""
+        with self.assertRaises(TypeError):
+            TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+                array('i', [1, 2]), np.empty(2))
+
+    def test_scratch_is_bounded(self):
+        """Test that the scratch memory does not grow with the input."""
+        readings = np.linspace(-500, 500, 50 * ROUNDING_BLOCK)
+        out = np.empty_like(readings)
+        tracemalloc.start()
+        try:
+            TemperatureSensorAdapter.fahrenheit_to_celsius_batch(readings, out)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 8 * ROUNDING_BLOCK * 8)
+        self.assertEqual(out[-1], 260.0)
+
+if __name__ == '__main__':
+    unittest.main()
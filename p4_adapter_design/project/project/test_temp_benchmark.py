@@ -0,0 +1,78 @@
+"""
+Temperature Adapter Benchmark Unit Tests
+
+This module contains unit tests for the temp_benchmark script, which
+micro-benchmarks the hot paths of the temperature adapter.
+
+Classes
+-------
+TestBenchmark(unittest.TestCase):
+    A test case class for testing the benchmark harness.
+
+Global functions
+----------------
+None
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+from temp_benchmark import (BenchmarkResult, benchmark_cases, run_case,
+                            save_results, load_results, compare_results, main)
+
+class TestBenchmark(unittest.TestCase):
+    """
+    TestBenchmark Class
+
+    A test case class for testing the benchmark harness.
+
+    Methods
+    -------
+    test_cases_run(self):
+        Test that every benchmark case can be called.
+    test_run_case(self):
+        Test the measurements of a single case.
+    test_save_load_compare(self):
+        Test the JSON round trip and the regression check.
+    test_main(self):
+        Test running the benchmarks from the command line.
+    """
+    def test_cases_run(self):
+        """Test that every benchmark case can be called."""
+        names = set()
+        for name, operation, ops_per_call in benchmark_cases(batch_size=10):
+            operation()
+            names.add(name)
+            self.assertGreaterEqual(ops_per_call, 1)
+        self.assertIn('adapter.get_temperature_celsius', names)
+
+    def test_run_case(self):
+        """Test the measurements of a single case."""
+        ns_per_op, alloc_bytes, blocks = run_case(lambda: None, repeat=2,
+                                                  min_time=0.001)
+        self.assertGreater(ns_per_op, 0)
+        self.assertGreaterEqual(alloc_bytes, 0)
+        self.assertLess(abs(blocks), 1)
+
+    def test_save_load_compare(self):
+        """Test the JSON round trip and the regression check."""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'results.json')
+            save_results([BenchmarkResult('case', 100.0, 0.0, 0.0)], filename)
+            baseline = load_results(filename)
+        self.assertEqual(baseline['case']['ns_per_op'], 100.0)
+        comparison = compare_results(
+            baseline, [BenchmarkResult('case', 120.0, 0.0, 0.0),
+                       BenchmarkResult('new case', 1.0, 0.0, 0.0)])
+        self.assertEqual(comparison, [('case', 100.0, 120.0, 1.2, True)])
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_main(self, mock_stdout):
+        """Test running the benchmarks from the command line."""
+        self.assertEqual(main(['--repeat', '1', '--min-time', '0.0001']), 0)
+        self.assertIn('ns/op', mock_stdout.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
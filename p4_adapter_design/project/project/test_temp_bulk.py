@@ -0,0 +1,98 @@
+"""
+Temperature Bulk Conversion Unit Tests
+
+This module contains unit tests for the temp_bulk script, which converts
+large sets of Fahrenheit readings on a process pool through shared memory.
+
+Classes
+-------
+TestBulkConvert(unittest.TestCase):
+    A test case class for testing bulk_convert.
+
+Global functions
+----------------
+None
+"""
+
+import unittest
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+from temp_adapter_script import TemperatureSensorAdapter
+from temp_bulk import benchmark, bulk_convert
+
+class TestBulkConvert(unittest.TestCase):
+    """
+    TestBulkConvert Class
+
+    A test case class for testing bulk_convert.
+
+    Methods
+    -------
+    setUp(self):
+        Create readings and their expected Celsius values.
+    test_process_pool(self):
+        Test that chunks converted by workers match the batch conversion.
+    test_single_worker(self):
+        Test converting in this process into a given buffer.
+    test_invalid_arguments(self):
+        Test that short outputs and empty chunks are rejected.
+    test_wrong_format(self):
+        Test that buffers not holding doubles are rejected.
+    test_given_executor(self):
+        Test converting on a pool that is reused and left running.
+    test_benchmark(self):
+        Test that the benchmark reports the pool startup separately.
+    """
+    def setUp(self) -> None:
+        """Create readings and their expected Celsius values."""
+        self.readings = array('d', (i / 10 for i in range(-500, 2500)))
+        self.expected = array('d', bytes(8 * len(self.readings)))
+        TemperatureSensorAdapter.fahrenheit_to_celsius_batch(
+            self.readings, self.expected)
+
+    def test_process_pool(self):
+        """Test that chunks converted by workers match the batch conversion."""
+        result = bulk_convert(self.readings, chunk_size=700, workers=2)
+        self.assertEqual(result, self.expected)
+
+    def test_single_worker(self):
+        """Test converting in this process into a given buffer."""
+        out = array('d', bytes(8 * len(self.readings)))
+        self.assertIs(bulk_convert(self.readings, out, workers=1), out)
+        self.assertEqual(out, self.expected)
+
+    def test_invalid_arguments(self):
+        """Test that short outputs and empty chunks are rejected."""
+        with self.assertRaises(ValueError):
+            bulk_convert(self.readings, array('d', [0.0]))
+        with self.assertRaises(ValueError):
+            bulk_convert(self.readings, chunk_size=0)
+
+    def test_wrong_format(self):
+        """Test that buffers not holding doubles are rejected."""
+        with self.assertRaises(TypeError):
+            bulk_convert(array('i', [32, 212, 50, 100]), workers=1)
+        with self.assertRaises(TypeError):
+            bulk_convert(self.readings, array('f', [0.0] * len(self.readings)),
+                         workers=1)
+
+    def test_given_executor(self):
+        """Test converting on a pool that is reused and left running."""
+        with ProcessPoolExecutor(2) as executor:
+            for _ in range(2):
+                result = bulk_convert(self.readings, chunk_size=700,
+                                      executor=executor)
+                self.assertEqual(result, self.expected)
+            self.assertEqual(executor.submit(abs, -1).result(), 1)
+
+    def test_benchmark(self):
+        """Test that the benchmark reports the pool startup separately."""
+        with patch('temp_bulk.os.cpu_count', return_value=2):
+            results = benchmark(count=4000, chunk_size=1000, repeat=1)
+        self.assertEqual([result[0] for result in results], [1, 2])
+        self.assertEqual(results[0][2:], (1.0, 0.0))
+        self.assertGreater(results[1][3], 0)
+
+if __name__ == '__main__':
+    unittest.main()
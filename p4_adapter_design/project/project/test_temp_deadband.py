@@ -0,0 +1,86 @@
+"""
+Temperature Deadband Unit Tests
+
+This module contains unit tests for the temp_deadband script, which
+filters sensor reads down to the readings that changed.
+
+Classes
+-------
+TestDeadbandFilter(unittest.TestCase):
+    A test case class for testing the DeadbandFilter class.
+
+Global functions
+----------------
+None
+"""
+
+import unittest
+from temp_adapter_script import (CelsiusTemperatureSensor,
+                                 FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+from temp_deadband import DeadbandFilter
+
+class TestDeadbandFilter(unittest.TestCase):
+    """
+    TestDeadbandFilter Class
+
+    A test case class for testing the DeadbandFilter class.
+
+    Methods
+    -------
+    test_repeated_values_suppressed(self):
+        Test that unchanged readings are suppressed and counted.
+    test_threshold(self):
+        Test that changes below the threshold are suppressed.
+    test_changed_since(self):
+        Test querying the sensors changed after a version.
+    test_poll(self):
+        Test reading several sensors at once.
+    """
+    def test_repeated_values_suppressed(self):
+        """Test that unchanged readings are suppressed and counted."""
+        deadband = DeadbandFilter()
+        sensor = CelsiusTemperatureSensor()
+        self.assertEqual(deadband.read(sensor), 25)
+        self.assertIsNone(deadband.read(sensor))
+        sensor.set_temperature(26)
+        self.assertEqual(deadband.read(sensor), 26)
+        self.assertEqual((deadband.version, deadband.suppressed), (2, 1))
+
+    def test_threshold(self):
+        """Test that changes below the threshold are suppressed."""
+        deadband = DeadbandFilter(threshold=1.0)
+        far_sensor = FahrenheitTemperatureSensor()
+        adapter = TemperatureSensorAdapter(far_sensor)
+        deadband.read(adapter)  # 25 °C
+        far_sensor.set_temperature(78)  # 25.56 °C
+        self.assertIsNone(deadband.read(adapter))
+        far_sensor.set_temperature(79)  # 26.11 °C, compared against 25 °C
+        self.assertEqual(deadband.read(adapter), 26.11)
+        self.assertEqual(deadband.last_value(adapter), 26.11)
+
+    def test_changed_since(self):
+        """Test querying the sensors changed after a version."""
+        deadband = DeadbandFilter()
+        first, second, third = (CelsiusTemperatureSensor() for _ in range(3))
+        deadband.poll([first, second, third])
+        seen = deadband.version
+        self.assertEqual(deadband.changed_since(seen), [])
+        first.set_temperature(30)
+        deadband.poll([first, second, third])
+        self.assertEqual(deadband.changed_since(seen), [(first, 30)])
+        self.assertEqual(len(deadband.changed_since(0)), 3)
+
+    def test_poll(self):
+        """Test reading several sensors at once."""
+        deadband = DeadbandFilter()
+        sensors = [CelsiusTemperatureSensor() for _ in range(3)]
+        self.assertEqual(len(deadband.poll(sensors)), 3)
+        sensors[2].set_temperature(0)
+        self.assertEqual(deadband.poll(sensors), [(sensors[2], 0)])
+        self.assertEqual(deadband.suppressed, 2)
+        with self.assertRaises(KeyError):
+            deadband.last_value(CelsiusTemperatureSensor())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Temperature Sensor Fleet Unit Tests
+
+This module contains unit tests for the temp_fleet script, which stores the
+temperatures of many sensors in one contiguous array.
+
+Classes
+-------
+TestSensorFleet(unittest.TestCase):
+    A test case class for testing the SensorFleet class and its views.
+
+Global functions
+----------------
+None
+"""
+
+import unittest
+from array import array
+from temp_adapter_script import (CelsiusTemperatureSensor,
+                                 FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+from temp_fleet import SensorFleet, memory_comparison
+
+class TestSensorFleet(unittest.TestCase):
+    """
+    TestSensorFleet Class
+
+    A test case class for testing the SensorFleet class and its views.
+
+    Methods
+    -------
+    test_slotted_sensors(self):
+        Test that the sensor classes carry no per-instance __dict__.
+    test_celsius_views(self):
+        Test that Celsius views read and write the fleet array.
+    test_fahrenheit_views(self):
+        Test that Fahrenheit views behave like adapted sensors.
+    test_temperatures_celsius(self):
+        Test the batch conversion of a whole fleet.
+    test_invalid_index_and_unit(self):
+        Test invalid indexes and units.
+    test_memory_comparison(self):
+        Test that the fleet uses less memory than sensor objects.
+    """
+    def test_slotted_sensors(self):
+        """Test that the sensor classes carry no per-instance __dict__."""
+        for sensor in (CelsiusTemperatureSensor(), FahrenheitTemperatureSensor(),
+                       TemperatureSensorAdapter(FahrenheitTemperatureSensor())):
+            self.assertFalse(hasattr(sensor, '__dict__'))
+
+    def test_celsius_views(self):
+        """Test that Celsius views read and write the fleet array."""
+        fleet = SensorFleet(3)
+        self.assertEqual(fleet.add(30), 3)
+        fleet[1].set_temperature(10)
+        self.assertEqual([fleet[i].get_temperature_celsius() for i in range(4)],
+                         [25, 10, 25, 30])
+        self.assertEqual(fleet[-1].get_temperature_celsius(), 30)
+        self.assertEqual(list(fleet.temperatures()), [25, 10, 25, 30])
+
+    def test_fahrenheit_views(self):
+        """Test that Fahrenheit views behave like adapted sensors."""
+        fleet = SensorFleet(2, 'fahrenheit')
+        far_sensor = FahrenheitTemperatureSensor()
+        adapter = TemperatureSensorAdapter(far_sensor)
+        for celsius in (0, 37.5, 100, -40):
+            fleet[0].set_temperature(celsius)
+            adapter.set_temperature(celsius)
+            self.assertEqual(fleet[0].get_temperature_fahrenheit(),
+                             far_sensor.get_temperature_fahrenheit())
+            self.assertEqual(fleet[0].get_temperature_celsius(),
+                             adapter.get_temperature_celsius())
+        self.assertEqual(fleet[1].get_temperature_celsius(), 25)
+
+    def test_temperatures_celsius(self):
+        """Test the batch conversion of a whole fleet."""
+        for unit in ('celsius', 'fahrenheit'):
+            out = array('d', [0.0, 0.0])
+            SensorFleet(2, unit).temperatures_celsius(out)
+            self.assertEqual(list(out), [25.0, 25.0])
+
+    def test_invalid_index_and_unit(self):
+        """Test invalid indexes and units."""
+        with self.assertRaises(IndexError):
+            SensorFleet(2)[2]
+        with self.assertRaises(ValueError):
+            SensorFleet(2, 'kelvin')
+
+    def test_memory_comparison(self):
+        """Test that the fleet uses less memory than sensor objects."""
+        sizes = memory_comparison(1000)
+        self.assertLess(sizes['SensorFleet'], sizes['objects with __slots__'])
+        self.assertLess(sizes['objects with __slots__'],
+                        sizes['objects with __dict__'])
+
+if __name__ == '__main__':
+    unittest.main()
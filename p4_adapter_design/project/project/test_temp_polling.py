@@ -0,0 +1,149 @@
+"""
+Temperature Sensor Polling Unit Tests
+
+This module contains unit tests for the temp_polling script, which polls
+fleets of temperature sensors and adapters concurrently with asyncio.
+
+Classes
+-------
+SlowSensor:
+    A Celsius sensor whose reads block for a given time.
+
+TestSensorPoller(unittest.IsolatedAsyncioTestCase):
+    A test case class for testing the SensorPoller class.
+
+Global functions
+----------------
+None
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from temp_adapter_script import (CelsiusTemperatureSensor,
+                                 FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+from temp_polling import SensorPoller
+
+class SlowSensor(CelsiusTemperatureSensor):
+    """A Celsius sensor whose reads block for a given time."""
+
+    def __init__(self, delay, fail=False):
+        """Initialize the sensor with its read delay."""
+        super().__init__()
+        self.delay = delay
+        self.fail = fail
+        self.active = 0
+        self.peak = 0
+        self.reads = 0
+        self._lock = threading.Lock()
+
+    def get_temperature_celsius(self):
+        """Block for the delay, then return the reading."""
+        with self._lock:
+            self.active += 1
+            self.reads += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if self.fail:
+            raise RuntimeError("Sensor offline")
+        return super().get_temperature_celsius()
+
+class TestSensorPoller(unittest.IsolatedAsyncioTestCase):
+    """
+    TestSensorPoller Class
+
+    A test case class for testing the SensorPoller class.
+
+    Methods
+    -------
+    collect(self, poller, count):
+        Collect a number of results from a poller, then stop it.
+    test_polls_adapters(self):
+        Test that adapters are polled and converted to Celsius.
+    test_slow_sensor_does_not_block(self):
+        Test that a slow sensor does not hold back the others.
+    test_max_in_flight(self):
+        Test that the number of reads in flight is bounded.
+    test_errors_and_timeouts_are_reported(self):
+        Test that failing and slow reads are yielded with their error.
+    test_hung_sensor_does_not_starve(self):
+        Test that a hung sensor holds one thread and never starves the others.
+    test_queue_is_bounded(self):
+        Test that polling pauses while the consumer is slow.
+    """
+    async def collect(self, poller, count):
+        """Collect a number of results from a poller, then stop it."""
+        results = []
+        async for result in poller:
+            results.append(result)
+            if len(results) == count:
+                poller.stop()
+        return results
+
+    async def test_polls_adapters(self):
+        """Test that adapters are polled and converted to Celsius."""
+        poller = SensorPoller(interval=0.01)
+        poller.add_sensor(TemperatureSensorAdapter(FahrenheitTemperatureSensor()))
+        results = await self.collect(poller, 2)
+        self.assertEqual([result.temperature for result in results], [25, 25])
+        self.assertIsNone(results[0].error)
+
+    async def test_slow_sensor_does_not_block(self):
+        """Test that a slow sensor does not hold back the others."""
+        fast = CelsiusTemperatureSensor()
+        poller = SensorPoller(interval=0.01)
+        poller.add_sensor(SlowSensor(delay=0.5))
+        poller.add_sensor(fast)
+        results = await self.collect(poller, 5)
+        self.assertTrue(all(result.sensor is fast for result in results))
+
+    async def test_max_in_flight(self):
+        """Test that the number of reads in flight is bounded."""
+        sensor = SlowSensor(delay=0.02)
+        poller = SensorPoller(interval=0.0, max_in_flight=2)
+        for _ in range(6):
+            poller.add_sensor(sensor)
+        await self.collect(poller, 12)
+        self.assertLessEqual(sensor.peak, 2)
+
+    async def test_errors_and_timeouts_are_reported(self):
+        """Test that failing and slow reads are yielded with their error."""
+        poller = SensorPoller(interval=0.01, timeout=0.05)
+        poller.add_sensor(SlowSensor(delay=0.0, fail=True), interval=0.1)
+        poller.add_sensor(SlowSensor(delay=0.2))
+        results = await self.collect(poller, 2)
+        errors = {type(result.error) for result in results}
+        self.assertIn(RuntimeError, errors)
+        self.assertIn(TimeoutError, errors)
+        self.assertTrue(all(result.temperature is None for result in results))
+
+    async def test_hung_sensor_does_not_starve(self):
+        """Test that a hung sensor holds one thread and never starves others."""
+        hung = SlowSensor(delay=1.0)
+        fast = SlowSensor(delay=0.0)
+        poller = SensorPoller(interval=0.01, max_in_flight=4, timeout=0.02)
+        poller.add_sensor(hung)
+        poller.add_sensor(fast)
+        results = await self.collect(poller, 30)
+        fast_results = [result for result in results if result.sensor is fast]
+        self.assertGreater(len(fast_results), 20)
+        self.assertTrue(all(result.error is None for result in fast_results))
+        self.assertEqual(hung.peak, 1)
+
+    async def test_queue_is_bounded(self):
+        """Test that polling pauses while the consumer is slow."""
+        sensor = SlowSensor(delay=0.0)
+        poller = SensorPoller(interval=0.0, max_queued=2)
+        poller.add_sensor(sensor)
+        async for _ in poller:
+            await asyncio.sleep(0.05)
+            break
+        # One read is queued, one waits to be, and none after
+        self.assertLessEqual(sensor.reads, 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Temperature Rollup Unit Tests
+
+This module contains unit tests for the temp_rollup script, which
+downsamples sensor readings into multi-resolution rollups.
+
+Classes
+-------
+TestDownsampler(unittest.TestCase):
+    A test case class for testing the Downsampler class.
+
+Global functions
+----------------
+None
+"""
+
+import unittest
+from temp_adapter_script import CelsiusTemperatureSensor
+from temp_rollup import Downsampler
+
+class TestDownsampler(unittest.TestCase):
+    """
+    TestDownsampler Class
+
+    A test case class for testing the Downsampler class.
+
+    Methods
+    -------
+    setUp(self):
+        Record two hours of readings, one per 30 seconds.
+    test_buckets(self):
+        Test the rollups kept for each resolution.
+    test_query(self):
+        Test aggregating a range from the rollups.
+    test_retention(self):
+        Test that only the configured number of buckets is kept.
+    test_late_and_sensor_readings(self):
+        Test late readings and readings taken from a sensor.
+    test_invalid_configuration(self):
+        Test that mismatched resolutions and retention are rejected.
+    """
+    def setUp(self) -> None:
+        """Record two hours of readings, one per 30 seconds."""
+        self.downsampler = Downsampler((60, 3600), (240, 24))
+        for index in range(240):
+            self.downsampler.record(float(index), timestamp=index * 30.0)
+
+    def test_buckets(self):
+        """Test the rollups kept for each resolution."""
+        minutes = self.downsampler.buckets(60)
+        self.assertEqual(len(minutes), 120)
+        self.assertEqual((minutes[1].start, minutes[1].minimum,
+                          minutes[1].maximum, minutes[1].count),
+                         (60, 2.0, 3.0, 2))
+        hours = self.downsampler.buckets(3600)
+        self.assertEqual([hour.count for hour in hours], [120, 120])
+        self.assertEqual(hours[1].mean, sum(range(120, 240)) / 120)
+
+    def test_query(self):
+        """Test aggregating a range from the rollups."""
+        whole = self.downsampler.query(0, 7200)
+        self.assertEqual((whole.minimum, whole.maximum, whole.count),
+                         (0.0, 239.0, 240))
+        part = self.downsampler.query(120, 300)  # Minutes 2, 3 and 4
+        self.assertEqual((part.start, part.minimum, part.maximum, part.count),
+                         (120, 4.0, 9.0, 6))
+        self.assertIsNone(self.downsampler.query(9000, 9600))
+
+    def test_retention(self):
+        """Test that only the configured number of buckets is kept."""
+        downsampler = Downsampler((60,), (3,))
+        for minute in range(10):
+            downsampler.record(1.0, timestamp=minute * 60.0)
+        self.assertEqual([bucket.start for bucket in downsampler.buckets(60)],
+                         [420, 480, 540])
+
+    def test_late_and_sensor_readings(self):
+        """Test late readings and readings taken from a sensor."""
+        self.downsampler.record(1000.0, timestamp=3600.0)
+        self.assertEqual(self.downsampler.late, 1)  # Late for minutes only
+        self.assertEqual(self.downsampler.buckets(3600)[1].maximum, 1000.0)
+        sensor = CelsiusTemperatureSensor()
+        self.downsampler.record_sensor(sensor, timestamp=7200.0)
+        self.assertEqual(self.downsampler.buckets(60)[-1].total, 25)
+
+    def test_invalid_configuration(self):
+        """Test that mismatched resolutions and retention are rejected."""
+        with self.assertRaises(ValueError):
+            Downsampler((60, 3600), (10,))
+        with self.assertRaises(ValueError):
+            Downsampler((0,), (10,))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Temperature Log Streaming Unit Tests
+
+This module contains unit tests for the temp_stream script, which converts
+Fahrenheit sensor logs to Celsius as a chunked stream.
+
+Classes
+-------
+TestConvertStream(unittest.TestCase):
+    A test case class for testing convert_stream.
+
+TestLogFiles(unittest.TestCase):
+    A test case class for testing the CSV and binary file conversions.
+
+Global functions
+----------------
+None
+"""
+
+import os
+import tempfile
+import unittest
+from array import array
+from temp_stream import (convert_stream, convert_chunks, convert_csv_file,
+                         convert_binary_file, read_binary_chunks)
+
+class TestConvertStream(unittest.TestCase):
+    """
+    TestConvertStream Class
+
+    A test case class for testing convert_stream.
+
+    Methods
+    -------
+    test_chunks(self):
+        Test that readings are converted and written in chunks.
+    test_empty_stream(self):
+        Test converting an empty stream.
+    test_convert_chunks(self):
+        Test converting read-only buffers of different sizes.
+    """
+    def test_chunks(self):
+        """Test that readings are converted and written in chunks."""
+        chunks = []
+        stats = convert_stream(iter([32, 212, 77, -40, 100]),
+                               lambda chunk: chunks.append(list(chunk)),
+                               chunk_size=2)
+        self.assertEqual(chunks, [[0.0, 100.0], [25.0, -40.0], [37.78]])
+        self.assertEqual(stats.rows, 5)
+        self.assertGreater(stats.rows_per_second, 0)
+
+    def test_empty_stream(self):
+        """Test converting an empty stream."""
+        chunks = []
+        stats = convert_stream([], chunks.append)
+        self.assertEqual((stats.rows, chunks), (0, []))
+
+    def test_convert_chunks(self):
+        """Test converting read-only buffers of different sizes."""
+        chunks = []
+        readings = [memoryview(array('d', [32, 212, 77])).toreadonly(),
+                    array('d', [-40])]
+        stats = convert_chunks(readings,
+                               lambda chunk: chunks.append(list(chunk)))
+        self.assertEqual(chunks, [[0.0, 100.0, 25.0], [-40.0]])
+        self.assertEqual(stats.rows, 4)
+
+class TestLogFiles(unittest.TestCase):
+    """
+    TestLogFiles Class
+
+    A test case class for testing the CSV and binary file conversions.
+
+    Methods
+    -------
+    setUp(self):
+        Create a temporary directory for the log files.
+    tearDown(self):
+        Remove the temporary directory.
+    test_csv_file(self):
+        Test converting a CSV log with a header.
+    test_binary_file(self):
+        Test converting a binary log of doubles.
+    test_binary_chunks(self):
+        Test that binary logs are read as views of the mapping.
+    test_truncated_binary_file(self):
+        Test that a binary log with a partial reading is rejected.
+    """
+    def setUp(self) -> None:
+        """Create a temporary directory for the log files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = lambda name: os.path.join(self.directory.name, name)
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_csv_file(self):
+        """Test converting a CSV log with a header."""
+        with open(self.path('in.csv'), 'w') as csv_file:
+            csv_file.write('sensor,fahrenheit\na,32\nb,212\n\nc,100\n')
+        stats = convert_csv_file(self.path('in.csv'), self.path('out.csv'),
+                                 column=1, skip_header=True, chunk_size=2)
+        with open(self.path('out.csv')) as csv_file:
+            self.assertEqual(csv_file.read(), '0.00\n100.00\n37.78\n')
+        self.assertEqual(stats.rows, 3)
+
+    def test_binary_file(self):
+        """Test converting a binary log of doubles."""
+        with open(self.path('in.bin'), 'wb') as binary_file:
+            array('d', [32, 212, 77]).tofile(binary_file)
+        stats = convert_binary_file(self.path('in.bin'), self.path('out.bin'),
+                                    chunk_size=2)
+        with open(self.path('out.bin'), 'rb') as binary_file:
+            self.assertEqual(list(array('d', binary_file.read())),
+                             [0.0, 100.0, 25.0])
+        self.assertEqual(stats.rows, 3)
+
+    def test_binary_chunks(self):
+        """Test that binary logs are read as views of the mapping."""
+        with open(self.path('in.bin'), 'wb') as binary_file:
+            array('d', [32, 212, 77]).tofile(binary_file)
+        chunks = read_binary_chunks(self.path('in.bin'), chunk_size=2)
+        first = next(chunks)
+        self.assertIsInstance(first, memoryview)
+        self.assertEqual((first.format, first.readonly), ('d', True))
+        self.assertEqual(first.tolist(), [32.0, 212.0])
+        self.assertEqual([chunk.tolist() for chunk in chunks], [[77.0]])
+
+    def test_truncated_binary_file(self):
+        """Test that a binary log with a partial reading is rejected."""
+        with open(self.path('in.bin'), 'wb') as binary_file:
+            binary_file.write(b'\0' * 12)
+        with self.assertRaises(ValueError):
+            list(read_binary_chunks(self.path('in.bin')))
+
+if __name__ == '__main__':
+    unittest.main()
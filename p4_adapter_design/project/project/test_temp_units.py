@@ -0,0 +1,132 @@
+"""
+Temperature Unit Registry Unit Tests
+
+This module contains unit tests for the temp_units script, which composes
+and caches conversions between temperature units.
+
+Classes
+-------
+TestConversionRegistry(unittest.TestCase):
+    A test case class for testing the ConversionRegistry class.
+
+TestUnitSensorAdapter(unittest.TestCase):
+    A test case class for testing the UnitSensorAdapter class.
+
+Global functions
+----------------
+None
+"""
+
+import unittest
+from temp_adapter_script import (FahrenheitTemperatureSensor,
+                                 TemperatureSensorAdapter)
+from temp_units import (ConversionRegistry, LinearConversion, UnitSensorAdapter,
+                        DEFAULT_REGISTRY)
+
+class TestConversionRegistry(unittest.TestCase):
+    """
+    TestConversionRegistry Class
+
+    A test case class for testing the ConversionRegistry class.
+
+    Methods
+    -------
+    test_direct_and_inverse(self):
+        Test a registered conversion and its inverse.
+    test_composed_conversion(self):
+        Test that chained conversions are fused into one transform.
+    test_cached(self):
+        Test that the fused conversion is cached per unit pair.
+    test_unknown_units(self):
+        Test looking up unknown or unconnected units.
+    """
+    def test_direct_and_inverse(self):
+        """Test a registered conversion and its inverse."""
+        self.assertAlmostEqual(DEFAULT_REGISTRY.get('fahrenheit', 'celsius')(212), 100)
+        self.assertAlmostEqual(DEFAULT_REGISTRY.get('celsius', 'fahrenheit')(100), 212)
+        self.assertEqual(DEFAULT_REGISTRY.get('kelvin', 'kelvin'), (0.0, 1.0))
+
+    def test_composed_conversion(self):
+        """Test that chained conversions are fused into one transform."""
+        kelvin_to_rankine = DEFAULT_REGISTRY.get('kelvin', 'rankine')
+        self.assertIsInstance(kelvin_to_rankine, LinearConversion)
+        self.assertAlmostEqual(kelvin_to_rankine.scale, 1.8)
+        self.assertAlmostEqual(kelvin_to_rankine(0), 0)
+        self.assertAlmostEqual(kelvin_to_rankine(273.15), 491.67)
+
+    def test_cached(self):
+        """Test that the fused conversion is cached per unit pair."""
+        registry = ConversionRegistry()
+        registry.register('a', 'b', 1, 2)
+        registry.register('b', 'c', 3, 4)
+        self.assertIs(registry.get('a', 'c'), registry.get('a', 'c'))
+        self.assertEqual(registry.get('a', 'c')(5), 1.5)
+        registry.register('a', 'c', 10)  # Invalidates the cache
+        self.assertEqual(registry.get('a', 'c')(5), 15)
+
+    def test_unknown_units(self):
+        """Test looking up unknown or unconnected units."""
+        registry = ConversionRegistry()
+        registry.register('a', 'b', divisor=2)
+        registry.register('x', 'y', divisor=2)
+        with self.assertRaises(KeyError):
+            registry.get('a', 'z')
+        with self.assertRaises(KeyError):
+            registry.get('a', 'y')
+        with self.assertRaises(ValueError):
+            registry.register('a', 'c', divisor=0)
+
+class TestUnitSensorAdapter(unittest.TestCase):
+    """
+    TestUnitSensorAdapter Class
+
+    A test case class for testing the UnitSensorAdapter class.
+
+    Methods
+    -------
+    test_matches_temperature_sensor_adapter(self):
+        Test that it agrees with the hand-written Fahrenheit adapter.
+    test_set_temperature(self):
+        Test the Celsius to Fahrenheit conversion of the adapter.
+    test_set_matches_temperature_sensor_adapter(self):
+        Test that it writes what the hand-written adapter writes.
+    test_missing_read_method(self):
+        Test adapting a sensor without a reader for the unit.
+    """
+    def test_matches_temperature_sensor_adapter(self):
+        """Test that it agrees with the hand-written Fahrenheit adapter."""
+        far_sensor = FahrenheitTemperatureSensor()
+        generic = UnitSensorAdapter(far_sensor, 'fahrenheit')
+        specific = TemperatureSensorAdapter(far_sensor)
+        for fahrenheit in range(-100000, 100001, 7):
+            far_sensor.set_temperature(fahrenheit / 1000)
+            self.assertEqual(generic.get_temperature_celsius(),
+                             specific.get_temperature_celsius())
+        far_sensor.set_temperature(99.995)
+        self.assertEqual(generic.get_temperature_celsius(), 37.77)
+
+    def test_set_temperature(self):
+        """Test the Celsius to Fahrenheit conversion of the adapter."""
+        far_sensor = FahrenheitTemperatureSensor()
+        UnitSensorAdapter(far_sensor, 'fahrenheit').set_temperature(100)
+        self.assertEqual(far_sensor.get_temperature_fahrenheit(), 212)
+
+    def test_set_matches_temperature_sensor_adapter(self):
+        """Test that it writes what the hand-written adapter writes."""
+        generic_sensor = FahrenheitTemperatureSensor()
+        specific_sensor = FahrenheitTemperatureSensor()
+        generic = UnitSensorAdapter(generic_sensor, 'fahrenheit')
+        specific = TemperatureSensorAdapter(specific_sensor)
+        for celsius in range(-100000, 100001, 7):
+            generic.set_temperature(celsius / 1000)
+            specific.set_temperature(celsius / 1000)
+            self.assertEqual(generic_sensor.get_temperature_fahrenheit(),
+                             specific_sensor.get_temperature_fahrenheit())
+
+    def test_missing_read_method(self):
+        """Test adapting a sensor without a reader for the unit."""
+        with self.assertRaises(AttributeError):
+            UnitSensorAdapter(FahrenheitTemperatureSensor(), 'kelvin')
+
+if __name__ == '__main__':
+    unittest.main()